@@ -23,6 +23,9 @@ setup(
     # install_requires=[
     #     "pytest",
     # ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
     python_requires=">=3.4.*",
     classifiers=[
         "Development Status :: 4 - Beta",
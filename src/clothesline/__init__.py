@@ -6,6 +6,9 @@ from clothesline.real_interval_set import RealIntervalSet  # noqa: F401
 from clothesline.enriched.datetime_interval_set import (  # noqa: F401, E501
     DatetimeIntervalSet,
 )
+from clothesline.enriched.epoch_datetime_interval_set import (  # noqa: F401
+    EpochDatetimeIntervalSet,
+)
 
 
 def main():
@@ -4,4 +4,8 @@ Interval algebra primitives are imported from this module.
 
 from clothesline.algebra.interval_operations import (  # noqa: F401, E501
     combine_intervals,
+    combine_normalized_pair,
+    combine_normalized_at_least,
+    combine_sorted_streams,
+    coverage_depths,
 )
@@ -2,14 +2,256 @@
 interval algebra primitives.
 """
 
-from functools import cmp_to_key
+import heapq
+from operator import itemgetter
 
-from clothesline.algebra.symbols import x_cmp
+from clothesline.algebra.symbols import x_key
 from clothesline.interval_peg import IntervalPeg
-from clothesline.exceptions import InvalidCombineEndState
+from clothesline.exceptions import (
+    InvalidCombineEndState,
+    UnsortedIntervalsError,
+)
+from clothesline.instrumentation import start_probe
 
 
-def combine_intervals(  # noqa: PLR0914, PLR0912
+def _interval_events(interval_list, i_list_index):
+    """
+    Turn the intervals of an operand into 'events' for the sweep, i.e.
+    tuples (key, value, operand_index, depth_delta, point_included),
+    where the key (see `x_key`) is what events are sorted and grouped by:
+    a non-degenerate interval yields a +1 event at its begin and a -1 event
+    at its end, while a point-like [x, x] interval yields a single
+    zero-delta event (it covers no range, only its point).
+    """
+    for interval in interval_list:
+        begin_peg = interval.begin
+        end_peg = interval.end
+        begin_key = x_key(begin_peg.value)
+        end_key = x_key(end_peg.value)
+        if begin_key == end_key:
+            yield (begin_key, begin_peg.value, i_list_index, 0, True)
+        else:
+            yield (
+                begin_key,
+                begin_peg.value,
+                i_list_index,
+                +1,
+                begin_peg.included,
+            )
+            yield (end_key, end_peg.value, i_list_index, -1, end_peg.included)
+
+
+_event_key = itemgetter(0)
+
+
+def _sorted_stream_events(interval_ite, i_list_index):
+    """
+    Like `_interval_events`, but for intervals that are only sorted by
+    their begin (they may overlap): the end events are held in a heap
+    until no later begin can precede them, so that the events come out
+    sorted while keeping in memory only the intervals currently open.
+    """
+    pending_ends = []  # heap of (end_key, sequence, end_event)
+    last_begin_key = None
+    for sequence, interval in enumerate(interval_ite):
+        begin_key = x_key(interval.begin.value)
+        if last_begin_key is not None and begin_key < last_begin_key:
+            message = "Intervals in stream #%i are not sorted" % i_list_index
+            raise UnsortedIntervalsError(message)
+        last_begin_key = begin_key
+        while pending_ends and pending_ends[0][0] <= begin_key:
+            yield heapq.heappop(pending_ends)[2]
+        for event in _interval_events([interval], i_list_index):
+            if event[3] < 0:
+                heapq.heappush(pending_ends, (event[0], sequence, event))
+            else:
+                yield event
+    while pending_ends:
+        yield heapq.heappop(pending_ends)[2]
+
+
+def _merge_sorted_events(events_a, events_b):
+    """
+    Two-pointer merge of two streams of events, each already sorted by value,
+    into a single sorted stream (ties favour the first stream).
+    """
+    ite_a = iter(events_a)
+    ite_b = iter(events_b)
+    event_a = next(ite_a, None)
+    event_b = next(ite_b, None)
+    while event_a is not None and event_b is not None:
+        if event_a[0] > event_b[0]:
+            yield event_b
+            event_b = next(ite_b, None)
+        else:
+            yield event_a
+            event_a = next(ite_a, None)
+    if event_a is not None:
+        yield event_a
+        yield from ite_a
+    if event_b is not None:
+        yield event_b
+        yield from ite_b
+
+
+def _group_events(sorted_events):
+    """
+    Group a sorted stream of events into (marker, [events at marker]) pairs,
+    one per distinct marker value.
+    """
+    key = None
+    group = []
+    for event in sorted_events:
+        if group and key == event[0]:
+            group.append(event)
+        else:
+            if group:
+                yield group[0][1], group
+            key = event[0]
+            group = [event]
+    if group:
+        yield group[0][1], group
+
+
+def _project_markers(grouped_events, n_i_lists, combiner_function):
+    """
+    Sweep over the grouped events keeping, for each operand, a counter of
+    the intervals whose range is currently open ('depth').
+    At each marker this yields (marker, point_merged, range_merged), i.e.
+    whether the marker itself and the open range up to the next marker
+    belong to the result according to combiner_function.
+
+    Each marker is yielded once the next one is seen, as past the last
+    marker nothing can be in the result (whatever combiner_function
+    gives for no operand at all).
+    """
+    depth = [0] * n_i_lists
+    pending = None
+    for marker, group in grouped_events:
+        if pending is not None:
+            yield pending
+        opening = []
+        included_indices = []
+        for _, _, i_list_index, delta, included in group:
+            if delta < 0:
+                depth[i_list_index] -= 1
+            elif delta > 0:
+                opening.append(i_list_index)
+            if included:
+                included_indices.append(i_list_index)
+        point_flags = [operand_depth > 0 for operand_depth in depth]
+        for i_list_index in included_indices:
+            point_flags[i_list_index] = True
+        point_merged = combiner_function(point_flags)
+        for i_list_index in opening:
+            depth[i_list_index] += 1
+        range_flags = [operand_depth > 0 for operand_depth in depth]
+        range_merged = combiner_function(range_flags)
+        pending = (marker, point_merged, range_merged)
+    if pending is not None:
+        yield pending[0], pending[1], False
+
+
+def _count_markers(grouped_events):
+    """
+    Counting sweep over the grouped events of normalized operands:
+    since each operand has a depth of either zero or one, the number of
+    operands covering a marker or the range after it is just a total depth.
+    This yields (marker, point_count, range_count), the number of operands
+    containing the marker itself and the open range up to the next marker.
+    """
+    depth = 0
+    for marker, group in grouped_events:
+        opening = 0
+        included = 0
+        for _, _, _, delta, point_included in group:
+            if delta < 0:
+                depth -= 1
+            elif delta > 0:
+                opening += 1
+            if point_included:
+                included += 1
+        point_count = depth + included
+        depth += opening
+        yield marker, point_count, depth
+
+
+def _merge_markers(int_maker, projected_markers):
+    """
+    Reassemble the flags of the projected markers into intervals,
+    built with int_maker.
+    """
+    i_buffer = []  # a mutable state
+    for marker, point_included, next_is_range in projected_markers:
+        if not i_buffer:
+            if next_is_range:
+                i_buffer = [(marker, point_included), None]
+            else:
+                if point_included:
+                    # this point, isolated, is a zero-length interval:
+                    yield int_maker(
+                        IntervalPeg(marker, True),
+                        IntervalPeg(marker, True),
+                    )
+                else:
+                    # no-op
+                    pass
+        else:
+            # i_buffer exists already
+            if next_is_range:
+                if point_included:
+                    # write/extend current buffer's endpoint
+                    i_buffer[1] = (marker, point_included)
+                else:
+                    # a hole: finalize/flush buffer and re-init it at once
+                    i_buffer[1] = (marker, point_included)
+                    yield int_maker(
+                        IntervalPeg(i_buffer[0][0], i_buffer[0][1]),
+                        IntervalPeg(i_buffer[1][0], i_buffer[1][1]),
+                    )
+                    i_buffer = [(marker, point_included), None]
+            else:
+                # end of the interval being built: flush and reset buffer
+                i_buffer[1] = (marker, point_included)
+                yield int_maker(
+                    IntervalPeg(i_buffer[0][0], i_buffer[0][1]),
+                    IntervalPeg(i_buffer[1][0], i_buffer[1][1]),
+                )
+                i_buffer = []
+    #
+    if i_buffer:
+        raise InvalidCombineEndState("Inconsistent end state in merge phase")
+
+
+def _sweep_events(int_maker, sorted_events, projector, probe, n_inputs=0):
+    """
+    Run the grouping, projection and merge of a sorted stream of events,
+    returning the list of resulting intervals.
+
+    `projector` turns grouped events into projected markers. Without a probe
+    (see `clothesline.instrumentation`) the stages are chained lazily;
+    with one, the output of each stage is materialized so that the phases
+    can be timed separately, and the figures for the call (with `n_inputs`
+    input intervals) are reported at the end.
+    """
+    if probe is None:
+        grouped_events = _group_events(sorted_events)
+        return list(_merge_markers(int_maker, projector(grouped_events)))
+    events = list(sorted_events)
+    probe.phase("split")
+    projected_markers = list(projector(_group_events(events)))
+    probe.phase("project")
+    result = list(_merge_markers(int_maker, projected_markers))
+    probe.phase("merge")
+    probe.done(
+        input_intervals=n_inputs,
+        output_intervals=len(result),
+        markers=len(projected_markers),
+    )
+    return result
+
+
+def combine_intervals(
     int_maker,
     interval_iterables,
     combiner_function=lambda q: q[0],
@@ -48,114 +290,206 @@ def combine_intervals(  # noqa: PLR0914, PLR0912
     - (q0, q1) => q0 xor q1           # for '^'
 
     N > 2 will presumably never be used.
+
+    The computation is an event-based sweep: the begin/end pegs of all
+    intervals are sorted once and scanned keeping a per-operand depth counter,
+    so that the whole operation costs O(n log n) in the number of intervals
+    regardless of how much they overlap.
     """
 
+    probe = start_probe("combine_intervals")
     interval_lists = [
         list(interval_ite) for interval_ite in interval_iterables
     ]  # noqa: E501
     n_i_lists = len(interval_lists)
 
     # 1. 'split' phase
-    markers = sorted(
-        set(
-            peg.value
-            for i_list in interval_lists
-            for interval in i_list
-            for peg in interval.pegs()
+    events = sorted(
+        (
+            event
+            for i_list_index, i_list in enumerate(interval_lists)
+            for event in _interval_events(i_list, i_list_index)
         ),
-        key=cmp_to_key(x_cmp),
+        key=_event_key,
     )
-    m_index_map = {val: index for index, val in enumerate(markers)}
-
-    point_included = {marker: {} for marker in markers}
-    range_included = {marker: {} for marker in markers}
-    # looping labeling to be tweaked for multi-source case
-    for i_list_index, i_list in enumerate(interval_lists):
-        for interval in i_list:
-            # ends pointlike status
-            for peg in interval.pegs():
-                if peg.included:
-                    point_included[peg.value][i_list_index] = True
-            # internal pointlike values, if any
-            begin_peg = interval.begin
-            end_peg = interval.end
-            begin_m_index = m_index_map[begin_peg.value]
-            end_m_index = m_index_map[end_peg.value]
-            for internal_m_index in range(begin_m_index + 1, end_m_index):
-                internal_marker = markers[internal_m_index]
-                point_included[internal_marker][i_list_index] = True
-            # ranges (first + internal if any)
-            for m_index in range(begin_m_index, end_m_index):
-                marker = markers[m_index]
-                range_included[marker][i_list_index] = True
-
-    # 2. 'project' phase, using combiner_function
-    point_merged = {marker: False for marker in markers}
-    range_merged = {marker: False for marker in markers}
-    for marker in markers:
-        point_merged[marker] = combiner_function(
-            [
-                point_included[marker].get(i_list_index, False)
-                for i_list_index in range(n_i_lists)
-            ]
+
+    # 2. 'project' phase, using combiner_function, and 3. 'merge' phase
+    return _sweep_events(
+        int_maker,
+        events,
+        lambda grouped: _project_markers(
+            grouped,
+            n_i_lists,
+            combiner_function,
+        ),
+        probe,
+        n_inputs=sum(len(i_list) for i_list in interval_lists),
+    )
+
+
+def combine_sorted_streams(
+    int_maker,
+    interval_iterables,
+    combiner_function=lambda q: q[0],
+):
+    """
+    A lazy form of `combine_intervals` for operands whose intervals
+    come sorted by their begin (overlaps and adjacencies are allowed),
+    such as intervals read sequentially from a file or a database cursor.
+
+    The operands are consumed incrementally and the resulting intervals,
+    in normal form, are yielded as soon as they are complete: memory usage
+    is bounded by the number of input intervals simultaneously open at
+    any point, not by the size of the inputs.
+
+    `combiner_function` has the same meaning as in `combine_intervals`.
+    An out-of-order input interval raises UnsortedIntervalsError
+    (possibly after part of the output has been yielded already).
+    """
+    probe = start_probe("combine_sorted_streams")
+    if probe is not None:
+        # counts only: the phases interleave with the consumer's work
+        counters = {"inputs": 0, "markers": 0, "outputs": 0}
+        interval_iterables = [
+            _counted(interval_ite, counters, "inputs")
+            for interval_ite in interval_iterables
+        ]
+    event_streams = [
+        _sorted_stream_events(interval_ite, i_list_index)
+        for i_list_index, interval_ite in enumerate(interval_iterables)
+    ]
+    projected_markers = _project_markers(
+        _group_events(heapq.merge(*event_streams, key=_event_key)),
+        len(event_streams),
+        combiner_function,
+    )
+    if probe is None:
+        yield from _merge_markers(int_maker, projected_markers)
+    else:
+        yield from _counted(
+            _merge_markers(
+                int_maker,
+                _counted(projected_markers, counters, "markers"),
+            ),
+            counters,
+            "outputs",
         )
-    for marker in markers[:-1]:
-        range_merged[marker] = combiner_function(
-            [
-                range_included[marker].get(i_list_index, False)
-                for i_list_index in range(n_i_lists)
-            ]
+        probe.done(
+            input_intervals=counters["inputs"],
+            output_intervals=counters["outputs"],
+            markers=counters["markers"],
         )
 
-    # # 3. 'merge' phase
-    final_intervals = []
-    i_buffer = []  # a mutable state
-    for m_index, marker in enumerate(markers):
-        next_is_range = range_merged[marker]
-        point_included = point_merged[marker]
-        if not i_buffer:
-            if next_is_range:
-                i_buffer = [(marker, point_included), None]
-            else:
-                if point_included:
-                    # this point, isolated, is a zero-length interval:
-                    final_intervals.append(
-                        int_maker(
-                            IntervalPeg(marker, True),
-                            IntervalPeg(marker, True),
-                        )
-                    )
-                else:
-                    # no-op
-                    pass
-        else:
-            # i_buffer exists already
-            if next_is_range:
-                if point_included:
-                    # write/extend current buffer's endpoint
-                    i_buffer[1] = (marker, point_included)
-                else:
-                    # a hole: finalize/flush buffer and re-init it at once
-                    i_buffer[1] = (marker, point_included)
-                    final_intervals.append(
-                        int_maker(
-                            IntervalPeg(i_buffer[0][0], i_buffer[0][1]),
-                            IntervalPeg(i_buffer[1][0], i_buffer[1][1]),
-                        )
-                    )
-                    i_buffer = [(marker, point_included), None]
-            else:
-                # end of the interval being built: flush and reset buffer
-                i_buffer[1] = (marker, point_included)
-                final_intervals.append(
-                    int_maker(
-                        IntervalPeg(i_buffer[0][0], i_buffer[0][1]),
-                        IntervalPeg(i_buffer[1][0], i_buffer[1][1]),
-                    )
-                )
-                i_buffer = []
-    #
-    if i_buffer:
-        raise InvalidCombineEndState("Inconsistent end state in merge phase")
 
-    return final_intervals
+def _counted(iterable, counters, name):
+    """Pass the items of an iterable through, counting them in counters."""
+    for item in iterable:
+        counters[name] += 1
+        yield item
+
+
+def combine_normalized_pair(
+    int_maker,
+    intervals_a,
+    intervals_b,
+    combiner_function=lambda q: q[0] or q[1],
+):
+    """
+    A specialized form of `combine_intervals` for two operands which are
+    both already in normal form (sorted, disjoint and non-adjacent intervals,
+    such as those making up an interval set, or a single interval).
+
+    As the begin/end pegs of a normalized operand come already sorted,
+    a single merge-walk of the two operands replaces the sort step of the
+    general combiner: the cost is O(n + m) and marker values need not be
+    hashable nor sorted.
+
+    `combiner_function` has the same meaning as in `combine_intervals` (with
+    N=2). The result is a list of intervals in normal form.
+    """
+    probe = start_probe("combine_normalized_pair")
+    n_inputs = 0
+    if probe is not None:
+        intervals_a = list(intervals_a)
+        intervals_b = list(intervals_b)
+        n_inputs = len(intervals_a) + len(intervals_b)
+    return _sweep_events(
+        int_maker,
+        _merge_sorted_events(
+            _interval_events(intervals_a, 0),
+            _interval_events(intervals_b, 1),
+        ),
+        lambda grouped: _project_markers(grouped, 2, combiner_function),
+        probe,
+        n_inputs=n_inputs,
+    )
+
+
+def combine_normalized_at_least(int_maker, interval_iterables, min_operands):
+    """
+    Combine any number N of operands, each already in normal form,
+    into the set of points belonging to at least `min_operands` of them
+    (a positive integer): with 1 this is the union of all operands,
+    with N their intersection.
+
+    The (sorted) events of all operands are combined with a heap-based
+    k-way merge and a single counting sweep, for a total cost of
+    O(n log N) over n intervals: no per-operand state is kept.
+
+    The result is a list of intervals in normal form.
+    """
+    probe = start_probe("combine_normalized_at_least")
+    n_inputs = 0
+    if probe is not None:
+        interval_iterables = [list(ite) for ite in interval_iterables]
+        n_inputs = sum(len(i_list) for i_list in interval_iterables)
+    return _sweep_events(
+        int_maker,
+        heapq.merge(
+            *(
+                _interval_events(interval_ite, i_list_index)
+                for i_list_index, interval_ite in enumerate(interval_iterables)
+            ),
+            key=_event_key,
+        ),
+        lambda grouped: (
+            (
+                marker,
+                point_count >= min_operands,
+                range_count >= min_operands,
+            )
+            for marker, point_count, range_count in _count_markers(grouped)
+        ),
+        probe,
+        n_inputs=n_inputs,
+    )
+
+
+def coverage_depths(interval_iterables):
+    """
+    Sweep any number N of operands, each already in normal form, counting
+    how many of them cover each point ('coverage depth').
+
+    The result is the list of the markers (the distinct boundaries of all
+    intervals), in order, as tuples (marker, point_depth, range_depth):
+    the number of operands containing the marker itself and the number of
+    those containing the open range up to the next marker. Before the first
+    marker and after the last one the depth is zero.
+
+    As for `combine_normalized_at_least`, the cost is O(n log N)
+    over n intervals, whatever N and however much the operands overlap.
+    """
+    probe = start_probe("coverage_depths")
+    if probe is not None:
+        interval_iterables = [list(ite) for ite in interval_iterables]
+    operand_events = [
+        _interval_events(interval_ite, i_list_index)
+        for i_list_index, interval_ite in enumerate(interval_iterables)
+    ]
+    sorted_events = heapq.merge(*operand_events, key=_event_key)
+    depths = list(_count_markers(_group_events(sorted_events)))
+    if probe is not None:
+        probe.phase("sweep")
+        n_inputs = sum(len(i_list) for i_list in interval_iterables)
+        probe.done(input_intervals=n_inputs, markers=len(depths))
+    return depths
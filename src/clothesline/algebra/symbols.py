@@ -120,6 +120,22 @@ def x_cmp(val1, val2):
         return -1 if x_lt(val1, val2) else +1
 
 
+def x_key(value):
+    """
+    A sort key for values-and-symbols: keys compare natively
+    in the same order as the values (-inf < any value < +inf), so that
+    `sorted(values, key=x_key)` matches, much faster,
+    `sorted(values, key=cmp_to_key(x_cmp))`.
+    Keys of equal values are equal.
+    """
+    if value is MinusInf:  # noqa: PLR1705
+        return (0,)
+    elif value is PlusInf:
+        return (2,)
+    else:
+        return (1, value)
+
+
 def x_ge(val1, val2):
     """
     Greater-or-equal, extended
@@ -2,6 +2,8 @@
 Metric specification for an interval/set.
 """
 
+from clothesline.exceptions import MetricNotImplementedError
+
 
 class BaseDomainMetric:
     """
@@ -24,5 +26,29 @@ class BaseDomainMetric:
         to get its 'extension'.
         """
 
+    @staticmethod
+    def extension_subtracter(ext1, ext2):  # noqa: PLW0613
+        """
+        How to subtract two 'extensions' to get another 'extension'
+        (optional: used by the windowed extension queries on sets).
+        """
+        raise MetricNotImplementedError
+
+    @staticmethod
+    def shifter(val, ext):  # noqa: PLW0613
+        """
+        How to add an 'extension' to a peg value to get another peg value
+        (optional: used by the measure-to-point queries on sets).
+        """
+        raise MetricNotImplementedError
+
+    @staticmethod
+    def scaler(ext, factor):  # noqa: PLW0613
+        """
+        How to multiply an 'extension' by a number in [0, 1] to get
+        another 'extension' (optional: used by the quantiles of sets).
+        """
+        raise MetricNotImplementedError
+
     """What is the 'zero extension' when computing the extension of a set."""  # noqa: PLW0105, E501
     zero = ...
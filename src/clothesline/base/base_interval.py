@@ -11,6 +11,14 @@ from clothesline.algebra.symbols import (
     x_subtract,
 )
 
+from clothesline.generic.compact_dicts import (
+    COMPACT_VERSION,
+    flatten_pegs,
+    to_compact,
+    unflatten_pegs,
+    writing_version,
+)
+
 #
 from clothesline.exceptions import (
     InvalidValueError,
@@ -19,6 +27,12 @@ from clothesline.exceptions import (
 )
 
 
+def _unpickle_interval(interval_class, bounds, mask):
+    """Rebuild an interval from its pickled (flat) form, skipping checks."""
+    ((begin, end),) = unflatten_pegs(bounds, mask)
+    return interval_class.from_trusted_pegs(begin, end)
+
+
 class BaseInterval:
     """
     A single uninterrupted interval over the domain field:
@@ -28,8 +42,11 @@ class BaseInterval:
     Concrete classes must provide builder() and utils() in a standard way
     (see the real-interval case) and, if desired,
     define metric and serializability properties as well.
+    They should also declare `__slots__ = ()` to keep instances compact.
     """
 
+    __slots__ = ("begin", "end")
+
     # What follows should be considered by subclassers:
 
     metric = None
@@ -66,6 +83,18 @@ class BaseInterval:
         self.begin = begin
         self.end = end
 
+    @classmethod
+    def from_trusted_pegs(cls, begin, end):
+        """
+        Create an interval out of two pegs known to make up a valid
+        interval (such as those produced by the algebra engine out of
+        valid intervals), skipping all checks.
+        """
+        interval = cls.__new__(cls)
+        interval.begin = begin
+        interval.end = end
+        return interval
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):  # noqa: PLR1705
             return self.begin == other.begin and self.end == other.end
@@ -75,6 +104,14 @@ class BaseInterval:
     def __hash__(self):
         return hash((self.__class__, hash(self.begin), hash(self.end)))
 
+    def __reduce__(self):
+        """
+        Pickle as the flat tuple of the two boundary values plus the bitmask
+        of their inclusion (see `clothesline.generic.compact_dicts`).
+        """
+        bounds, mask = flatten_pegs([self])
+        return (_unpickle_interval, (self.__class__, tuple(bounds), mask))
+
     def __repr__(self):
         begin_name = x_repr(self.begin.value)
         begin_paren = "[" if self.begin.included else "("
@@ -82,21 +119,30 @@ class BaseInterval:
         end_paren = "]" if self.end.included else ")"
         return f"{begin_paren}{begin_name}, {end_name}{end_paren}"
 
-    def to_dict(self):
+    def to_dict(self, version=None):
         """
         Return a json-encodable representation of this interval.
+        By default the latest version (`serializing_version`) of the
+        representation is used, but an older one can be requested.
         """
-        if self.value_encoder:  # noqa: PLR1705
+        if not self.value_encoder:
+            raise UnserializableItemError
+        version = writing_version(version, self.serializing_version)
+        if version >= COMPACT_VERSION:  # noqa: PLR1705
             return {
                 "class": self.serializing_class,
-                "version": self.serializing_version,
+                "version": version,
+                **to_compact([self], self.value_encoder),
+            }
+        else:
+            return {
+                "class": self.serializing_class,
+                "version": version,
                 "pegs": [
                     self.begin.to_dict(v_encoder=self.value_encoder),
                     self.end.to_dict(v_encoder=self.value_encoder),
                 ],
             }
-        else:
-            raise UnserializableItemError
 
     def contains(self, value):  # noqa: PLR0911
         """
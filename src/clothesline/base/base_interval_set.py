@@ -2,13 +2,66 @@
 Any set over the domain, defined by a finite number of intervals.
 """
 
+from bisect import bisect_left, bisect_right
 from functools import reduce
+from itertools import repeat
+from operator import itemgetter
 
-from clothesline.algebra import combine_intervals
-from clothesline.algebra.symbols import x_sum
+from clothesline.algebra import (
+    combine_intervals,
+    combine_normalized_pair,
+    combine_normalized_at_least,
+    combine_sorted_streams,
+    coverage_depths,
+)
+from clothesline.algebra.symbols import (
+    MinusInf,
+    PlusInf,
+    is_symbol,
+    x_key,
+    x_subtract,
+    x_sum,
+)
+from clothesline.generic.compact_dicts import (
+    COMPACT_VERSION,
+    flatten_pegs,
+    to_compact,
+    unflatten_pegs,
+    writing_version,
+)
+from clothesline.generic.coverage_profile import CoverageProfile
+from clothesline.generic.interval_set_accumulator import (
+    IntervalSetAccumulator,
+)
+from clothesline.generic.interval_set_binary import to_binary
+from clothesline.generic.parallel_reduction import reduce_in_parallel
+from clothesline.instrumentation import start_probe
 
 #
-from clothesline.exceptions import MetricNotImplementedError
+from clothesline.base.base_domain_metric import BaseDomainMetric
+from clothesline.interval_peg import IntervalPeg
+from clothesline.exceptions import (
+    InvalidValueError,
+    MetricNotImplementedError,
+    UnserializableItemError,
+)
+
+# the optional metric hooks, with what a metric not providing them has
+_HOOK_STUBS = {
+    hook: (None, getattr(BaseDomainMetric, hook))
+    for hook in ("extension_subtracter", "shifter", "scaler")
+}
+
+
+def _unpickle_interval_set(interval_set_class, bounds, mask):
+    """
+    Rebuild an interval set from its pickled (flat) form, which comes from
+    a set in normal form: no normalization is needed.
+    """
+    int_maker = interval_set_class.interval_class.from_trusted_pegs
+    return interval_set_class.from_normalized(
+        [int_maker(begin, end) for begin, end in unflatten_pegs(bounds, mask)]
+    )
 
 
 class BaseIntervalSet:
@@ -23,8 +76,21 @@ class BaseIntervalSet:
     intervals this set is made of.
     Moreover, serializing signature data can be provided (if so desired and if
     serializability is supported by the underlying interval implementation).
+    Subclasses should also declare `__slots__ = ()` to keep instances compact.
+
+    As interval sets are immutable, some derived quantities (hash,
+    extension, bounds, the index for windowed queries) are computed lazily
+    and cached on the instance.
     """
 
+    __slots__ = (
+        "_intervals",
+        "_hash",
+        "_extension",
+        "_bounds",
+        "_measure_index",
+    )
+
     interval_class = None
 
     serializing_class = None
@@ -44,6 +110,147 @@ class BaseIntervalSet:
 
     def __init__(self, intervals):
         self._intervals = self._normalize(intervals)
+        self._init_caches()
+
+    @classmethod
+    def from_normalized(cls, intervals):
+        """
+        Create an interval set out of intervals already in 'normal form',
+        i.e. sorted, disjoint and non-adjacent, skipping normalization.
+
+        No check is made on the input: this is meant for trusted sources
+        such as the output of the algebra engine (e.g. `combine_intervals`).
+        """
+        interval_set = cls.__new__(cls)
+        interval_set._intervals = list(intervals)
+        interval_set._init_caches()
+        return interval_set
+
+    @classmethod
+    def from_sorted_stream(cls, intervals):
+        """
+        Create an interval set out of an iterable (e.g. a generator)
+        over intervals sorted by their begin, possibly overlapping.
+
+        The input is normalized on the fly, one interval at a time, so that
+        a long stream of overlapping intervals is never held in memory:
+        only the resulting (normalized) intervals are stored.
+        Raise UnsortedIntervalsError if the input is out of order.
+        """
+        int_maker = cls.interval_class.from_trusted_pegs
+        normalized = combine_sorted_streams(int_maker, [intervals])
+        return cls.from_normalized(normalized)
+
+    @classmethod
+    def from_bounds(cls, rows, begin_included=True, end_included=False):
+        """
+        Bulk-create an interval set out of an iterable of rows, each
+        either a (begin, end) pair of values (whose inclusion is then
+        given by begin_included and end_included) or a
+        (begin, end, begin_included, end_included) 4-tuple.
+        The rows may overlap and come in any order.
+
+        This skips the creation of pegs and intervals for each row:
+        rows are validated in a single pass (raising InvalidValueError,
+        with the row index, on the first invalid one), sorted only if
+        they are not sorted by begin already and then merged in
+        a linear sweep into the normalized set.
+        """
+        entries = []
+        last_position = None
+        presorted = True
+        for row_index, row in enumerate(rows):
+            if len(row) == 2:
+                begin, end = row
+                row_begin_included = begin_included
+                row_end_included = end_included
+            elif len(row) == 4:
+                begin, end, row_begin_included, row_end_included = row
+            else:
+                raise InvalidValueError(f"Invalid interval in row {row_index}")
+            begin_key = x_key(begin)
+            end_key = x_key(end)
+            # flattened forms of the positions of IntervalPeg (same ordering)
+            begin_position = begin_key + (0 if row_begin_included else 1,)
+            end_position = end_key + (1 if row_end_included else 0,)
+            # (x_key of infinities, which cannot be included, is not (1, x))
+            if (
+                not begin_position < end_position
+                or (row_begin_included and begin_key[0] != 1)  # noqa: W503
+                or (row_end_included and end_key[0] != 1)  # noqa: W503
+            ):
+                raise InvalidValueError(f"Invalid interval in row {row_index}")
+            if presorted and last_position is not None:
+                presorted = last_position <= begin_position
+            last_position = begin_position
+            entries.append(
+                (
+                    begin_position,
+                    end_position,
+                    begin,
+                    row_begin_included,
+                    end,
+                    row_end_included,
+                )
+            )
+        if not presorted:
+            entries.sort(key=itemgetter(0))
+        return cls.from_normalized(cls._sweep_entries(entries))
+
+    @classmethod
+    def from_columns(
+        cls,
+        begins,
+        ends,
+        begin_included=True,
+        end_included=False,
+    ):
+        """
+        Bulk-create an interval set out of a column of begin values and one
+        of end values (see `from_bounds`): begin_included and end_included
+        are either booleans, applying to all rows, or columns themselves.
+        """
+        if isinstance(begin_included, bool):
+            begin_included = repeat(begin_included)
+        if isinstance(end_included, bool):
+            end_included = repeat(end_included)
+        return cls.from_bounds(zip(begins, ends, begin_included, end_included))
+
+    @classmethod
+    def _sweep_entries(cls, entries):
+        """
+        Merge the (validated) entries of `from_bounds`, sorted by begin,
+        into normalized intervals.
+        """
+        current = None
+        for entry in entries:
+            if current is None:
+                current = list(entry)
+            elif entry[0] <= current[1]:
+                # overlapping or adjacent: extend the current interval
+                if entry[1] > current[1]:
+                    current[1] = entry[1]
+                    current[4] = entry[4]
+                    current[5] = entry[5]
+            else:
+                yield cls._entry_interval(current)
+                current = list(entry)
+        if current is not None:
+            yield cls._entry_interval(current)
+
+    @classmethod
+    def _entry_interval(cls, entry):
+        return cls.interval_class(
+            IntervalPeg(entry[2], entry[3]),
+            IntervalPeg(entry[4], entry[5]),
+        )
+
+    def _init_caches(self):
+        """Mark all lazily-computed quantities as not yet available."""
+        self._hash = None
+        self._extension = None
+        self._bounds = None
+        self._measure_index = None
 
     def _normalize(self, intervals):
         """
@@ -51,17 +258,68 @@ class BaseIntervalSet:
         is reduced to 'normal form' using the one-single-list
         form of the generic combiner.
         """
-        return combine_intervals(self.interval_class, [intervals])
+        return combine_intervals(
+            self.interval_class.from_trusted_pegs,
+            [intervals],
+        )
 
-    def to_dict(self):
+    def to_dict(self, version=None):
         """
         Return a json-encodable representation of this interval set.
+        By default the latest version (`serializing_version`) of the
+        representation is used, but an older one can be requested.
         """
-        return {
-            "class": self.serializing_class,
-            "version": self.serializing_version,
-            "intervals": [interval.to_dict() for interval in self._intervals],
-        }
+        v_encoder = self.interval_class.value_encoder
+        if not v_encoder or self.serializing_version is None:
+            raise UnserializableItemError
+        version = writing_version(version, self.serializing_version)
+        probe = start_probe("to_dict")
+        if version >= COMPACT_VERSION:
+            result = {
+                "class": self.serializing_class,
+                "version": version,
+                **to_compact(self.intervals(), v_encoder),
+            }
+        else:
+            intervals = self.intervals()
+            result = {
+                "class": self.serializing_class,
+                "version": version,
+                "intervals": [ivl.to_dict(version=1) for ivl in intervals],
+            }
+        if probe is not None:
+            probe.phase("encode")
+            probe.done(input_intervals=self.interval_count())
+        return result
+
+    def to_binary(self):
+        """
+        Return a compact binary representation (a `bytes`) of this set,
+        for interval classes whose values encode to numbers.
+        See `clothesline.generic.interval_set_binary` for the format.
+        """
+        return to_binary(self)
+
+    def _locate(self, value):
+        """
+        Binary search on the (sorted) intervals for the index of the last one
+        beginning at or before `value`, which is the only candidate to contain
+        it. Return -1 if all intervals begin after `value`.
+        """
+        key = x_key(value)
+        low = 0
+        high = len(self._intervals)
+        while low < high:
+            mid = (low + high) // 2
+            if x_key(self._interval_at(mid).begin.value) > key:
+                high = mid
+            else:
+                low = mid + 1
+        return low - 1
+
+    def _interval_at(self, index):
+        """The interval at a given position in the (sorted) set."""
+        return self._intervals[index]
 
     def contains(self, value):
         """
@@ -69,7 +327,35 @@ class BaseIntervalSet:
 
         Conventionally, infinities do not belong to any interval set.
         """
-        return any(interval.contains(value) for interval in self._intervals)
+        index = self._locate(value)
+        return index >= 0 and self._interval_at(index).contains(value)
+
+    def contains_many(self, values):
+        """
+        Test whether each of the provided values belongs to the set,
+        returning a list of booleans in the same order as the input.
+
+        If the values come sorted, all of them are answered with a single
+        forward pass of binary searches on the (cached) begin positions
+        of the intervals, each starting where the previous one stopped;
+        otherwise each is located by binary search.
+        """
+        values = list(values)
+        keys = [x_key(value) for value in values]
+        if all(key1 <= key2 for key1, key2 in zip(keys, keys[1:])):
+            begin_positions = self._get_measure_index()[0]
+            results = []
+            # number of intervals beginning at or before the current value
+            count = 0
+            for value, key in zip(values, keys):
+                # (a begin at the value has position (key, 0) or (key, 1))
+                count = bisect_right(begin_positions, (key, 1), lo=count)
+                results.append(
+                    count > 0 and self._interval_at(count - 1).contains(value)
+                )
+            return results
+        else:
+            return [self.contains(value) for value in values]
 
     def extension(self):
         """
@@ -77,37 +363,253 @@ class BaseIntervalSet:
         use it to compute this interval set's (overall) 'extension'.
         """
         if self.interval_class.metric:  # noqa: PLR1705
+            if self._extension is None:
 
-            def c_sum(val1, val2):
-                return x_sum(
-                    val1,
-                    val2,
-                    self.interval_class.metric.adder,
-                )
+                def c_sum(val1, val2):
+                    return x_sum(
+                        val1,
+                        val2,
+                        self.interval_class.metric.adder,
+                    )
 
-            return reduce(
-                c_sum,
-                (interval.extension() for interval in self._intervals),
-                self.interval_class.metric.zero,
-            )
+                self._extension = reduce(
+                    c_sum,
+                    (interval.extension() for interval in self._intervals),
+                    self.interval_class.metric.zero,
+                )
+            return self._extension
         else:
             raise MetricNotImplementedError
 
+    def _get_measure_index(self):
+        """
+        Return (building it on first use) the index for windowed queries:
+        the begin and end positions of the intervals, and the cumulative
+        extensions, where the k-th entry sums the extensions of the
+        first k intervals. Unbounded intervals, which can only come first or
+        last, contribute zero to the latter: they never lie entirely
+        within a bounded window and are accounted for separately.
+        """
+        if self._measure_index is None:
+            metric = self.interval_class.metric
+            begin_positions = []
+            end_positions = []
+            cumulative = [metric.zero] if metric else None
+            for interval in self.intervals():
+                begin_positions.append(interval.begin.begin_position())
+                end_positions.append(interval.end.end_position())
+                if metric:
+                    extension = x_subtract(
+                        interval.end.value,
+                        interval.begin.value,
+                        metric.subtracter,
+                    )
+                    cumulative.append(
+                        cumulative[-1]
+                        if is_symbol(extension)
+                        else metric.adder(cumulative[-1], extension)
+                    )
+            self._measure_index = (begin_positions, end_positions, cumulative)
+        return self._measure_index
+
+    def _overlap_range(self, begin_position, end_position):
+        """
+        Return the (start, stop) range of the indices of the intervals
+        sharing some position p with begin_position <= p < end_position.
+        """
+        begin_positions, end_positions, _ = self._get_measure_index()
+        start = bisect_right(end_positions, begin_position)
+        stop = bisect_left(begin_positions, end_position)
+        return start, max(start, stop)
+
+    def _clipped_extension(self, index, value_begin, value_end):
+        """Extension of the part of an interval between two values."""
+        interval = self._interval_at(index)
+        low = interval.begin.value
+        if x_key(value_begin) > x_key(low):
+            low = value_begin
+        high = interval.end.value
+        if x_key(value_end) < x_key(high):
+            high = value_end
+        return x_subtract(high, low, self.interval_class.metric.subtracter)
+
+    def _indexing_metric(self, *hooks):
+        """
+        Return the metric of the intervals, making sure it exists and
+        provides the hooks needed by the (optional) indexed queries.
+        """
+        metric = self.interval_class.metric
+        if not metric:
+            raise MetricNotImplementedError
+        for hook in hooks:
+            # (the stubs of BaseDomainMetric do not count as hooks)
+            if getattr(metric, hook, None) in _HOOK_STUBS[hook]:
+                raise MetricNotImplementedError
+        return metric
+
+    def extension_within(self, value_begin, value_end):
+        """
+        The extension of the part of this set lying between two values,
+        i.e. of its intersection with the window [value_begin, value_end)
+        (the inclusion of the ends is irrelevant to extensions).
+
+        After a one-off O(n) indexing of the set, each query costs two
+        binary searches: the intervals lying entirely within the window
+        are summed up as a difference of cumulative extensions,
+        and only the two partially covered ones are clipped.
+        """
+        metric = self._indexing_metric("extension_subtracter")
+        if x_key(value_end) <= x_key(value_begin):
+            return metric.zero
+        start, stop = self._overlap_range(
+            (x_key(value_begin), 0),
+            (x_key(value_end), 0),
+        )
+        if stop == start:  # noqa: PLR1705
+            return metric.zero
+        elif stop == start + 1:
+            return self._clipped_extension(start, value_begin, value_end)
+        else:
+            cumulative = self._get_measure_index()[2]
+            # intervals start+1 ... stop-2 are within the window:
+            inner = metric.extension_subtracter(
+                cumulative[stop - 1],
+                cumulative[start + 1],
+            )
+            first = self._clipped_extension(start, value_begin, value_end)
+            last = self._clipped_extension(stop - 1, value_begin, value_end)
+            return x_sum(x_sum(first, inner, metric.adder), last, metric.adder)
+
+    def measure_before(self, value):
+        """
+        The extension of the part of this set preceding a value
+        (PlusInf if the set is unbounded below): see `extension_within`.
+        """
+        return self.extension_within(MinusInf, value)
+
+    def point_at_measure(self, measure):
+        """
+        The value at which the extension of the part of the set preceding it
+        reaches a given measure, i.e. the smallest x such that
+        `measure_before(x) >= measure`: the inverse of `measure_before`.
+        Raise InvalidValueError for a negative measure, one exceeding the
+        set's extension, or for sets unbounded below.
+
+        This costs a single binary search on the cumulative extensions
+        of the intervals (see `extension_within`).
+        """
+        metric = self._indexing_metric("extension_subtracter", "shifter")
+        count = self.interval_count()
+        if measure < metric.zero:
+            raise InvalidValueError("Measure cannot be negative")
+        if not count or self._interval_at(0).begin.value is MinusInf:
+            raise InvalidValueError("No point at a measure in this set")
+        cumulative = self._get_measure_index()[2]
+        # the last interval with cumulative extension (before it) < measure:
+        index = max(bisect_left(cumulative, measure), 1) - 1
+        if index == count:
+            if self._interval_at(count - 1).end.value is not PlusInf:
+                raise InvalidValueError("Measure exceeds the set extension")
+            # the unbounded last interval adds nothing to cumulative:
+            index = count - 1
+        return metric.shifter(
+            self._interval_at(index).begin.value,
+            metric.extension_subtracter(measure, cumulative[index]),
+        )
+
+    def quantile(self, fraction):
+        """
+        The value below which a given fraction (between 0 and 1) of the
+        set's extension lies, e.g. 0.5 for the 'median' of a bounded set:
+        see `point_at_measure`.
+        """
+        metric = self._indexing_metric("scaler")
+        if not 0 <= fraction <= 1:
+            raise InvalidValueError("Quantiles require a fraction in [0, 1]")
+        bounds = self.bounds()
+        if bounds is None or any(is_symbol(pg.value) for pg in bounds.pegs()):
+            raise InvalidValueError("Quantiles require a nonempty bounded set")
+        total = self._get_measure_index()[2][-1]
+        return self.point_at_measure(metric.scaler(total, fraction))
+
+    def interval_count_within(
+        self,
+        value_begin,
+        value_end,
+        begin_included=True,
+        end_included=False,
+    ):
+        """
+        The number of intervals of this set sharing at least one point with
+        the window from value_begin to value_end (by default including
+        the former, not the latter), found with two binary searches.
+        """
+        # (infinities, which cannot be included, just bound the window)
+        begin_position = IntervalPeg(
+            value_begin,
+            begin_included and not is_symbol(value_begin),
+        ).begin_position()
+        end_position = IntervalPeg(
+            value_end,
+            end_included and not is_symbol(value_end),
+        ).end_position()
+        # an empty window, such as [x, x), overlaps nothing
+        if not begin_position < end_position:
+            return 0
+        start, stop = self._overlap_range(begin_position, end_position)
+        return stop - start
+
+    def bounds(self):
+        """
+        Return the smallest single interval containing the whole set
+        (None for the empty set).
+        """
+        if self._bounds is None and self._intervals:
+            self._bounds = self.interval_class(
+                self._intervals[0].begin,
+                self._intervals[-1].end,
+            )
+        return self._bounds
+
+    def interval_count(self):
+        """Return the number of intervals making up the set."""
+        return len(self._intervals)
+
     def __eq__(self, other):
         return (
             isinstance(other, self.__class__)
+            and not self._hash_mismatch(other)  # noqa: W503
             and len(self._intervals) == len(other._intervals)  # noqa: W503
             and self._intervals == other._intervals  # noqa: W503
         )
 
-    def __hash__(self):
-        return hash(
-            (
-                self.__class__,
-                tuple((hash(interval) for interval in self._intervals)),
-            )  # noqa: E501
+    def _hash_mismatch(self, other):
+        """True if both hashes are already known and differ."""
+        return (
+            self._hash is not None
+            and other._hash is not None  # noqa: W503
+            and self._hash != other._hash  # noqa: W503
         )
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.__class__,
+                    tuple((hash(interval) for interval in self._intervals)),
+                )  # noqa: E501
+            )
+        return self._hash
+
+    def __reduce__(self):
+        """
+        Pickle as the flat tuple of all boundary values plus the bitmask
+        of their inclusion (see `clothesline.generic.compact_dicts`),
+        leaving out the cached quantities.
+        """
+        bounds, mask = flatten_pegs(self.intervals())
+        return (_unpickle_interval_set, (self.__class__, tuple(bounds), mask))
+
     def __repr__(self):
         if not self._intervals:  # noqa: PLR1705
             return "{}"
@@ -133,10 +635,11 @@ class BaseIntervalSet:
         """
         Union of interval sets.
         """
-        return self.__class__(
-            combine_intervals(
-                self.interval_class,
-                [self._intervals, other.intervals()],
+        return self.from_normalized(
+            combine_normalized_pair(
+                self.interval_class.from_trusted_pegs,
+                self._intervals,
+                other.intervals(),
                 combiner_function=lambda q: q[0] or q[1],
             )
         )
@@ -145,10 +648,11 @@ class BaseIntervalSet:
         """
         Difference of interval sets.
         """
-        return self.__class__(
-            combine_intervals(
-                self.interval_class,
-                [self._intervals, other.intervals()],
+        return self.from_normalized(
+            combine_normalized_pair(
+                self.interval_class.from_trusted_pegs,
+                self._intervals,
+                other.intervals(),
                 combiner_function=lambda q: q[0] and not q[1],
             )
         )
@@ -157,10 +661,11 @@ class BaseIntervalSet:
         """
         Intersection of interval sets.
         """
-        return self.__class__(
-            combine_intervals(
-                self.interval_class,
-                [self._intervals, other.intervals()],
+        return self.from_normalized(
+            combine_normalized_pair(
+                self.interval_class.from_trusted_pegs,
+                self._intervals,
+                other.intervals(),
                 combiner_function=lambda q: q[0] and q[1],
             )
         )
@@ -169,20 +674,156 @@ class BaseIntervalSet:
         """
         XOR ("exclusive disjunction") of interval sets.
         """
-        return self.__class__(
-            combine_intervals(
-                self.interval_class,
-                [self._intervals, other.intervals()],
+        return self.from_normalized(
+            combine_normalized_pair(
+                self.interval_class.from_trusted_pegs,
+                self._intervals,
+                other.intervals(),
                 combiner_function=lambda q: q[0] ^ q[1],
             )
         )
 
+    @classmethod
+    def union_all(cls, interval_sets, workers=None):
+        """
+        Union of any number of interval sets, computed in a single sweep.
+        If a number of `workers` is given, the collection is split among
+        as many processes (see `clothesline.generic.parallel_reduction`).
+        """
+        if workers is not None:
+            return reduce_in_parallel(cls, interval_sets, workers, False)
+        return cls.at_least(interval_sets, 1)
+
+    @classmethod
+    def intersect_all(cls, interval_sets, workers=None):
+        """
+        Intersection of any number of interval sets, computed in a single
+        sweep. The intersection of no sets at all is the whole domain.
+        As for `union_all`, the work can be split among `workers` processes.
+        """
+        if workers is not None:
+            return reduce_in_parallel(cls, interval_sets, workers, True)
+        interval_sets = list(interval_sets)
+        return cls.at_least(interval_sets, len(interval_sets))
+
+    @classmethod
+    def at_least(cls, interval_sets, min_count):
+        """
+        The set of points belonging to at least `min_count`
+        of the provided interval sets, computed in a single sweep.
+        """
+        if min_count < 1:
+            return cls.utils().all()
+        return cls.from_normalized(
+            combine_normalized_at_least(
+                cls.interval_class.from_trusted_pegs,
+                [interval_set.intervals() for interval_set in interval_sets],
+                min_count,
+            )
+        )
+
+    @classmethod
+    def accumulator(cls):
+        """
+        Create an empty, mutable accumulator of intervals, to build a set of
+        this class one interval at a time (see
+        `clothesline.generic.interval_set_accumulator.IntervalSetAccumulator`).
+        """
+        return IntervalSetAccumulator(cls)
+
+    @classmethod
+    def coverage(cls, interval_sets):
+        """
+        The coverage-depth profile of any number of interval sets
+        (how many of them contain each point), computed in a single sweep:
+        see `clothesline.generic.coverage_profile.CoverageProfile`.
+        """
+        return CoverageProfile(
+            cls,
+            coverage_depths(
+                [interval_set.intervals() for interval_set in interval_sets]
+            ),
+        )
+
     def complement(self):
         """
         Set complement of the interval set.
         """
         return self.utils().all().difference(self)
 
+    def contains_interval(self, interval):
+        """
+        Test whether a whole interval is contained in this set.
+        Being connected, it must lie within a single interval of the set,
+        which is found by binary search.
+        """
+        index = self._locate(interval.begin.value)
+        if index < 0:
+            return False
+        candidate = self._interval_at(index)
+        begin_position = interval.begin.begin_position()
+        end_position = interval.end.end_position()
+        return (
+            candidate.begin.begin_position() <= begin_position
+            and end_position <= candidate.end.end_position()  # noqa: W503
+        )
+
+    def _overlaps_interval(self, interval):
+        """
+        Test whether an interval shares any point with this set.
+        Only the interval of the set beginning last at or before the
+        given interval's begin, and the following one, may overlap with it.
+        """
+        begin_position = interval.begin.begin_position()
+        end_position = interval.end.end_position()
+        index = self._locate(interval.begin.value)
+        candidates = (
+            self._interval_at(cand_index)
+            for cand_index in range(
+                max(index, 0),
+                min(index + 2, self.interval_count()),
+            )
+        )
+        return any(
+            cand.begin.begin_position() < end_position
+            and begin_position < cand.end.end_position()  # noqa: W503
+            for cand in candidates
+        )
+
+    def overlaps(self, other):
+        """
+        Test whether this set and another interval(set) share any point.
+        """
+        return any(map(self._overlaps_interval, other.intervals()))
+
+    def isdisjoint(self, other):
+        """Test whether this set and another interval(set) share no point."""
+        return not self.overlaps(other)
+
+    def issuperset(self, other):
+        """Test whether another interval(set) is contained in this."""
+        return all(map(self.contains_interval, other.intervals()))
+
+    def issubset(self, other):
+        """
+        Test whether this set is contained in another interval(set).
+        Both being sorted, a single merge-walk answers the question.
+        """
+        other_intervals = other.intervals()
+        current = next(other_intervals, None)
+        for interval in self._intervals:
+            begin_position = interval.begin.begin_position()
+            # skip the other's intervals lying entirely before this one
+            while current and current.end.end_position() <= begin_position:
+                current = next(other_intervals, None)
+            if current is None:
+                return False
+            begin_ok = current.begin.begin_position() <= begin_position
+            end_ok = interval.end.end_position() <= current.end.end_position()
+            if not (begin_ok and end_ok):
+                return False
+        return True
+
     def superset_of(self, other):
         """Test whether another interval(set) is contained in this."""
-        return other - self == self.utils().empty()
+        return self.issuperset(other)
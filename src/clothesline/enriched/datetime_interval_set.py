@@ -10,6 +10,7 @@ will stay in the correct domain.
 """
 
 import datetime
+from functools import lru_cache
 
 from clothesline.base.base_interval_set import BaseIntervalSet
 from clothesline.base.base_interval import BaseInterval
@@ -38,6 +39,21 @@ class DatetimeMetric(BaseDomainMetric):
         """standard subtraction."""
         return val1 - val2
 
+    @staticmethod
+    def extension_subtracter(ext1, ext2):
+        """standard subtraction, for extensions."""
+        return ext1 - ext2
+
+    @staticmethod
+    def shifter(val, ext):
+        """datetime plus timedelta."""
+        return val + ext
+
+    @staticmethod
+    def scaler(ext, factor):
+        """timedelta times a number (rounded to microseconds)."""
+        return ext * factor
+
     zero = datetime.timedelta(0)
 
 
@@ -49,6 +65,8 @@ class DatetimeInterval(BaseInterval):
     For these intervals, values are `datetime`.
     """
 
+    __slots__ = ()
+
     metric = DatetimeMetric
 
     @staticmethod
@@ -62,9 +80,10 @@ class DatetimeInterval(BaseInterval):
         return datetime.datetime.fromtimestamp(val)
 
     serializing_class = "DatetimeInterval"
-    serializing_version = 1
+    serializing_version = 2
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def builder():
         """
         Return a builder configured to make peg pairs into
@@ -76,6 +95,7 @@ class DatetimeInterval(BaseInterval):
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def utils():
         """
         Return an "utils" object configured to create special cases of
@@ -92,12 +112,15 @@ class DatetimeIntervalSet(BaseIntervalSet):
     For these interval sets, values are `datetime`.
     """
 
+    __slots__ = ()
+
     interval_class = DatetimeInterval
 
     serializing_class = "DatetimeIntervalSet"
-    serializing_version = 1
+    serializing_version = 2
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def builder():
         """
         Return a builder configured to make peg pairs into
@@ -108,6 +131,7 @@ class DatetimeIntervalSet(BaseIntervalSet):
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def utils():
         """
         Return an "utils" object configured to create special cases of
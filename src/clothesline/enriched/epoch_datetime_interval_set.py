@@ -0,0 +1,336 @@
+"""
+A variant of the datetime interval and interval set whose pegs store
+integer microseconds since the epoch instead of `datetime` objects.
+
+Datetimes are converted to integers when entering (pegs of new intervals,
+arguments to `contains`...) and back only when leaving the objects
+(`repr`, `extension`, `to_datetime_set`...), so that all combinations,
+membership tests and extensions run on plain integers.
+
+Timezone-aware datetimes are normalized to UTC, while naive datetimes are
+taken to be in UTC already: converting back yields UTC-aware datetimes.
+"""
+
+import datetime
+from functools import lru_cache
+
+from clothesline.algebra import coverage_depths
+from clothesline.algebra.symbols import is_symbol, x_repr, PlusInf
+from clothesline.base.base_interval_set import BaseIntervalSet
+from clothesline.base.base_interval import BaseInterval
+from clothesline.base.base_domain_metric import BaseDomainMetric
+from clothesline.enriched.datetime_interval_set import DatetimeIntervalSet
+from clothesline.interval_peg import IntervalPeg
+
+from clothesline.generic.coverage_profile import CoverageProfile
+from clothesline.generic.interval_generic_builder import IntervalGenericBuilder
+from clothesline.generic.interval_generic_utils import IntervalGenericUtils
+from clothesline.generic.interval_set_accumulator import (
+    IntervalSetAccumulator,
+)
+from clothesline.generic.interval_set_generic_utils import (
+    IntervalSetGenericUtils,
+)  # noqa: E501
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_NAIVE_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def to_epoch_us(value):
+    """
+    datetime => integer microseconds since the epoch (UTC);
+    integers, as well as infinities, are returned unchanged.
+    """
+    if isinstance(value, datetime.datetime):  # noqa: PLR1705
+        if value.tzinfo is None:  # noqa: PLR1705
+            return (value - _NAIVE_EPOCH) // _MICROSECOND
+        else:
+            return (value - _EPOCH) // _MICROSECOND
+    else:
+        return value
+
+
+def from_epoch_us(value):
+    """integer microseconds since the epoch => (UTC) datetime."""
+    return _EPOCH + datetime.timedelta(microseconds=value)
+
+
+def _epoch_peg(peg):
+    """A peg with its value made into epoch microseconds, if needed."""
+    if isinstance(peg.value, datetime.datetime):  # noqa: PLR1705
+        return IntervalPeg(to_epoch_us(peg.value), peg.included)
+    else:
+        return peg
+
+
+def _value_repr(value):
+    """Representation of a peg value, shown as an ISO datetime."""
+    if is_symbol(value):  # noqa: PLR1705
+        return x_repr(value)
+    else:
+        return from_epoch_us(value).isoformat()
+
+
+class EpochMetric(BaseDomainMetric):
+    """
+    Interval lengths are computed as integer microseconds.
+    """
+
+    @staticmethod
+    def adder(val1, val2):
+        """standard addition."""
+        return val1 + val2
+
+    @staticmethod
+    def subtracter(val1, val2):
+        """standard subtraction."""
+        return val1 - val2
+
+    @staticmethod
+    def extension_subtracter(ext1, ext2):
+        """standard subtraction, for extensions."""
+        return ext1 - ext2
+
+    @staticmethod
+    def shifter(val, ext):
+        """standard addition."""
+        return val + ext
+
+    @staticmethod
+    def scaler(ext, factor):
+        """multiplication, rounded to whole microseconds."""
+        return round(ext * factor)
+
+    zero = 0
+
+
+def _to_timedelta(extension):
+    """Integer microseconds (or PlusInf) to timedelta (or PlusInf)."""
+    if extension is PlusInf:  # noqa: PLR1705
+        return PlusInf
+    else:
+        return datetime.timedelta(microseconds=extension)
+
+
+class EpochDatetimeInterval(BaseInterval):
+    """
+    Domain-specific interval subclass, holding integer microseconds
+    since the epoch: intervals can be created from `datetime` values
+    (which get converted) as well as from the integers themselves.
+    """
+
+    __slots__ = ()
+
+    metric = EpochMetric
+
+    @staticmethod
+    def value_encoder(val):
+        """domain encoder: the integers are left as they are."""
+        return val
+
+    @staticmethod
+    def value_decoder(val):
+        """domain decoder: ensure we get the integer back."""
+        return int(val)
+
+    serializing_class = "EpochDatetimeInterval"
+    serializing_version = 2
+
+    def __init__(self, begin, end):
+        super().__init__(_epoch_peg(begin), _epoch_peg(end))
+
+    def __repr__(self):
+        begin_paren = "[" if self.begin.included else "("
+        end_paren = "]" if self.end.included else ")"
+        begin_name = _value_repr(self.begin.value)
+        end_name = _value_repr(self.end.value)
+        return f"{begin_paren}{begin_name}, {end_name}{end_paren}"
+
+    def contains(self, value):
+        """
+        Test whether a value (datetime or epoch microseconds)
+        belongs to the interval.
+        """
+        return super().contains(to_epoch_us(value))
+
+    def extension(self):
+        """The extension of this interval, as a timedelta (or PlusInf)."""
+        return _to_timedelta(super().extension())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def builder():
+        """
+        Return a builder configured to make peg pairs into
+        these types of intervals.
+        """
+        return IntervalGenericBuilder(
+            interval_class=EpochDatetimeInterval,
+            interval_set_class=None,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def utils():
+        """
+        Return an "utils" object configured to create special cases of
+        intervals as instance of this subclass.
+        """
+        return IntervalGenericUtils(interval_class=EpochDatetimeInterval)
+
+
+class EpochDatetimeIntervalSet(BaseIntervalSet):
+    """
+    Domain-specific interval-set subclass, holding integer microseconds
+    since the epoch: a drop-in replacement for DatetimeIntervalSet,
+    whose operations run on integers.
+
+    Membership tests accept datetimes (or integers) and extensions
+    are returned as timedelta.
+    """
+
+    __slots__ = ()
+
+    interval_class = EpochDatetimeInterval
+
+    serializing_class = "EpochDatetimeIntervalSet"
+    serializing_version = 2
+
+    def contains(self, value):
+        """
+        Test whether a value (datetime or epoch microseconds)
+        belongs to the set.
+        """
+        return super().contains(to_epoch_us(value))
+
+    def contains_many(self, values):
+        """
+        Test whether each of the provided values (datetime or epoch
+        microseconds) belongs to the set.
+        """
+        return super().contains_many(to_epoch_us(value) for value in values)
+
+    def extension(self):
+        """
+        The set's overall extension, as a timedelta (or PlusInf),
+        summed over the integer boundaries.
+        """
+        if self._extension is None:
+            total = 0
+            for interval in self.intervals():
+                begin_value = interval.begin.value
+                end_value = interval.end.value
+                if is_symbol(begin_value) or is_symbol(end_value):
+                    total = PlusInf
+                    break
+                total += end_value - begin_value
+            self._extension = _to_timedelta(total)
+        return self._extension
+
+    def extension_within(self, value_begin, value_end):
+        """
+        The extension (as a timedelta, or PlusInf) of the part of this set
+        between two values (datetimes or epoch microseconds).
+        """
+        return _to_timedelta(
+            super().extension_within(
+                to_epoch_us(value_begin),
+                to_epoch_us(value_end),
+            )
+        )
+
+    def point_at_measure(self, measure):
+        """
+        The (UTC) datetime at which the extension of the part of the set
+        preceding it reaches a measure (timedelta or microseconds).
+        """
+        if isinstance(measure, datetime.timedelta):
+            measure = measure // _MICROSECOND
+        return from_epoch_us(super().point_at_measure(measure))
+
+    def interval_count_within(
+        self,
+        value_begin,
+        value_end,
+        begin_included=True,
+        end_included=False,
+    ):
+        """
+        The number of intervals of this set sharing at least one point
+        with the window between two values (datetimes or epoch microseconds).
+        """
+        return super().interval_count_within(
+            to_epoch_us(value_begin),
+            to_epoch_us(value_end),
+            begin_included=begin_included,
+            end_included=end_included,
+        )
+
+    @classmethod
+    def accumulator(cls):
+        """
+        Create an empty, mutable accumulator of intervals for this class,
+        whose `contains` takes datetimes.
+        """
+        return IntervalSetAccumulator(cls, value_converter=to_epoch_us)
+
+    @classmethod
+    def coverage(cls, interval_sets):
+        """
+        The coverage-depth profile of any number of sets of this class,
+        taking datetimes and giving extensions as timedelta.
+        """
+        return CoverageProfile(
+            cls,
+            coverage_depths(
+                [interval_set.intervals() for interval_set in interval_sets]
+            ),
+            value_converter=to_epoch_us,
+            extension_converter=_to_timedelta,
+        )
+
+    def to_datetime_set(self):
+        """Convert to a DatetimeIntervalSet (with UTC-aware datetimes)."""
+        datetime_class = DatetimeIntervalSet.interval_class
+        return DatetimeIntervalSet.from_normalized(
+            datetime_class(
+                *(
+                    peg
+                    if is_symbol(peg.value)
+                    else IntervalPeg(from_epoch_us(peg.value), peg.included)
+                    for peg in interval.pegs()
+                )
+            )
+            for interval in self.intervals()
+        )
+
+    @classmethod
+    def from_datetime_set(cls, datetime_set):
+        """Create a set of this class out of a DatetimeIntervalSet."""
+        return cls.from_normalized(
+            cls.interval_class(interval.begin, interval.end)
+            for interval in datetime_set.intervals()
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def builder():
+        """
+        Return a builder configured to make peg pairs into
+        these types of interval sets.
+        """
+        return IntervalGenericBuilder(
+            interval_set_class=EpochDatetimeIntervalSet,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def utils():
+        """
+        Return an "utils" object configured to create special cases of
+        interval sets as instance of this subclass.
+        """
+        return IntervalSetGenericUtils(
+            interval_set_class=EpochDatetimeIntervalSet,
+        )
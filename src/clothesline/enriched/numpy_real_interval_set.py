@@ -0,0 +1,392 @@
+"""
+A drop-in variant of RealIntervalSet whose normalized form is stored
+as NumPy arrays instead of a list of interval objects.
+
+This kit requires `numpy` (e.g. `pip install clothesline[numpy]`), which is
+why it is not exposed by the top-level `clothesline` package.
+
+The set is held as four arrays of equal length: the begin and end values
+(float64, with the infinities mapped to -inf/+inf) and two boolean arrays
+telling whether each begin/end is included. Membership tests, extension and
+the binary set operations run vectorized on these arrays; everything else
+(serialization, repr, builders, utils...) works as for RealIntervalSet,
+with the intervals materialized on demand.
+
+Internally, the binary operations work on 'toggles': the line is refined so
+that each value x is preceded by a boundary (x, 0) and followed by a
+boundary (x, 1); the set is then a sequence of sorted boundaries at which
+membership switches on/off. E.g. [a, b) switches on at (a, 0) and off at
+(b, 0), (a, b] switches on at (a, 1) and off at (b, 1).
+
+Note: values are stored as float64, so they come back as floats.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from clothesline.algebra.symbols import PlusInf, MinusInf
+from clothesline.generic.interval_generic_builder import IntervalGenericBuilder
+from clothesline.generic.interval_set_generic_utils import (
+    IntervalSetGenericUtils,
+)  # noqa: E501
+from clothesline.interval_peg import IntervalPeg
+from clothesline.real_interval import RealInterval
+from clothesline.real_interval_set import RealIntervalSet
+
+
+def _to_float(value):
+    """Extended value -> float (infinities become -inf/+inf)."""
+    if value is MinusInf:  # noqa: PLR1705
+        return -np.inf
+    elif value is PlusInf:
+        return np.inf
+    else:
+        return value
+
+
+def _from_float(value):
+    """float -> extended value (inverse of _to_float)."""
+    if value == -np.inf:  # noqa: PLR1705
+        return MinusInf
+    elif value == np.inf:
+        return PlusInf
+    else:
+        return value
+
+
+def _arrays_from_intervals(intervals):
+    """
+    Return begins, ends, begin_included, end_included arrays
+    out of an iterable over (normalized) intervals.
+    """
+    intervals = list(intervals)
+    return (
+        np.array(
+            [_to_float(interval.begin.value) for interval in intervals],
+            dtype=np.float64,
+        ),
+        np.array(
+            [_to_float(interval.end.value) for interval in intervals],
+            dtype=np.float64,
+        ),
+        np.array(
+            [interval.begin.included for interval in intervals],
+            dtype=bool,
+        ),
+        np.array(
+            [interval.end.included for interval in intervals],
+            dtype=bool,
+        ),
+    )
+
+
+def _toggles(begins, ends, begin_included, end_included):
+    """
+    Interleave the arrays of a normalized set into its sorted toggles,
+    returned as (values, ranks).
+    """
+    values = np.empty(2 * len(begins), dtype=np.float64)
+    values[0::2] = begins
+    values[1::2] = ends
+    ranks = np.empty(2 * len(begins), dtype=np.int8)
+    ranks[0::2] = ~begin_included
+    ranks[1::2] = end_included
+    return values, ranks
+
+
+def _combine_toggles(toggles_a, toggles_b, combiner_ufunc):
+    """
+    Vectorized analogue of the generic combiner for two operands:
+    return the (begins, ends, begin_included, end_included) arrays of
+    the set whose membership is combiner_ufunc(membership_a, membership_b).
+    """
+    values_a, ranks_a = toggles_a
+    values_b, ranks_b = toggles_b
+    values = np.concatenate((values_a, values_b))
+    ranks = np.concatenate((ranks_a, ranks_b))
+    from_b = np.concatenate(
+        (
+            np.zeros(len(values_a), dtype=bool),
+            np.ones(len(values_b), dtype=bool),
+        )
+    )
+    order = np.lexsort((ranks, values))
+    values = values[order]
+    ranks = ranks[order]
+    from_b = from_b[order]
+    # membership of each operand right after each toggle:
+    state_a = np.cumsum(~from_b) % 2 == 1
+    state_b = np.cumsum(from_b) % 2 == 1
+    # coinciding toggles from the two operands are collapsed to the last one
+    last_of_key = np.ones(len(values), dtype=bool)
+    last_of_key[:-1] = (values[1:] != values[:-1]) | (ranks[1:] != ranks[:-1])
+    values = values[last_of_key]
+    ranks = ranks[last_of_key]
+    merged = combiner_ufunc(state_a[last_of_key], state_b[last_of_key])
+    changes = merged != np.concatenate(([False], merged[:-1]))
+    values = values[changes]
+    ranks = ranks[changes]
+    return (
+        values[0::2],
+        values[1::2],
+        ranks[0::2] == 0,
+        ranks[1::2] == 1,
+    )
+
+
+class NumpyRealIntervalSet(RealIntervalSet):
+    """
+    A RealIntervalSet backed by NumPy arrays.
+
+    Binary operations with another NumpyRealIntervalSet (or with any
+    real interval/set, which is converted on the fly) are vectorized and
+    return a NumpyRealIntervalSet. `contains_many` returns a boolean array.
+
+    Sets of this class serialize to the same dicts as RealIntervalSet.
+    Equality (hence hashing) holds only among NumpyRealIntervalSet instances.
+    """
+
+    __slots__ = (
+        "_begins",
+        "_ends",
+        "_begin_included",
+        "_end_included",
+        "_toggle_arrays",
+    )
+
+    @property
+    def _intervals(self):
+        """The intervals, materialized from the arrays upon each access."""
+        return list(self.intervals())
+
+    @_intervals.setter
+    def _intervals(self, intervals):
+        (
+            self._begins,
+            self._ends,
+            self._begin_included,
+            self._end_included,
+        ) = _arrays_from_intervals(intervals)
+
+    @classmethod
+    def from_arrays(cls, begins, ends, begin_included, end_included):
+        """
+        Create a set directly from the four arrays describing it (infinities
+        expressed as -inf/+inf), without any normalization or check:
+        the intervals must be in normal form (sorted, disjoint and
+        non-adjacent), as is the case for the output of `to_arrays`.
+        """
+        interval_set = cls.__new__(cls)
+        interval_set._begins = np.asarray(begins, dtype=np.float64)
+        interval_set._ends = np.asarray(ends, dtype=np.float64)
+        interval_set._begin_included = np.asarray(begin_included, dtype=bool)
+        interval_set._end_included = np.asarray(end_included, dtype=bool)
+        interval_set._init_caches()
+        return interval_set
+
+    def __reduce__(self):
+        """Pickle as the four arrays (see `from_arrays`)."""
+        return (self.__class__.from_arrays, self.to_arrays())
+
+    def to_arrays(self):
+        """
+        Return copies of the (begins, ends, begin_included, end_included)
+        arrays describing this set.
+        """
+        return (
+            self._begins.copy(),
+            self._ends.copy(),
+            self._begin_included.copy(),
+            self._end_included.copy(),
+        )
+
+    def _init_caches(self):
+        super()._init_caches()
+        self._toggle_arrays = None
+
+    def _toggles(self):
+        """The (values, ranks) toggles of this set, built on first use."""
+        if self._toggle_arrays is None:
+            self._toggle_arrays = _toggles(
+                self._begins,
+                self._ends,
+                self._begin_included,
+                self._end_included,
+            )
+        return self._toggle_arrays
+
+    @staticmethod
+    def _toggles_of(other):
+        """Toggles for the other operand of a binary operation."""
+        if isinstance(other, NumpyRealIntervalSet):  # noqa: PLR1705
+            return other._toggles()
+        else:
+            return _toggles(*_arrays_from_intervals(other.intervals()))
+
+    def _combine(self, other, combiner_ufunc):
+        return self.from_arrays(
+            *_combine_toggles(
+                self._toggles(),
+                self._toggles_of(other),
+                combiner_ufunc,
+            )
+        )
+
+    def intervals(self):
+        """Return an iterable over the intervals of this set."""
+        for begin, end, begin_included, end_included in zip(
+            self._begins.tolist(),
+            self._ends.tolist(),
+            self._begin_included.tolist(),
+            self._end_included.tolist(),
+        ):
+            yield RealInterval(
+                IntervalPeg(_from_float(begin), begin_included),
+                IntervalPeg(_from_float(end), end_included),
+            )
+
+    def _locate(self, value):
+        """
+        Index of the last interval beginning at or before `value`
+        (-1 if none), by binary search on the begins array.
+        """
+        position = np.searchsorted(self._begins, _to_float(value), "right")
+        return int(position) - 1
+
+    def _interval_at(self, index):
+        """The interval at a given position, built from the arrays."""
+        return RealInterval(
+            IntervalPeg(
+                _from_float(self._begins[index].item()),
+                bool(self._begin_included[index]),
+            ),
+            IntervalPeg(
+                _from_float(self._ends[index].item()),
+                bool(self._end_included[index]),
+            ),
+        )
+
+    def contains_many(self, values):
+        """
+        Test whether each of the provided values belongs to the set,
+        returning a boolean NumPy array (one binary search per value).
+        """
+        points = np.array(
+            [_to_float(value) for value in values]
+            if not isinstance(values, np.ndarray)
+            else values,
+            dtype=np.float64,
+        )
+        toggle_values, toggle_ranks = self._toggles()
+        # a point x is in the set if an odd number of toggles precede it,
+        # i.e. the toggles before x plus a possible (x, 0) toggle.
+        preceding = np.searchsorted(toggle_values, points, side="left")
+        at_point = np.minimum(preceding, max(len(toggle_values) - 1, 0))
+        if len(toggle_values):
+            preceding += (toggle_values[at_point] == points) & (
+                toggle_ranks[at_point] == 0
+            )
+        return (preceding % 2 == 1) & np.isfinite(points)
+
+    def extension(self):
+        """
+        The set's overall extension (as a float), or PlusInf if unbounded.
+        """
+        if self._extension is None:
+            total = float(np.sum(self._ends - self._begins))
+            self._extension = PlusInf if total == np.inf else total
+        return self._extension
+
+    def bounds(self):
+        """
+        Return the smallest single interval containing the whole set
+        (None for the empty set).
+        """
+        if self._bounds is None and len(self._begins):
+            self._bounds = RealInterval(
+                self._interval_at(0).begin,
+                self._interval_at(-1).end,
+            )
+        return self._bounds
+
+    def interval_count(self):
+        """Return the number of intervals making up the set."""
+        return len(self._begins)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, self.__class__)
+            and not self._hash_mismatch(other)  # noqa: W503
+            and np.array_equal(self._begins, other._begins)  # noqa: W503
+            and np.array_equal(self._ends, other._ends)  # noqa: W503
+            and np.array_equal(  # noqa: W503
+                self._begin_included,
+                other._begin_included,
+            )
+            and np.array_equal(  # noqa: W503
+                self._end_included,
+                other._end_included,
+            )
+        )
+
+    def __hash__(self):
+        if self._hash is None:
+            # adding 0.0 turns any -0.0 into 0.0, which compares equal to it
+            self._hash = hash(
+                (
+                    self.__class__,
+                    (self._begins + 0.0).tobytes(),
+                    (self._ends + 0.0).tobytes(),
+                    self._begin_included.tobytes(),
+                    self._end_included.tobytes(),
+                )
+            )
+        return self._hash
+
+    def union(self, other):
+        """
+        Union of interval sets (vectorized).
+        """
+        return self._combine(other, np.logical_or)
+
+    def difference(self, other):
+        """
+        Difference of interval sets (vectorized).
+        """
+        return self._combine(
+            other,
+            lambda state_a, state_b: state_a & ~state_b,
+        )
+
+    def intersect(self, other):
+        """
+        Intersection of interval sets (vectorized).
+        """
+        return self._combine(other, np.logical_and)
+
+    def xor(self, other):
+        """
+        XOR ("exclusive disjunction") of interval sets (vectorized).
+        """
+        return self._combine(other, np.logical_xor)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def builder():
+        """
+        Create an interval set builder.
+        """
+        return IntervalGenericBuilder(
+            interval_set_class=NumpyRealIntervalSet,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def utils():
+        """
+        Create an "utils" object, which offers standard intervalset* creation.
+        """
+        return IntervalSetGenericUtils(
+            interval_set_class=NumpyRealIntervalSet,
+        )
@@ -13,6 +13,8 @@ to non-serializable.
 Please refer to the Datetime case for relevant comments on the structure.
 """
 
+from functools import lru_cache
+
 from clothesline.base.base_interval_set import BaseIntervalSet
 from clothesline.base.base_interval import BaseInterval
 
@@ -28,7 +30,10 @@ class StringInterval(BaseInterval):
     Intervals between strings.
     """
 
+    __slots__ = ()
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def builder():
         """
         The builder peg-pair -> string interval.
@@ -39,6 +44,7 @@ class StringInterval(BaseInterval):
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def utils():
         """
         String-interval utils
@@ -51,9 +57,12 @@ class StringIntervalSet(BaseIntervalSet):
     A string-interval-set.
     """
 
+    __slots__ = ()
+
     interval_class = StringInterval
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def builder():
         """
         String-interval-set builder.
@@ -63,6 +72,7 @@ class StringIntervalSet(BaseIntervalSet):
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def utils():
         """
         Return an "utils" object configured to create special cases of
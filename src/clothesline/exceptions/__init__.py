@@ -17,6 +17,13 @@ class InvalidCombineEndState(ValueError):
     """
 
 
+class UnsortedIntervalsError(ValueError):
+    """
+    A stream of intervals expected to be sorted by their begin
+    is found to be out of order.
+    """
+
+
 class IndeterminateFormError(ValueError):
     """
     An indeterminate form arisen through operations
@@ -44,6 +51,13 @@ class UnparseableDictError(ValueError):
     """
 
 
+class UnparseableBinaryError(ValueError):
+    """
+    An attempt to read an invalid binary representation of an intervalset*
+    (or one made for another class, or with a too-new format version).
+    """
+
+
 class UnsupportedVersionDictError(ValueError):
     """
     The version of this dict is too new to be hydrated back to an object.
@@ -0,0 +1,135 @@
+"""
+Helpers for the compact (version 2) dict representation of intervals*
+and intervalsets*.
+
+Instead of one nested dict per peg, the pegs of a sequence of intervals are
+flattened into:
+    - "bounds": the list [begin0, end0, begin1, end1, ...] of encoded values,
+      where the infinities are the short token `None` (null in JSON):
+      a null begin is MinusInf and a null end is PlusInf;
+    - "included": a bitmask, as a hexadecimal string, whose bit k tells
+      whether the k-th entry of "bounds" is included.
+
+The same flat form, with raw values and an integer mask, is what
+intervals* and intervalsets* reduce to when pickled.
+"""
+
+from clothesline.algebra.symbols import PlusInf, MinusInf, is_symbol
+from clothesline.exceptions import (
+    InvalidValueError,
+    UnparseableDictError,
+    UnsupportedVersionDictError,
+)
+from clothesline.interval_peg import IntervalPeg
+
+
+COMPACT_VERSION = 2
+
+
+def writing_version(requested_version, serializing_version):
+    """
+    Resolve the dict version to write: the requested one, if given,
+    otherwise the latest one supported by the class.
+    """
+    if requested_version is None:
+        return serializing_version
+    if not 1 <= requested_version <= serializing_version:
+        raise UnsupportedVersionDictError
+    return requested_version
+
+
+def reading_version(input_dict, serializing_class, serializing_version):
+    """
+    Check class and version of a dict about to be parsed back
+    and return its (supported) version.
+    """
+    if input_dict.get("class") != serializing_class:
+        raise UnparseableDictError
+    version = input_dict.get("version")
+    if not isinstance(version, int) or version < 1:
+        raise UnparseableDictError
+    if version > serializing_version:
+        raise UnsupportedVersionDictError
+    return version
+
+
+def flatten_pegs(intervals, v_encoder=None):
+    """
+    Return the flat list of (encoded, if an encoder is given) boundary values
+    of a sequence of intervals, with `None` for the infinities, and the
+    (integer) bitmask of their inclusion, as a pair.
+    """
+    bounds = []
+    bits = []  # '0'/'1' digits, least significant first
+    for interval in intervals:
+        for peg in (interval.begin, interval.end):
+            value = peg.value
+            if is_symbol(value):
+                bounds.append(None)
+            else:
+                bounds.append(value if v_encoder is None else v_encoder(value))
+            bits.append("1" if peg.included else "0")
+    # (going through a binary string keeps this linear for large masks)
+    return bounds, int("".join(reversed(bits)) or "0", 2)
+
+
+def unflatten_pegs(bounds, mask, v_decoder=None):
+    """
+    Inverse of `flatten_pegs`: return a list of (begin peg, end peg) pairs.
+    No check is made on the input.
+    """
+    # digits of the mask, least significant first:
+    bits = format(mask, "0%ib" % len(bounds))[::-1] if bounds else ""
+    if v_decoder is not None:
+        bounds = [None if tok is None else v_decoder(tok) for tok in bounds]
+    finite_peg = IntervalPeg.from_trusted_value
+    minus_inf_peg = IntervalPeg(MinusInf, False)
+    plus_inf_peg = IntervalPeg(PlusInf, False)
+    peg_pairs = []
+    for index in range(0, len(bounds), 2):
+        begin_value, end_value = bounds[index], bounds[index + 1]
+        peg_pairs.append(
+            (
+                minus_inf_peg
+                if begin_value is None
+                else finite_peg(begin_value, bits[index] == "1"),
+                plus_inf_peg
+                if end_value is None
+                else finite_peg(end_value, bits[index + 1] == "1"),
+            )
+        )
+    return peg_pairs
+
+
+def to_compact(intervals, v_encoder):
+    """
+    Return the "bounds" list and the "included" bitmask for a sequence of
+    intervals, as a dict.
+    """
+    bounds, mask = flatten_pegs(intervals, v_encoder)
+    return {
+        "bounds": bounds,
+        "included": format(mask, "x"),
+    }
+
+
+def from_compact(input_dict, v_decoder):
+    """
+    Parse the "bounds" and "included" entries of a compact dict into
+    a list of (begin peg, end peg) pairs.
+    """
+    try:
+        bounds = input_dict["bounds"]
+        mask = int(input_dict["included"], 16)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise UnparseableDictError from exc
+    if not isinstance(bounds, list) or len(bounds) % 2 or mask < 0:
+        raise UnparseableDictError
+    if mask >> len(bounds):
+        raise UnparseableDictError
+    # (as for unflatten_pegs, digits of the mask least significant first)
+    bits = format(mask, "0%ib" % len(bounds))[::-1] if bounds else ""
+    for bound, bit in zip(bounds, bits):
+        if bound is None and bit == "1":
+            raise InvalidValueError("Infinities cannot be included in peg")
+    return unflatten_pegs(bounds, mask, v_decoder)
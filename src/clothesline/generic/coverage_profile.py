@@ -0,0 +1,145 @@
+"""
+The coverage-depth profile of a collection of interval sets, i.e. how many
+of them cover each point of the domain: a piecewise-constant function,
+computed with a single sweep over all sets (see
+`clothesline.algebra.coverage_depths`) and answering questions such as
+"what is the peak concurrency", "where are at least k sets active"
+or "for how long are exactly k sets active".
+"""
+
+from bisect import bisect_right
+
+from clothesline.algebra.symbols import is_symbol, x_key, x_subtract, x_sum
+from clothesline.exceptions import MetricNotImplementedError
+from clothesline.interval_peg import IntervalPeg
+
+
+class CoverageProfile:
+    """
+    The depth profile of a collection of interval sets of some class,
+    usually created through the `coverage` classmethod of that class.
+
+    Internally, the profile is the list of markers (distinct boundaries)
+    of all intervals, each with the depth at the marker itself and the depth
+    over the open range up to the next marker.
+
+    Optional converters adapt the values passed to `depth_at` and the
+    extensions returned by `extension_by_depth` to the set class, for sets
+    storing values in a different form than they are handed out.
+    """
+
+    def __init__(
+        self,
+        interval_set_class,
+        depths,
+        value_converter=None,
+        extension_converter=None,
+    ):
+        self.interval_set_class = interval_set_class
+        self._depths = depths
+        self._keys = [x_key(marker) for marker, _, _ in depths]
+        self._value_converter = value_converter
+        self._extension_converter = extension_converter
+
+    def max_depth(self):
+        """The maximum number of sets covering a single point."""
+        return max(
+            (
+                max(point_depth, range_depth)
+                for _, point_depth, range_depth in self._depths
+            ),
+            default=0,
+        )
+
+    def depth_at(self, value):
+        """
+        The number of sets containing a value (a binary search).
+        Infinities, as usual, belong to no set.
+        """
+        if self._value_converter is not None:
+            value = self._value_converter(value)
+        if is_symbol(value):
+            return 0
+        key = x_key(value)
+        index = bisect_right(self._keys, key) - 1
+        if index < 0:  # noqa: PLR1705
+            return 0
+        elif self._keys[index] == key:
+            return self._depths[index][1]
+        else:
+            return self._depths[index][2]
+
+    def _elementary_pieces(self):
+        """
+        Yield a (begin_peg, end_peg, depth) triple for each (finite) marker,
+        as a point, and for each open range between consecutive markers.
+        """
+        depths = self._depths
+        for index, (marker, point_depth, range_depth) in enumerate(depths):
+            if not is_symbol(marker):
+                point_peg = IntervalPeg(marker, True)
+                yield point_peg, point_peg, point_depth
+            if index + 1 < len(depths):
+                next_peg = IntervalPeg(depths[index + 1][0], False)
+                yield IntervalPeg(marker, False), next_peg, range_depth
+
+    def pieces(self):
+        """
+        Return the profile as a list of (interval, depth) pairs: sorted,
+        disjoint, maximal intervals of constant, nonzero depth.
+        """
+        runs = []  # [begin_peg, end_peg, depth], zero depths included
+        for begin_peg, end_peg, depth in self._elementary_pieces():
+            if runs and runs[-1][2] == depth:
+                runs[-1][1] = end_peg
+            else:
+                runs.append([begin_peg, end_peg, depth])
+        interval_class = self.interval_set_class.interval_class
+        return [
+            (interval_class.from_trusted_pegs(begin_peg, end_peg), depth)
+            for begin_peg, end_peg, depth in runs
+            if depth
+        ]
+
+    def at_least(self, min_depth):
+        """
+        The set of points covered by at least `min_depth` (a positive
+        integer) of the sets, as an interval set.
+        """
+        return self.interval_set_class.from_sorted_stream(
+            interval for interval, depth in self.pieces() if depth >= min_depth
+        )
+
+    def extension_at_least(self, min_depth):
+        """
+        The extension of the region covered by at least `min_depth`
+        of the sets (e.g. the time spent above a concurrency level).
+        """
+        return self.at_least(min_depth).extension()
+
+    def extension_by_depth(self):
+        """
+        Return a dict mapping each (nonzero) depth to the extension of the
+        region covered by exactly that number of sets.
+        """
+        metric = self.interval_set_class.interval_class.metric
+        if not metric:
+            raise MetricNotImplementedError
+        extensions = {}
+        for interval, depth in self.pieces():
+            extension = x_subtract(
+                interval.end.value,
+                interval.begin.value,
+                metric.subtracter,
+            )
+            extensions[depth] = x_sum(
+                extensions.get(depth, metric.zero),
+                extension,
+                metric.adder,
+            )
+        if self._extension_converter is not None:
+            extensions = {
+                depth: self._extension_converter(extension)
+                for depth, extension in extensions.items()
+            }
+        return extensions
@@ -68,8 +68,9 @@ class IntervalGenericBuilder:
         if interval_set_class is None:
             self._finalizer = lambda pegs: interval_class(*pegs)
         else:
+            # a single (valid, hence nonempty) interval is in normal form:
             _interval_class = interval_set_class.interval_class
-            self._finalizer = lambda pegs: interval_set_class(
+            self._finalizer = lambda pegs: interval_set_class.from_normalized(
                 [_interval_class(*pegs)],
             )
 
@@ -7,10 +7,14 @@ is set per-instance, so this serves as a generic class template.
 from clothesline.interval_peg import IntervalPeg
 from clothesline.algebra.symbols import PlusInf, MinusInf
 
+from clothesline.generic.compact_dicts import (
+    COMPACT_VERSION,
+    from_compact,
+    reading_version,
+)
 from clothesline.exceptions import (
     UnparseableDictError,
     UnserializableItemError,
-    UnsupportedVersionDictError,
 )
 
 
@@ -38,18 +42,23 @@ class IntervalGenericUtils:
         Using the information in the interval class, convert a dict
         (supposedly generate from an interval of this same type)
         back into an interval.
+        Dicts of any version up to the class' `serializing_version`
+        are accepted.
         This function takes care of injecting decoders to the lower-level
         (i.e. peg-level) from_dict function invocations.
         """
         if not self.value_decoder:
             raise UnserializableItemError
-        if input_dict.get("class") != self.serializing_class:
-            raise UnparseableDictError
-        # Here, in the future, version upgrade logic will be injected
-        if input_dict.get("version", 0) > self.serializing_version:
-            raise UnsupportedVersionDictError
-        if input_dict.get("version") != self.serializing_version:
-            raise UnparseableDictError
+        version = reading_version(
+            input_dict,
+            self.serializing_class,
+            self.serializing_version,
+        )
+        if version >= COMPACT_VERSION:
+            peg_pairs = from_compact(input_dict, v_decoder=self.value_decoder)
+            if len(peg_pairs) != 1:
+                raise UnparseableDictError
+            return self.interval_class(*peg_pairs[0])
         return self.interval_class(
             IntervalPeg.from_dict(
                 input_dict["pegs"][0],
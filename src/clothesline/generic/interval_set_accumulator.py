@@ -0,0 +1,151 @@
+"""
+A mutable companion to the (immutable) interval sets, for building a set
+out of a long stream of additions and removals: instead of combining
+the whole growing set at each step, each `add`/`discard` only touches the
+intervals it overlaps, located by binary search over the boundaries,
+and `freeze` hands out a regular interval set.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from clothesline.algebra.symbols import is_symbol, x_key
+from clothesline.interval_peg import IntervalPeg
+
+
+class IntervalSetAccumulator:
+    """
+    A mutable set of points over the domain of some interval set class,
+    usually created through the `accumulator` classmethod of that class.
+
+    The accumulated intervals are kept in normal form (sorted, disjoint and
+    non-adjacent) as a list, alongside the sorted lists of their begin and
+    end positions (see `IntervalPeg.begin_position`): locating the
+    intervals affected by a change, or the one containing a value, is
+    a binary search, and a change then replaces just those intervals.
+
+    An optional converter adapts the values passed to `contains` to the set
+    class, for sets storing values in a different form than they are
+    handed out.
+    """
+
+    def __init__(self, interval_set_class, value_converter=None):
+        self.interval_set_class = interval_set_class
+        self._intervals = []
+        self._begin_positions = []
+        self._end_positions = []
+        self._value_converter = value_converter
+
+    def _as_intervals(self, item):
+        """An interval, or the intervals of an interval set, as a list."""
+        if isinstance(item, self.interval_set_class):  # noqa: PLR1705
+            return list(item.intervals())
+        else:
+            return [item]
+
+    def _replace(self, lo_index, hi_index, intervals):
+        """Replace the intervals in a (possibly empty) range of positions."""
+        self._intervals[lo_index:hi_index] = intervals
+        self._begin_positions[lo_index:hi_index] = [
+            interval.begin.begin_position() for interval in intervals
+        ]
+        self._end_positions[lo_index:hi_index] = [
+            interval.end.end_position() for interval in intervals
+        ]
+
+    def add(self, item):
+        """
+        Add an interval (or all intervals of an interval set) to the
+        accumulated points, merging it with the overlapping or adjacent
+        intervals already there.
+        """
+        int_maker = self.interval_set_class.interval_class.from_trusted_pegs
+        for interval in self._as_intervals(item):
+            begin_position = interval.begin.begin_position()
+            end_position = interval.end.end_position()
+            # intervals ending at/after it begins, beginning at/before it ends
+            lo_index = bisect_left(self._end_positions, begin_position)
+            hi_index = bisect_right(self._begin_positions, end_position)
+            begin_peg = interval.begin
+            end_peg = interval.end
+            if lo_index < hi_index:
+                if self._begin_positions[lo_index] < begin_position:
+                    begin_peg = self._intervals[lo_index].begin
+                if self._end_positions[hi_index - 1] > end_position:
+                    end_peg = self._intervals[hi_index - 1].end
+            self._replace(lo_index, hi_index, [int_maker(begin_peg, end_peg)])
+
+    def discard(self, item):
+        """
+        Remove an interval (or all intervals of an interval set) from the
+        accumulated points, trimming or splitting the intervals it overlaps.
+        Removing points which are not there is not an error.
+        """
+        int_maker = self.interval_set_class.interval_class.from_trusted_pegs
+        for interval in self._as_intervals(item):
+            begin_position = interval.begin.begin_position()
+            end_position = interval.end.end_position()
+            # intervals ending after this begins, beginning before it ends
+            lo_index = bisect_right(self._end_positions, begin_position)
+            hi_index = bisect_left(self._begin_positions, end_position)
+            if lo_index >= hi_index:
+                continue
+            remnants = []
+            # (an end at an infinity leaves no remnant on that side)
+            if self._begin_positions[lo_index] < begin_position:
+                remnants.append(
+                    int_maker(
+                        self._intervals[lo_index].begin,
+                        IntervalPeg(
+                            interval.begin.value,
+                            not interval.begin.included,
+                        ),
+                    )
+                )
+            if self._end_positions[hi_index - 1] > end_position:
+                remnants.append(
+                    int_maker(
+                        IntervalPeg(
+                            interval.end.value,
+                            not interval.end.included,
+                        ),
+                        self._intervals[hi_index - 1].end,
+                    )
+                )
+            self._replace(lo_index, hi_index, remnants)
+
+    def update(self, items):
+        """Add each of the provided intervals (or interval sets)."""
+        for item in items:
+            self.add(item)
+
+    def contains(self, value):
+        """
+        Test whether a value belongs to the accumulated points
+        (a binary search). Infinities, as usual, belong to no set.
+        """
+        if self._value_converter is not None:
+            value = self._value_converter(value)
+        if is_symbol(value):
+            return False
+        key = x_key(value)
+        index = bisect_right(self._begin_positions, (key, 0)) - 1
+        return index >= 0 and self._end_positions[index] >= (key, 1)
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def interval_count(self):
+        """Return the number of intervals making up the accumulated points."""
+        return len(self._intervals)
+
+    def intervals(self):
+        """Return an iterable over the (current) accumulated intervals."""
+        return iter(list(self._intervals))
+
+    def freeze(self):
+        """
+        Return the accumulated points as an (immutable) interval set,
+        with no normalization needed. The accumulator can still be used
+        afterwards, without affecting the returned set.
+        """
+        return self.interval_set_class.from_normalized(self._intervals)
@@ -0,0 +1,298 @@
+"""
+A fixed-width binary (columnar) format for interval sets whose values
+encode to numbers (such as RealIntervalSet and DatetimeIntervalSet),
+meant to be compact on disk and to be queried in place, e.g. through mmap.
+
+Layout (all little-endian), for a set of n intervals:
+    header: magic b"CLIS", format version (uint16), reserved (uint16),
+            serializing class of the set (32 bytes, ASCII, zero-padded),
+            n (uint64)                                   -- 48 bytes
+    begins: n float64, the encoded begin values
+    ends:   n float64, the encoded end values
+    flags:  n bytes, one per interval, with bits for
+            'begin included', 'end included', 'begin is MinusInf' and
+            'end is PlusInf' (the value then being stored as -inf/+inf)
+
+Values go through the interval class' `value_encoder`/`value_decoder`,
+hence (for reals) they come back as floats.
+
+A `MappedIntervalSet` answers membership and window queries by binary
+search directly on the underlying buffer, only decoding the few values
+it needs, and materializes interval objects just for query results.
+"""
+
+import mmap
+import struct
+from numbers import Real
+
+from clothesline.algebra.symbols import PlusInf, MinusInf
+from clothesline.exceptions import (
+    UnparseableBinaryError,
+    UnserializableItemError,
+)
+from clothesline.instrumentation import start_probe
+from clothesline.interval_peg import IntervalPeg
+
+MAGIC = b"CLIS"
+FORMAT_VERSION = 1
+
+_CLASS_TAG_SIZE = 32
+_HEADER = struct.Struct("<4sHH%isQ" % _CLASS_TAG_SIZE)
+_VALUE = struct.Struct("<d")
+
+_BEGIN_INCLUDED = 1
+_END_INCLUDED = 2
+_BEGIN_MINUS_INF = 4
+_END_PLUS_INF = 8
+
+
+def _class_tag(interval_set_class):
+    if interval_set_class.serializing_class is None:
+        raise UnserializableItemError
+    class_tag = interval_set_class.serializing_class.encode("ascii")
+    if len(class_tag) > _CLASS_TAG_SIZE:
+        # (it would be silently truncated in the header)
+        raise UnserializableItemError("Serializing class name too long")
+    return class_tag
+
+
+def _encoded(value, v_encoder):
+    encoded = v_encoder(value)
+    if not isinstance(encoded, Real):
+        raise UnserializableItemError("Values do not encode to numbers")
+    return float(encoded)
+
+
+def to_binary(interval_set):
+    """
+    Return the binary representation (a `bytes`) of an interval set.
+    """
+    v_encoder = interval_set.interval_class.value_encoder
+    if not v_encoder:
+        raise UnserializableItemError
+    probe = start_probe("to_binary")
+    intervals = list(interval_set.intervals())
+    begins = []
+    ends = []
+    flags = bytearray()
+    for interval in intervals:
+        flag = 0
+        if interval.begin.value is MinusInf:
+            flag |= _BEGIN_MINUS_INF
+            begins.append(float("-inf"))
+        else:
+            begins.append(_encoded(interval.begin.value, v_encoder))
+        if interval.end.value is PlusInf:
+            flag |= _END_PLUS_INF
+            ends.append(float("inf"))
+        else:
+            ends.append(_encoded(interval.end.value, v_encoder))
+        if interval.begin.included:
+            flag |= _BEGIN_INCLUDED
+        if interval.end.included:
+            flag |= _END_INCLUDED
+        flags.append(flag)
+    columns = struct.pack("<%id" % (2 * len(intervals)), *begins, *ends)
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        _class_tag(interval_set),
+        len(intervals),
+    )
+    if probe is not None:
+        probe.phase("encode")
+        probe.done(input_intervals=len(intervals))
+    return header + columns + bytes(flags)
+
+
+class MappedIntervalSet:
+    """
+    A read-only view over the binary representation of an interval set,
+    held in any buffer (bytes, bytearray, mmap...).
+
+    Methods `contains`, `overlaps` and `window` work directly on the buffer;
+    `to_interval_set` decodes the whole of it into a regular interval set.
+    """
+
+    def __init__(self, interval_set_class, buffer):
+        self.interval_set_class = interval_set_class
+        self.interval_class = interval_set_class.interval_class
+        self._buffer = buffer
+        if len(buffer) < _HEADER.size:
+            raise UnparseableBinaryError("Truncated header")
+        magic, version, _, class_tag, count = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise UnparseableBinaryError("Not an interval set binary")
+        if version > FORMAT_VERSION:
+            raise UnparseableBinaryError("Unsupported format version")
+        if class_tag.rstrip(b"\x00") != _class_tag(interval_set_class):
+            raise UnparseableBinaryError("Mismatching interval set class")
+        if len(buffer) < _HEADER.size + 17 * count:
+            raise UnparseableBinaryError("Truncated data")
+        self._count = count
+        self._ends_offset = _HEADER.size + 8 * count
+        self._flags_offset = _HEADER.size + 16 * count
+        self._mmap = None
+
+    @classmethod
+    def from_file(cls, interval_set_class, file_name):
+        """
+        Open a file in binary format as a memory-mapped (read-only) set.
+        The mapping can be released with `close()` (or by using the
+        returned object as a context manager).
+        """
+        with open(file_name, "rb") as file_handle:
+            mapped = mmap.mmap(
+                file_handle.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            )
+        mapped_set = cls(interval_set_class, mapped)
+        mapped_set._mmap = mapped
+        return mapped_set
+
+    def close(self):
+        """Release the memory mapping, if any."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def interval_count(self):
+        """Return the number of intervals making up the set."""
+        return self._count
+
+    def _begin(self, index):
+        offset = _HEADER.size + 8 * index
+        return _VALUE.unpack_from(self._buffer, offset)[0]
+
+    def _end(self, index):
+        offset = self._ends_offset + 8 * index
+        return _VALUE.unpack_from(self._buffer, offset)[0]
+
+    def _flag(self, index):
+        return self._buffer[self._flags_offset + index]
+
+    def _begin_position(self, index):
+        excluded = not self._flag(index) & _BEGIN_INCLUDED
+        return (self._begin(index), int(excluded))
+
+    def _end_position(self, index):
+        included = bool(self._flag(index) & _END_INCLUDED)
+        return (self._end(index), int(included))
+
+    def _position_bisect(self, position, position_getter, strict=False):
+        """
+        Number of intervals whose position (as given by position_getter)
+        is <= position (< position if strict), by binary search.
+        """
+        low = 0
+        high = self._count
+        while low < high:
+            mid = (low + high) // 2
+            mid_pos = position_getter(mid)
+            if mid_pos > position or (strict and mid_pos == position):
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    def _encode_peg(self, peg):
+        if peg.value is MinusInf:  # noqa: PLR1705
+            return float("-inf")
+        elif peg.value is PlusInf:
+            return float("inf")
+        else:
+            return _encoded(peg.value, self.interval_class.value_encoder)
+
+    def _overlapping_range(self, interval):
+        """
+        Return the (start, stop) range of the indices of the intervals
+        overlapping with a given interval.
+        """
+        begin_position = (
+            self._encode_peg(interval.begin),
+            0 if interval.begin.included else 1,
+        )
+        end_position = (
+            self._encode_peg(interval.end),
+            1 if interval.end.included else 0,
+        )
+        # overlap means: begin_i < end_position and begin_position < end_i
+        start = self._position_bisect(begin_position, self._end_position)
+        stop = self._position_bisect(
+            end_position,
+            self._begin_position,
+            strict=True,
+        )
+        return start, max(start, stop)
+
+    def _interval_at(self, index):
+        """Decode the interval at a given position."""
+        flag = self._flag(index)
+        v_decoder = self.interval_class.value_decoder
+        if flag & _BEGIN_MINUS_INF:
+            begin_value = MinusInf
+        else:
+            begin_value = v_decoder(self._begin(index))
+        if flag & _END_PLUS_INF:
+            end_value = PlusInf
+        else:
+            end_value = v_decoder(self._end(index))
+        return self.interval_class(
+            IntervalPeg(begin_value, bool(flag & _BEGIN_INCLUDED)),
+            IntervalPeg(end_value, bool(flag & _END_INCLUDED)),
+        )
+
+    def intervals(self):
+        """Return an iterable over the (decoded) intervals of this set."""
+        for index in range(self._count):
+            yield self._interval_at(index)
+
+    def to_interval_set(self):
+        """Decode the whole set into a regular interval set."""
+        return self.interval_set_class.from_normalized(self.intervals())
+
+    def contains(self, value):
+        """
+        Test whether a value belongs to the set.
+
+        Conventionally, infinities do not belong to any interval set.
+        """
+        if value is MinusInf or value is PlusInf:
+            return False
+        position = (_encoded(value, self.interval_class.value_encoder), 0)
+        index = self._position_bisect(position, self._begin_position) - 1
+        return index >= 0 and position < self._end_position(index)
+
+    def overlaps(self, other):
+        """
+        Test whether this set shares any point with an interval(set).
+        """
+        for interval in other.intervals():
+            start, stop = self._overlapping_range(interval)
+            if stop > start:
+                return True
+        return False
+
+    def window(self, other):
+        """
+        Return the intersection of this set with an interval(set),
+        as a regular interval set, decoding only the intervals involved.
+        """
+        set_class = self.interval_set_class
+        other_set = set_class.from_normalized(other.intervals())
+        candidates = []
+        last_stop = 0
+        for interval in other_set.intervals():
+            start, stop = self._overlapping_range(interval)
+            for index in range(max(start, last_stop), stop):
+                candidates.append(self._interval_at(index))
+            last_stop = max(last_stop, stop)
+        return set_class.from_normalized(candidates).intersect(other_set)
@@ -7,11 +7,14 @@ classes and with a common set of methods an "utils" creates intervalsets
 of the appropriate type.
 """
 
-from clothesline.exceptions import (
-    UnparseableDictError,
-    UnserializableItemError,
-    UnsupportedVersionDictError,
+from clothesline.generic.interval_set_binary import MappedIntervalSet
+from clothesline.generic.compact_dicts import (
+    COMPACT_VERSION,
+    from_compact,
+    reading_version,
 )
+from clothesline.exceptions import UnserializableItemError
+from clothesline.instrumentation import start_probe
 
 
 class IntervalSetGenericUtils:
@@ -31,43 +34,115 @@ class IntervalSetGenericUtils:
         interval_class = interval_set_class.interval_class
         self.set_instantiator = interval_set_class
         # the above would be: lambda intervals: interval_set_class(intervals)
+        # standard sets below are in normal form by design, hence:
+        self.normalized_set_instantiator = interval_set_class.from_normalized
         self.int_utils = interval_class.utils()
         self.serializing_class = interval_set_class.serializing_class
         self.serializing_version = interval_set_class.serializing_version
+        # the empty and the "whole of it" sets, created on first request:
+        self._empty = None
+        self._all = None
 
     def from_dict(self, input_dict):
         """
         Extract an instance of this interval set from a dict,
         using the provided serializability settings
         (including checking dict metadata match).
+        Dicts of any version up to the class' `serializing_version`
+        are accepted.
         """
         if self.serializing_class is None or self.serializing_version is None:
             raise UnserializableItemError
         #
-        if input_dict.get("class") != self.serializing_class:
-            raise UnparseableDictError
-        # Here, in the future, version upgrade logic will be injected
-        if input_dict.get("version", 0) > self.serializing_version:
-            raise UnsupportedVersionDictError
-        if input_dict.get("version") != self.serializing_version:
-            raise UnparseableDictError
-        #
-        return self.set_instantiator(
-            self.int_utils.from_dict(interval_dict)
-            for interval_dict in input_dict["intervals"]
+        version = reading_version(
+            input_dict,
+            self.serializing_class,
+            self.serializing_version,
+        )
+        probe = start_probe("from_dict")
+        if version >= COMPACT_VERSION:
+            if not self.int_utils.value_decoder:
+                raise UnserializableItemError
+            interval_class = self.int_utils.interval_class
+            intervals = [
+                interval_class(begin_peg, end_peg)
+                for begin_peg, end_peg in from_compact(
+                    input_dict,
+                    v_decoder=self.int_utils.value_decoder,
+                )
+            ]
+        else:
+            intervals = [
+                self.int_utils.from_dict(interval_dict)
+                for interval_dict in input_dict["intervals"]
+            ]
+        if probe is None:
+            return self._checked_set(intervals)
+        probe.phase("parse")
+        interval_set = self._checked_set(intervals)
+        probe.phase("build")
+        probe.done(output_intervals=interval_set.interval_count())
+        return interval_set
+
+    def _checked_set(self, intervals):
+        """
+        Make a list of intervals into a set, skipping normalization
+        if they turn out to be already in normal form (as is the case for
+        anything coming from `to_dict`), which is checked in a single pass.
+        """
+        in_normal_form = all(
+            interval1.end.end_position() < interval2.begin.begin_position()
+            for interval1, interval2 in zip(intervals, intervals[1:])
         )
+        if in_normal_form:  # noqa: PLR1705
+            return self.normalized_set_instantiator(intervals)
+        else:
+            return self.set_instantiator(intervals)
+
+    def from_binary(self, buffer):
+        """
+        Extract an instance of this interval set from its binary
+        representation (see `to_binary`), held in any buffer.
+        """
+        probe = start_probe("from_binary")
+        interval_set = MappedIntervalSet(
+            self.set_instantiator,
+            buffer,
+        ).to_interval_set()
+        if probe is not None:
+            probe.phase("decode")
+            probe.done(output_intervals=interval_set.interval_count())
+        return interval_set
+
+    def map_binary(self, buffer):
+        """
+        Return a read-only view over the binary representation of a set
+        of this class, able to answer queries without decoding it all.
+        """
+        return MappedIntervalSet(self.set_instantiator, buffer)
+
+    def map_file(self, file_name):
+        """
+        Memory-map a file holding the binary representation of a set
+        of this class, returning a read-only view able to answer
+        queries without reading it all (see `map_binary`).
+        """
+        return MappedIntervalSet.from_file(self.set_instantiator, file_name)
 
     def empty(self):
         """
-        Create the empty set.
+        Return the empty set (always the same instance, sets being
+        immutable).
         """
-        return self.set_instantiator([])
+        if self._empty is None:
+            self._empty = self.normalized_set_instantiator([])
+        return self._empty
 
     def open(self, value_begin, value_end):
         """
         Create an open interval set with finite boundaries.
         """
-        return self.set_instantiator(
+        return self.normalized_set_instantiator(
             [self.int_utils.open(value_begin, value_end)],
         )
 
@@ -75,7 +150,7 @@ class IntervalSetGenericUtils:
         """
         Create a closed interval set with finite boundaries.
         """
-        return self.set_instantiator(
+        return self.normalized_set_instantiator(
             [self.int_utils.closed(value_begin, value_end)],
         )
 
@@ -83,13 +158,13 @@ class IntervalSetGenericUtils:
         """
         Create a zero-length degenerate [x, x] point-line 'interval set'.
         """
-        return self.set_instantiator([self.int_utils.point(value)])
+        return self.normalized_set_instantiator([self.int_utils.point(value)])
 
     def low_slice(self, value_end, included=False):
         """
         Create an interval set from -inf to a certain value.
         """
-        return self.set_instantiator(
+        return self.normalized_set_instantiator(
             [self.int_utils.low_slice(value_end, included=included)],
         )
 
@@ -97,22 +172,27 @@ class IntervalSetGenericUtils:
         """
         Create an interval set from a value up to +inf.
         """
-        return self.set_instantiator(
+        return self.normalized_set_instantiator(
             [self.int_utils.high_slice(value_begin, included=included)],
         )
 
     def all(self):
         """
-        Return the "whole of it" interval set.
+        Return the "whole of it" interval set (always the same instance,
+        sets being immutable).
         """
-        return self.set_instantiator([self.int_utils.all()])
+        if self._all is None:
+            self._all = self.normalized_set_instantiator(
+                [self.int_utils.all()],
+            )
+        return self._all
 
     def interval(self, value_begin, begin_included, value_end, end_included):
         """
         Directly create an interval set from the values
         and the open/closed specs.
         """
-        return self.set_instantiator(
+        return self.normalized_set_instantiator(
             [
                 self.int_utils.interval(
                     value_begin,
@@ -0,0 +1,272 @@
+"""
+An index over a (large) collection of interval sets, each stored under
+a key of choice, to quickly find which of them contain a given value
+or overlap a given interval(set).
+
+Internally, each interval of each indexed set becomes an 'entry'
+(begin_position, end_position, key, serial), where positions are those of
+`IntervalPeg.begin_position`/`end_position`: an interval covers exactly
+the positions p with begin_position <= p < end_position, a value x having
+position (x_key(x), 0). Entries are kept in centered interval trees,
+answering a query in O(log n + k) for k matching entries.
+
+Trees are static: to support incremental changes, the index holds a few
+trees of geometrically decreasing size (the 'logarithmic method'). An added
+set gets a tree of its own, which is merged with the last ones while they
+are not larger than it. Removed sets are just forgotten, their entries
+being skipped at query time until enough of them accumulate, at which
+point the whole index is rebuilt.
+"""
+
+from operator import itemgetter
+
+from clothesline.algebra.symbols import x_key
+
+
+_begin_of = itemgetter(0)
+_end_of = itemgetter(1)
+
+
+class _TreeNode:
+    """
+    A node of a centered interval tree: it holds the entries containing
+    its center position, sorted by begin (ascending) and by end (descending),
+    while the entries lying entirely before/after the center are in the
+    left/right subtree.
+    """
+
+    __slots__ = ("center", "by_begin", "by_end", "left", "right")
+
+    def __init__(self, entries):
+        """
+        Build a (sub)tree out of a nonempty list of entries,
+        sorted by begin (an order that is preserved in the subtrees).
+        """
+        # The center is the median begin: the entry it comes from contains
+        # it, hence no node is ever empty.
+        center = entries[len(entries) // 2][0]
+        centered = []
+        before = []
+        after = []
+        for entry in entries:
+            if entry[1] <= center:
+                before.append(entry)
+            elif entry[0] > center:
+                after.append(entry)
+            else:
+                centered.append(entry)
+        self.center = center
+        self.by_begin = centered
+        self.by_end = sorted(centered, key=_end_of, reverse=True)
+        self.left = _TreeNode(before) if before else None
+        self.right = _TreeNode(after) if after else None
+
+    @classmethod
+    def build(cls, entries):
+        """Build a tree out of a nonempty list of entries, in any order."""
+        return cls(sorted(entries, key=_begin_of))
+
+    def entries(self):
+        """Yield all entries in this tree."""
+        pending = [self]
+        while pending:
+            node = pending.pop()
+            yield from node.by_begin
+            pending.extend(
+                child for child in (node.left, node.right) if child is not None
+            )
+
+    def stab(self, position):
+        """Yield the entries of this tree covering a position."""
+        node = self
+        while node is not None:
+            if position < node.center:
+                for entry in node.by_begin:
+                    if entry[0] > position:
+                        break
+                    yield entry
+                node = node.left
+            else:
+                for entry in node.by_end:
+                    if entry[1] <= position:
+                        break
+                    yield entry
+                node = node.right
+
+    def overlap(self, begin_position, end_position):
+        """
+        Yield the entries of this tree overlapping a (nonempty) range of
+        positions begin_position <= p < end_position.
+        """
+        pending = [self]
+        while pending:
+            node = pending.pop()
+            if end_position <= node.center:
+                for entry in node.by_begin:
+                    if entry[0] >= end_position:
+                        break
+                    yield entry
+                if node.left is not None:
+                    pending.append(node.left)
+            elif begin_position > node.center:
+                for entry in node.by_end:
+                    if entry[1] <= begin_position:
+                        break
+                    yield entry
+                if node.right is not None:
+                    pending.append(node.right)
+            else:
+                yield from node.by_begin
+                if node.left is not None:
+                    pending.append(node.left)
+                if node.right is not None:
+                    pending.append(node.right)
+
+
+class IntervalSetIndex:
+    """
+    A collection of interval sets (of any class), each stored under
+    a (hashable) key, supporting fast "stabbing" and "range" queries:
+    `containing(value)` finds the keys of the sets containing a value,
+    `overlapping(other)` those of the sets sharing some point with
+    an interval or interval set.
+
+    The index can be built in bulk at once from a mapping (or an iterable of
+    (key, interval_set) pairs) and then modified incrementally with `add`
+    and `remove`. Queries cost O(log n + k) right after a bulk build,
+    and O(log^2 n + k) at worst after incremental changes, for n indexed
+    intervals and k matching ones.
+    """
+
+    def __init__(self, interval_sets=None):
+        self._sets = {}  # key -> (serial, interval_set)
+        self._serial = 0
+        self._trees = []  # list of [entry_count, root]
+        self._dead_entries = 0
+        self._live_entries = 0
+        if interval_sets is not None:
+            if hasattr(interval_sets, "items"):
+                interval_sets = interval_sets.items()
+            for key, interval_set in interval_sets:
+                self._store(key, interval_set)
+            self._rebuild()
+
+    def _store(self, key, interval_set):
+        """Register a set (replacing any previous one under the same key)."""
+        self._discard(key)
+        self._serial += 1
+        self._sets[key] = (self._serial, interval_set)
+        self._live_entries += interval_set.interval_count()
+        return self._serial
+
+    def _discard(self, key):
+        """Forget the set under a key (if any): its entries become dead."""
+        stored = self._sets.pop(key, None)
+        if stored is not None:
+            count = stored[1].interval_count()
+            self._live_entries -= count
+            self._dead_entries += count
+        return stored
+
+    @staticmethod
+    def _entries(key, serial, interval_set):
+        return [
+            (
+                interval.begin.begin_position(),
+                interval.end.end_position(),
+                key,
+                serial,
+            )
+            for interval in interval_set.intervals()
+        ]
+
+    def _is_live(self, entry):
+        stored = self._sets.get(entry[2])
+        return stored is not None and stored[0] == entry[3]
+
+    def _rebuild(self):
+        """Rebuild the index into a single tree of live entries only."""
+        entries = [
+            entry
+            for key, (serial, interval_set) in self._sets.items()
+            for entry in self._entries(key, serial, interval_set)
+        ]
+        self._trees = []
+        if entries:
+            self._trees.append([len(entries), _TreeNode.build(entries)])
+        self._dead_entries = 0
+
+    def add(self, key, interval_set):
+        """
+        Add an interval set to the index under a key, replacing
+        the set already stored under that key, if any.
+        """
+        serial = self._store(key, interval_set)
+        entries = self._entries(key, serial, interval_set)
+        # merge the trailing trees as long as they are not larger:
+        while self._trees and self._trees[-1][0] <= len(entries):
+            entries.extend(self._collect(self._trees.pop()[1]))
+        if entries:
+            self._trees.append([len(entries), _TreeNode.build(entries)])
+        self._maybe_rebuild()
+
+    def remove(self, key):
+        """
+        Remove the interval set stored under a key from the index.
+        Raise KeyError if there is no such key.
+        """
+        if self._discard(key) is None:
+            raise KeyError(key)
+        self._maybe_rebuild()
+
+    def _maybe_rebuild(self):
+        if self._dead_entries > max(self._live_entries, 16):
+            self._rebuild()
+
+    def _collect(self, root):
+        """All live entries in a tree (the dead ones are dropped for good)."""
+        all_entries = list(root.entries())
+        entries = [entry for entry in all_entries if self._is_live(entry)]
+        self._dead_entries -= len(all_entries) - len(entries)
+        return entries
+
+    def __len__(self):
+        return len(self._sets)
+
+    def __contains__(self, key):
+        return key in self._sets
+
+    def __getitem__(self, key):
+        return self._sets[key][1]
+
+    def keys(self):
+        """Return an iterable over the keys in the index."""
+        return self._sets.keys()
+
+    def containing(self, value):
+        """
+        Return the set of keys whose interval set contains a value.
+        """
+        position = (x_key(value), 0)
+        return {
+            entry[2]
+            for _, root in self._trees
+            for entry in root.stab(position)
+            if self._is_live(entry)
+        }
+
+    def overlapping(self, other):
+        """
+        Return the set of keys whose interval set shares at least one point
+        with another interval(set).
+        """
+        return {
+            entry[2]
+            for interval in other.intervals()
+            for _, root in self._trees
+            for entry in root.overlap(
+                interval.begin.begin_position(),
+                interval.end.end_position(),
+            )
+            if self._is_live(entry)
+        }
@@ -0,0 +1,72 @@
+"""
+Union/intersection of large collections of interval sets spread over
+several processes: the collection is partitioned into one contiguous chunk
+per worker, each chunk is reduced (in a single sweep) in a separate process,
+and the partial results are then reduced once more in the calling process.
+
+Sets travel to and from the worker processes pickled, i.e. in the flat
+form of their boundaries (see `BaseIntervalSet.__reduce__`), and are
+rebuilt there without normalization.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from clothesline.exceptions import InvalidValueError
+
+
+def _reduce_serially(interval_set_class, interval_sets, intersecting):
+    if intersecting:  # noqa: PLR1705
+        return interval_set_class.intersect_all(interval_sets)
+    else:
+        return interval_set_class.union_all(interval_sets)
+
+
+def _reduce_chunk(interval_set_class, intersecting, interval_sets):
+    """The work done in a worker process: reduce the sets of a chunk."""
+    return _reduce_serially(interval_set_class, interval_sets, intersecting)
+
+
+def _chunked(items, chunk_count):
+    """Split a list into `chunk_count` contiguous, non-empty chunks."""
+    base_size, remainder = divmod(len(items), chunk_count)
+    chunks = []
+    start = 0
+    for chunk_index in range(chunk_count):
+        stop = start + base_size + (1 if chunk_index < remainder else 0)
+        chunks.append(items[start:stop])
+        start = stop
+    return chunks
+
+
+def reduce_in_parallel(
+    interval_set_class,
+    interval_sets,
+    workers,
+    intersecting,
+):
+    """
+    Union (or intersection, if `intersecting`) of the provided interval sets,
+    computed with up to `workers` processes. With a single worker, or too few
+    sets to split, everything happens in the calling process.
+    """
+    if not isinstance(workers, int) or workers < 1:
+        raise InvalidValueError("The number of workers must be positive")
+    interval_sets = list(interval_sets)
+    chunk_count = min(workers, len(interval_sets))
+    if chunk_count <= 1:
+        return _reduce_serially(
+            interval_set_class,
+            interval_sets,
+            intersecting,
+        )
+    chunks = _chunked(interval_sets, chunk_count)
+    with ProcessPoolExecutor(max_workers=chunk_count) as executor:
+        partials = list(
+            executor.map(
+                _reduce_chunk,
+                [interval_set_class] * chunk_count,
+                [intersecting] * chunk_count,
+                chunks,
+            )
+        )
+    return _reduce_serially(interval_set_class, partials, intersecting)
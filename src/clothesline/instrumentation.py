@@ -0,0 +1,209 @@
+"""
+Opt-in instrumentation of the algebra engine and of serialization.
+
+While a stats collector is installed, each engine call (`combine_intervals`,
+`combine_normalized_pair`...) and each serialization call (`to_dict`,
+`from_dict`, `to_binary`, `from_binary`) reports to it the number of
+input and output intervals, the number of markers swept and the time spent
+in each of its phases ('split', 'project', 'merge' for the engine).
+
+Typical usage:
+
+    with collecting_stats() as stats:
+        ...  # any code using interval sets
+    print(stats.report())
+
+or, from then on, `set_stats_collector(StatsCollector())`.
+
+The installed collector is held in a context variable, so that threads
+and asyncio tasks collecting at the same time do not see each other's
+calls (a new thread starts with no collector; an asyncio task starts
+with the collector of the code creating it).
+
+Any object with a `record` method with the signature of
+`StatsCollector.record` can act as a collector (e.g. to forward the figures
+to a metrics system). With no collector installed, each instrumented call
+pays just a context variable lookup: in particular the engine then runs
+its phases lazily (streaming events from one phase into the next), while,
+to time the phases separately, an instrumented call materializes
+the output of each.
+
+Operations consuming lazy streams (`combine_sorted_streams`) report counts
+only, as their phases interleave with the consumer's own work.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+_active_collector = ContextVar("clothesline_stats_collector", default=None)
+
+
+class OperationStats:
+    """
+    Running totals for one operation: number of calls, input/output
+    intervals and markers over all calls, total and per-phase seconds.
+    """
+
+    __slots__ = (
+        "calls",
+        "input_intervals",
+        "output_intervals",
+        "markers",
+        "seconds",
+        "phase_seconds",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.input_intervals = 0
+        self.output_intervals = 0
+        self.markers = 0
+        self.seconds = 0.0
+        self.phase_seconds = {}
+
+    def to_dict(self):
+        """Return the figures as a plain dict."""
+        return {
+            "calls": self.calls,
+            "input_intervals": self.input_intervals,
+            "output_intervals": self.output_intervals,
+            "markers": self.markers,
+            "seconds": self.seconds,
+            "phase_seconds": dict(self.phase_seconds),
+        }
+
+
+class StatsCollector:
+    """
+    A collector aggregating the reported figures by operation name.
+    The `operations` attribute maps names to OperationStats.
+    """
+
+    def __init__(self):
+        self.operations = {}
+
+    def record(
+        self,
+        operation,
+        input_intervals=0,
+        output_intervals=0,
+        markers=0,
+        seconds=0.0,
+        phase_seconds=None,
+    ):
+        """Account for a single call to an operation."""
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = OperationStats()
+            self.operations[operation] = stats
+        stats.calls += 1
+        stats.input_intervals += input_intervals
+        stats.output_intervals += output_intervals
+        stats.markers += markers
+        stats.seconds += seconds
+        for phase, phase_time in (phase_seconds or {}).items():
+            stats.phase_seconds[phase] = (
+                stats.phase_seconds.get(phase, 0.0) + phase_time
+            )
+
+    def reset(self):
+        """Forget all figures collected so far."""
+        self.operations = {}
+
+    def to_dict(self):
+        """Return all figures as a dict of plain dicts, by operation."""
+        operations = self.operations
+        return {name: stats.to_dict() for name, stats in operations.items()}
+
+    def report(self):
+        """Return a human-readable summary, one line per operation."""
+        lines = []
+        for operation, stats in sorted(self.operations.items()):
+            phases = ", ".join(
+                f"{phase} {phase_time * 1000:.3f}ms"
+                for phase, phase_time in stats.phase_seconds.items()
+            )
+            lines.append(
+                f"{operation}: {stats.calls} calls, "
+                f"{stats.input_intervals} => {stats.output_intervals} "
+                f"intervals, {stats.markers} markers, "
+                f"{stats.seconds * 1000:.3f}ms"
+                + (f" ({phases})" if phases else "")  # noqa: W503
+            )
+        return "\n".join(lines)
+
+
+class OperationProbe:
+    """
+    Measures a single call to an operation, phase by phase,
+    and reports to a collector when done.
+    """
+
+    __slots__ = ("collector", "operation", "started", "lap_started", "phases")
+
+    def __init__(self, collector, operation):
+        self.collector = collector
+        self.operation = operation
+        self.started = perf_counter()
+        self.lap_started = self.started
+        self.phases = {}
+
+    def phase(self, name):
+        """Mark the end of a phase, begun at the end of the previous one."""
+        now = perf_counter()
+        self.phases[name] = now - self.lap_started
+        self.lap_started = now
+
+    def done(self, input_intervals=0, output_intervals=0, markers=0):
+        """Report the call to the collector."""
+        self.collector.record(
+            self.operation,
+            input_intervals=input_intervals,
+            output_intervals=output_intervals,
+            markers=markers,
+            seconds=perf_counter() - self.started,
+            phase_seconds=self.phases,
+        )
+
+
+def start_probe(operation):
+    """
+    Return a probe for a call to an operation if a collector is installed,
+    None otherwise (the cheap, common case).
+    """
+    collector = _active_collector.get()
+    if collector is None:
+        return None
+    return OperationProbe(collector, operation)
+
+
+def get_stats_collector():
+    """Return the installed collector (None if instrumentation is off)."""
+    return _active_collector.get()
+
+
+def set_stats_collector(collector):
+    """
+    Install a collector in the current context (None to switch
+    instrumentation off) and return the previously installed one.
+    """
+    previous = _active_collector.get()
+    _active_collector.set(collector)
+    return previous
+
+
+@contextmanager
+def collecting_stats(collector=None):
+    """
+    Context manager installing a collector (a new StatsCollector
+    if none is given) for the duration of the block, yielding it.
+    The previously installed collector, if any, is restored on exit.
+    """
+    if collector is None:
+        collector = StatsCollector()
+    token = _active_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _active_collector.reset(token)
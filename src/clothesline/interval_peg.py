@@ -10,12 +10,16 @@ level that is not subclassed/enriched. It receives the context it needs
 by outside of this library.
 """
 
+from clothesline.algebra.symbols import PlusInf, MinusInf
 from clothesline.algebra.symbols import is_symbol, x_to_dict, x_from_dict
-from clothesline.algebra.symbols import x_equals
+from clothesline.algebra.symbols import x_equals, x_key
 
 #
 from clothesline.exceptions import InvalidValueError
 
+# symbol -> the excluded peg at that infinity, see IntervalPeg.__new__
+_INTERNED_PEGS = {}
+
 
 class IntervalPeg:
     """
@@ -24,14 +28,39 @@ class IntervalPeg:
 
     Note: greater/lesser inequalities among instances of this class make
     no sense, whereas they do among their 'value' values.
+
+    Pegs are meant to be immutable: in particular, the (excluded) pegs at
+    the infinities are interned, i.e. each is a single shared instance.
     """
 
+    __slots__ = ("value", "included")
+
+    def __new__(cls, value=None, included=False):
+        if included or (value is not PlusInf and value is not MinusInf):
+            return object.__new__(cls)
+        interned_peg = _INTERNED_PEGS.get(value)
+        if interned_peg is None:
+            interned_peg = object.__new__(cls)
+            _INTERNED_PEGS[value] = interned_peg
+        return interned_peg
+
     def __init__(self, value, included):
         self.value = value
         if is_symbol(self.value) and included:
             raise InvalidValueError("Infinities cannot be included in peg")
         self.included = included
 
+    @classmethod
+    def from_trusted_value(cls, value, included):
+        """
+        Create a peg at a finite value, skipping all checks (e.g. when
+        rebuilding the pegs of a valid interval from its flat form).
+        """
+        peg = object.__new__(cls)
+        peg.value = value
+        peg.included = included
+        return peg
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             if x_equals(self.value, other.value):  # noqa: PLR1705
@@ -44,6 +73,29 @@ class IntervalPeg:
     def __hash__(self):
         return hash((self.value, self.included))
 
+    def __reduce__(self):
+        # (going through the constructor keeps the infinity pegs interned)
+        return (self.__class__, (self.value, self.included))
+
+    def begin_position(self):
+        """
+        Sort key for this peg as the begin of an interval.
+
+        Positions refine the ordering of values so that each value x
+        is preceded by a boundary (x, 0) and followed by a boundary (x, 1):
+        an interval is then the half-open range of positions
+        [begin_position, end_position), and inclusion or overlap of intervals
+        reduce to plain comparisons of positions.
+        """
+        return (x_key(self.value), 0 if self.included else 1)
+
+    def end_position(self):
+        """
+        Sort key for this peg as the end of an interval
+        (see `begin_position`).
+        """
+        return (x_key(self.value), 1 if self.included else 0)
+
     def to_dict(self, v_encoder):
         """
         Return a json-encodable representation of this peg.
@@ -19,4 +19,19 @@ class RealDomainMetric:
         """The trivial subtracter."""
         return val1 - val2
 
+    @staticmethod
+    def extension_subtracter(ext1, ext2):
+        """The trivial subtracter, for extensions."""
+        return ext1 - ext2
+
+    @staticmethod
+    def shifter(val, ext):
+        """The trivial adder, for a value and an extension."""
+        return val + ext
+
+    @staticmethod
+    def scaler(ext, factor):
+        """The trivial multiplication."""
+        return ext * factor
+
     zero = 0
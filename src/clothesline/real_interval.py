@@ -2,6 +2,8 @@
 An interval on the usual numeric domain (real numbers).
 """
 
+from functools import lru_cache
+
 from clothesline.base.base_interval import BaseInterval
 
 #
@@ -28,6 +30,8 @@ class RealInterval(BaseInterval):
     the serializable dicts), so pay attention not to change them out of a whim.
     """
 
+    __slots__ = ()
+
     metric = RealDomainMetric
 
     @staticmethod
@@ -41,9 +45,10 @@ class RealInterval(BaseInterval):
         return val  # noqa: PLC0116, PLC0321
 
     serializing_class = "RealInterval"
-    serializing_version = 1
+    serializing_version = 2
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def builder():
         """
         Create and return a "builder" for these intervals.
@@ -56,6 +61,7 @@ class RealInterval(BaseInterval):
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def utils():
         """
         Create an "interval utils" object for these intervals.
@@ -4,6 +4,8 @@ This is the base form, which has no metric imposed and assumes trivial
 serializability of its values.
 """
 
+from functools import lru_cache
+
 from clothesline.base.base_interval_set import BaseIntervalSet
 from clothesline.generic.interval_generic_builder import IntervalGenericBuilder
 from clothesline.generic.interval_set_generic_utils import (
@@ -22,7 +24,8 @@ class RealIntervalSet(BaseIntervalSet):
     Interval sets over the reals are made of "RealInterval" objects,
     which is stated in the `interval_class` member.
     Also the builder() and utils() methods are defined in a standard way,
-    which acts as reference for custom implementations as well.
+    which acts as reference for custom implementations as well: being
+    stateless, builder and utils are created once and then reused.
 
     Note a reference to the class of "intervals making up these
     sets" is configured.
@@ -32,12 +35,15 @@ class RealIntervalSet(BaseIntervalSet):
     to handle future 'schema changes', if there ever will be.
     """
 
+    __slots__ = ()
+
     interval_class = RealInterval
 
     serializing_class = "RealIntervalSet"
-    serializing_version = 1
+    serializing_version = 2
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def builder():
         """
         Create an interval set builder.
@@ -48,6 +54,7 @@ class RealIntervalSet(BaseIntervalSet):
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def utils():
         """
         Create an "utils" object, which offers standard intervalset* creation.
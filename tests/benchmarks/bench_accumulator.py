@@ -0,0 +1,70 @@
+"""
+Benchmark: building a set out of a stream of bookings, one at a time,
+with `acc = acc + booking` versus a mutable accumulator (and, for
+reference, in bulk with `from_bounds`).
+
+Run as:
+    python -m tests.benchmarks.bench_accumulator [SIZE ...]
+"""
+
+import random
+import sys
+
+from clothesline import RealIntervalSet
+from tests.benchmarks.bench_binary_operations import timed
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5]
+# the quadratic way is only timed up to this number of bookings
+# (10**4 bookings already take minutes)
+MAX_CHAINED_SIZE = 10**3
+
+
+def random_bookings(size, seed):
+    """(begin, end) pairs of short bookings, in random order."""
+    rnd = random.Random(seed)
+    bookings = []
+    for _ in range(size):
+        begin = rnd.random() * 10 * size
+        bookings.append((begin, begin + rnd.random() * 5))
+    return bookings
+
+
+def chained(bookings):
+    """Grow the set with one union per booking."""
+    bld = RealIntervalSet.builder()
+    acc = RealIntervalSet.utils().empty()
+    for begin, end in bookings:
+        acc = acc + bld[begin](end)
+    return acc
+
+
+def accumulated(bookings):
+    """Add each booking to an accumulator, then freeze it."""
+    bld = RealIntervalSet.builder()
+    acc = RealIntervalSet.accumulator()
+    for begin, end in bookings:
+        acc.add(bld[begin](end))
+    return acc.freeze()
+
+
+def run(sizes):
+    """Time the three ways of building the set."""
+    header = ("size", "chained", "accumulator", "from_bounds")
+    print("{:>9} {:>10} {:>12} {:>12}".format(*header))
+    for size in sizes:
+        bookings = random_bookings(size, 1)
+        t_acc, result = timed(lambda: accumulated(bookings))  # noqa: B023
+        t_bulk, expected = timed(
+            lambda: RealIntervalSet.from_bounds(bookings),  # noqa: B023
+        )
+        assert result == expected
+        if size <= MAX_CHAINED_SIZE:
+            t_chained, _ = timed(lambda: chained(bookings))  # noqa: B023
+            chained_column = f"{t_chained:>9.3f}s"
+        else:
+            chained_column = f"{'-':>10}"
+        print(f"{size:>9} {chained_column} {t_acc:>11.3f}s {t_bulk:>11.3f}s")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
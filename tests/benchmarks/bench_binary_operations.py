@@ -0,0 +1,107 @@
+"""
+Benchmark: binary operations between normalized interval sets,
+timing the merge-walk used by the interval sets against the original
+engine (`cmp_to_key` sort of the markers and per-marker dicts, see
+`reference_engine`) and against the current general combiner.
+
+Most of the gain over the original engine comes from the changes shared
+by both current paths (native sort keys, event-based sweep): the
+merge-walk itself, which just skips the sort of the events, is roughly
+on par with the current `combine_intervals` and is kept as the path
+taking two normalized operands without re-sorting them.
+
+Run as:
+    python -m tests.benchmarks.bench_binary_operations [SIZE ...]
+"""
+
+import gc
+import random
+import sys
+import time
+
+from clothesline import RealIntervalSet
+from clothesline.algebra import combine_intervals, combine_normalized_pair
+from clothesline.real_interval import RealInterval
+from tests.benchmarks.reference_engine import original_combine_intervals
+
+DEFAULT_SIZES = [10**5, 10**6]
+
+COMBINERS = {
+    "union": lambda q: q[0] or q[1],
+    "intersect": lambda q: q[0] and q[1],
+    "difference": lambda q: q[0] and not q[1],
+    "xor": lambda q: q[0] ^ q[1],
+}
+
+
+def random_normalized_set(size, seed):
+    """A normalized set of (about) `size` intervals."""
+    rnd = random.Random(seed)
+    utils = RealInterval.utils()
+    intervals = []
+    position = 0.0
+    for _ in range(size):
+        begin = position + rnd.random() + 0.01
+        end = begin + rnd.random() + 0.01
+        intervals.append(
+            utils.interval(begin, rnd.random() < 0.5, end, rnd.random() < 0.5)
+        )
+        position = end
+    return RealIntervalSet.from_normalized(intervals)
+
+
+def timed(function):
+    """Return (elapsed seconds, result) for a call to function."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = function()
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def run(sizes):
+    """Time the three combine paths for each size and operation."""
+    # (the last two columns: speedup of the merge-walk over each)
+    header = ("size", "operation", "original", "general", "merge", "x", "x")
+    print("{:>9} {:>11} {:>10} {:>10} {:>10} {:>6} {:>6}".format(*header))
+    for size in sizes:
+        set_a = random_normalized_set(size, seed=1)
+        set_b = random_normalized_set(size, seed=2)
+        list_a = list(set_a.intervals())
+        list_b = list(set_b.intervals())
+        for op_name, combiner in COMBINERS.items():
+            t_original, r_original = timed(
+                lambda: original_combine_intervals(  # noqa: B023
+                    RealInterval,
+                    [list_a, list_b],
+                    combiner_function=combiner,  # noqa: B023
+                )
+            )
+            t_general, r_general = timed(
+                lambda: combine_intervals(  # noqa: B023
+                    RealInterval,
+                    [list_a, list_b],
+                    combiner_function=combiner,  # noqa: B023
+                )
+            )
+            t_merge, r_merge = timed(
+                lambda: combine_normalized_pair(  # noqa: B023
+                    RealInterval,
+                    list_a,
+                    list_b,
+                    combiner_function=combiner,  # noqa: B023
+                )
+            )
+            assert r_original == r_general == r_merge
+            print(
+                f"{size:>9} {op_name:>11} {t_original:>9.3f}s "
+                f"{t_general:>9.3f}s {t_merge:>9.3f}s "
+                f"{t_original / t_merge:>5.2f}x {t_general / t_merge:>5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
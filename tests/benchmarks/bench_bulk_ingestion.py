@@ -0,0 +1,61 @@
+"""
+Benchmark: building a DatetimeIntervalSet out of many (start, end) rows,
+either through intervals and the constructor or in bulk with `from_bounds`
+(on rows sorted by start, or shuffled).
+
+Run as:
+    python -m tests.benchmarks.bench_bulk_ingestion [SIZE ...]
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+
+from clothesline import DatetimeIntervalSet
+from clothesline.interval_peg import IntervalPeg
+from tests.benchmarks.bench_binary_operations import timed
+
+DEFAULT_SIZES = [10**4, 10**5, 10**6]
+
+
+def event_rows(size, seed):
+    """(start, end) rows of overlapping 'events', sorted by start."""
+    rnd = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    rows = []
+    for _ in range(size):
+        start += timedelta(seconds=rnd.randint(0, 600))
+        rows.append((start, start + timedelta(seconds=rnd.randint(1, 900))))
+    return rows
+
+
+def run(sizes):
+    """Time the constructor against bulk ingestion."""
+    interval_class = DatetimeIntervalSet.interval_class
+    header = ("size", "constructor", "bulk sorted", "bulk shuffled", "x")
+    print("{:>9} {:>12} {:>12} {:>14} {:>6}".format(*header))
+    for size in sizes:
+        rows = event_rows(size, seed=1)
+        shuffled = list(rows)
+        random.Random(2).shuffle(shuffled)
+        t_constructor, r_constructor = timed(
+            lambda: DatetimeIntervalSet(
+                interval_class(IntervalPeg(bgn, True), IntervalPeg(end, False))
+                for bgn, end in shuffled  # noqa: B023
+            )
+        )
+        t_sorted, r_sorted = timed(
+            lambda: DatetimeIntervalSet.from_bounds(rows)  # noqa: B023
+        )
+        t_shuffled, r_shuffled = timed(
+            lambda: DatetimeIntervalSet.from_bounds(shuffled)  # noqa: B023
+        )
+        assert r_constructor == r_sorted == r_shuffled
+        print(
+            f"{size:>9} {t_constructor:>11.3f}s {t_sorted:>11.3f}s "
+            f"{t_shuffled:>13.3f}s {t_constructor / t_shuffled:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
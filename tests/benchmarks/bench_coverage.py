@@ -0,0 +1,57 @@
+"""
+Benchmark: coverage-depth questions over many interval sets, answered
+with a single sweep (coverage profile) versus one n-ary operation
+per depth threshold.
+
+Run as:
+    python -m tests.benchmarks.bench_coverage [SET_COUNT ...]
+"""
+
+import random
+import sys
+
+from clothesline import RealIntervalSet
+from tests.benchmarks.bench_binary_operations import timed
+
+DEFAULT_SET_COUNTS = [10**2, 10**3, 10**4]
+INTERVALS_PER_SET = 10
+
+
+def random_sets(set_count, seed):
+    """Many small sets, overlapping each other over a common span."""
+    rnd = random.Random(seed)
+    builder = RealIntervalSet.builder()
+    span = set_count * 10
+    sets = []
+    for _ in range(set_count):
+        parts = []
+        for _ in range(INTERVALS_PER_SET):
+            begin = rnd.random() * span
+            parts.append(builder[begin](begin + rnd.random() * 100))
+        sets.append(RealIntervalSet.union_all(parts))
+    return sets
+
+
+def run(set_counts):
+    """Time the profile against repeated at_least calls."""
+    header = ("sets", "profile", "max_depth", "at_least(k)", "all k")
+    print("{:>9} {:>10} {:>10} {:>12} {:>10}".format(*header))
+    for set_count in set_counts:
+        sets = random_sets(set_count, 1)
+        t_profile, profile = timed(lambda: RealIntervalSet.coverage(sets))
+        t_max, max_depth = timed(profile.max_depth)
+        t_at_least, _ = timed(
+            lambda: RealIntervalSet.at_least(sets, max_depth),  # noqa: B023
+        )
+        # 'time above k' for each k, from the profile:
+        t_all_k, _ = timed(profile.extension_by_depth)
+        print(
+            f"{set_count:>9} {t_profile:>9.3f}s {t_max:>9.3f}s "
+            f"{t_at_least:>11.3f}s {t_all_k:>9.3f}s"
+            f"   (max depth {max_depth}: {max_depth} at_least calls"
+            f" would take ~{t_at_least * max_depth:.3f}s)"
+        )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SET_COUNTS)
@@ -0,0 +1,74 @@
+"""
+Benchmark: datetime interval sets holding `datetime` objects versus
+holding integer epoch microseconds (EpochDatetimeIntervalSet).
+
+Run as:
+    python -m tests.benchmarks.bench_datetime_epoch [SIZE ...]
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+
+from clothesline import DatetimeIntervalSet, EpochDatetimeIntervalSet
+from tests.benchmarks.bench_binary_operations import timed
+
+DEFAULT_SIZES = [10**4, 10**5]
+
+START = datetime(2020, 1, 1)
+
+
+def random_datetime_set(size, seed, set_class):
+    """A normalized set of (about) `size` intervals, of the given class."""
+    rnd = random.Random(seed)
+    utils = set_class.interval_class.utils()
+    intervals = []
+    position = START
+    for _ in range(size):
+        begin = position + timedelta(seconds=rnd.randint(1, 3600))
+        end = begin + timedelta(seconds=rnd.randint(1, 3600))
+        intervals.append(utils.interval(begin, True, end, False))
+        position = end
+    return set_class.from_normalized(intervals)
+
+
+def run(sizes):
+    """Time a few operations on the two representations."""
+    header = ("size", "operation", "datetime", "epoch", "x")
+    print("{:>9} {:>13} {:>10} {:>10} {:>6}".format(*header))
+    for size in sizes:
+        probes = sorted(
+            START + timedelta(seconds=random.Random(3).randint(0, size * 3600))
+            for _ in range(size)
+        )
+        timings = {}
+        for set_class in (DatetimeIntervalSet, EpochDatetimeIntervalSet):
+            set_a = random_datetime_set(size, 1, set_class)
+            set_b = random_datetime_set(size, 2, set_class)
+            timings[set_class] = {
+                "union": timed(lambda: set_a.union(set_b))[0],  # noqa: B023
+                "intersect": timed(
+                    lambda: set_a.intersect(set_b),  # noqa: B023
+                )[0],
+                "contains_many": timed(
+                    lambda: set_a.contains_many(probes),  # noqa: B023
+                )[0],
+                "extension": timed(
+                    lambda: set_a.extension(),  # noqa: B023
+                )[0],
+                "to/from_dict": timed(
+                    lambda: set_class.utils().from_dict(  # noqa: B023
+                        set_a.to_dict(),  # noqa: B023
+                    )
+                )[0],
+            }
+        for op_name, t_datetime in timings[DatetimeIntervalSet].items():
+            t_epoch = timings[EpochDatetimeIntervalSet][op_name]
+            print(
+                f"{size:>9} {op_name:>13} {t_datetime:>9.3f}s "
+                f"{t_epoch:>9.3f}s {t_datetime / t_epoch:>5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,52 @@
+"""
+Benchmark: memory footprint of interval sets, in bytes per interval
+(as traced by tracemalloc while building the set).
+
+Run as:
+    python -m tests.benchmarks.bench_memory [SIZE ...]
+"""
+
+import random
+import sys
+import tracemalloc
+
+from clothesline import RealIntervalSet
+from clothesline.real_interval import RealInterval
+
+DEFAULT_SIZES = [10**4, 10**5, 10**6]
+
+
+def build_set(size, seed=1):
+    """A normalized set of `size` finite intervals, plus a high slice."""
+    rnd = random.Random(seed)
+    utils = RealInterval.utils()
+    intervals = []
+    position = 0.0
+    for _ in range(size):
+        begin = position + rnd.random() + 0.01
+        end = begin + rnd.random() + 0.01
+        intervals.append(utils.closed(begin, end))
+        position = end
+    intervals.append(utils.high_slice(position + 1))
+    return RealIntervalSet.from_normalized(intervals)
+
+
+def measure(size):
+    """Bytes per interval retained by a set of the given size."""
+    tracemalloc.start()
+    interval_set = build_set(size)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del interval_set
+    return retained / (size + 1)
+
+
+def run(sizes):
+    """Measure each size."""
+    print("{:>9} {:>16}".format("size", "bytes/interval"))
+    for size in sizes:
+        print(f"{size:>9} {measure(size):>16.1f}")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,53 @@
+"""
+Benchmark: union of a large collection of interval sets, in a single
+process versus split among an increasing number of worker processes.
+
+Run as:
+    python -m tests.benchmarks.bench_parallel_reduction [SET_COUNT ...]
+"""
+
+import os
+import sys
+
+from clothesline import RealIntervalSet
+from tests.benchmarks.bench_binary_operations import timed
+from tests.benchmarks.bench_coverage import random_sets
+
+DEFAULT_SET_COUNTS = [10**4, 10**5]
+
+
+def worker_counts():
+    """1, 2, 4, ... up to the number of available cores."""
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] < cores:
+        counts.append(cores)
+    return counts
+
+
+def run(set_counts):
+    """Time union_all for each collection size and number of workers."""
+    header = ("sets", "workers", "time", "speedup")
+    print("{:>9} {:>8} {:>10} {:>8}".format(*header))
+    for set_count in set_counts:
+        sets = random_sets(set_count, 1)
+        t_serial, expected = timed(lambda: RealIntervalSet.union_all(sets))
+        print(f"{set_count:>9} {'-':>8} {t_serial:>9.3f}s {1:>7.2f}x")
+        for workers in worker_counts():
+            t_parallel, result = timed(
+                lambda: RealIntervalSet.union_all(  # noqa: B023
+                    sets,  # noqa: B023
+                    workers=workers,  # noqa: B023
+                )
+            )
+            assert result == expected
+            print(
+                f"{set_count:>9} {workers:>8} {t_parallel:>9.3f}s "
+                f"{t_serial / t_parallel:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SET_COUNTS)
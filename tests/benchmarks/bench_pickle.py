@@ -0,0 +1,76 @@
+"""
+Benchmark: pickle size and round-trip time of interval sets, with their
+flat pickled form versus the default pickling of the objects (emulated by
+temporarily removing the `__reduce__` methods), with the dict and binary
+serializations for reference.
+
+Run as:
+    python -m tests.benchmarks.bench_pickle [SIZE ...]
+"""
+
+import pickle
+import sys
+from contextlib import contextmanager
+
+from clothesline import RealIntervalSet
+from clothesline.base.base_interval import BaseInterval
+from clothesline.base.base_interval_set import BaseIntervalSet
+from clothesline.interval_peg import IntervalPeg
+from tests.benchmarks.bench_binary_operations import (
+    random_normalized_set,
+    timed,
+)
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5]
+
+
+@contextmanager
+def default_pickling():
+    """Pickle with the default, per-object protocol within this block."""
+    classes = [IntervalPeg, BaseInterval, BaseIntervalSet]
+    reducers = [klass.__dict__["__reduce__"] for klass in classes]
+    for klass in classes:
+        del klass.__reduce__
+    try:
+        yield
+    finally:
+        for klass, reducer in zip(classes, reducers):
+            klass.__reduce__ = reducer
+
+
+def round_trip(iset):
+    """Size of the pickle, dump time and load time."""
+    t_dump, dumped = timed(lambda: pickle.dumps(iset))
+    t_load, restored = timed(lambda: pickle.loads(dumped))
+    assert restored == iset
+    return len(dumped), t_dump, t_load
+
+
+def run(sizes):
+    """Sizes and round-trip times for each form."""
+    header = ("size", "form", "bytes", "dump", "load")
+    print("{:>9} {:>10} {:>10} {:>10} {:>10}".format(*header))
+    utils = RealIntervalSet.utils()
+    for size in sizes:
+        iset = random_normalized_set(size, 1)
+        with default_pickling():
+            results = {"default": round_trip(iset)}
+        results["flat"] = round_trip(iset)
+        # reference: the other serializations (pickled, for the dict)
+        t_dump, dumped = timed(lambda: pickle.dumps(iset.to_dict()))
+        t_load, _ = timed(
+            lambda: utils.from_dict(pickle.loads(dumped)),  # noqa: B023
+        )
+        results["dict"] = (len(dumped), t_dump, t_load)
+        t_dump, dumped = timed(iset.to_binary)
+        t_load, _ = timed(lambda: utils.from_binary(dumped))  # noqa: B023
+        results["binary"] = (len(dumped), t_dump, t_load)
+        for form, (n_bytes, t_dump, t_load) in results.items():
+            print(
+                f"{size:>9} {form:>10} {n_bytes:>10} "
+                f"{t_dump:>9.4f}s {t_load:>9.4f}s"
+            )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
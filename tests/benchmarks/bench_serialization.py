@@ -0,0 +1,46 @@
+"""
+Benchmark: dict serialization of interval sets, comparing the nested
+(v1) and the compact (v2) representations in encode/decode throughput
+and JSON payload size.
+
+Run as:
+    python -m tests.benchmarks.bench_serialization [SIZE ...]
+"""
+
+import json
+import sys
+
+from clothesline import RealIntervalSet
+from tests.benchmarks.bench_binary_operations import (
+    random_normalized_set,
+    timed,
+)
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5]
+
+
+def run(sizes):
+    """Time to_dict/from_dict and measure the JSON size per version."""
+    utils = RealIntervalSet.utils()
+    header = ("size", "version", "encode", "decode", "ints/s", "bytes/int")
+    print("{:>9} {:>7} {:>10} {:>10} {:>10} {:>9}".format(*header))
+    for size in sizes:
+        interval_set = random_normalized_set(size, seed=1)
+        for version in [1, 2]:
+            t_encode, is_dict = timed(
+                lambda: interval_set.to_dict(version)  # noqa: B023
+            )
+            t_decode, restored = timed(
+                lambda: utils.from_dict(is_dict),  # noqa: B023
+            )
+            assert restored == interval_set
+            payload = len(json.dumps(is_dict))
+            throughput = size / (t_encode + t_decode)
+            print(
+                f"{size:>9} {version:>7} {t_encode:>9.3f}s {t_decode:>9.3f}s "
+                f"{throughput:>10.0f} {payload / size:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
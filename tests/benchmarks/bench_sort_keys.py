@@ -0,0 +1,53 @@
+"""
+Micro-benchmark: sorting values-and-symbols with the `x_cmp` comparison
+function versus the `x_key` key function.
+
+Run as:
+    python -m tests.benchmarks.bench_sort_keys [SIZE ...]
+"""
+
+from functools import cmp_to_key
+import random
+import sys
+import timeit
+
+from clothesline.algebra.symbols import PlusInf, MinusInf, x_cmp, x_key
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6]
+
+
+def random_values(size, seed=1):
+    """Random floats, with a sprinkle of infinities."""
+    rnd = random.Random(seed)
+    values = [rnd.random() for _ in range(size)]
+    for index in range(0, size, 100):
+        values[index] = PlusInf if index % 200 else MinusInf
+    return values
+
+
+def best_time(function, number):
+    """Best-of-three time per call of function."""
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def run(sizes):
+    """Time the two sorts for each size."""
+    header = ("size", "cmp_to_key", "x_key", "x")
+    print("{:>9} {:>11} {:>11} {:>6}".format(*header))
+    for size in sizes:
+        values = random_values(size)
+        number = max(1, 10**5 // size)
+        t_cmp = best_time(
+            lambda: sorted(values, key=cmp_to_key(x_cmp)),  # noqa: B023
+            number,
+        )
+        t_key = best_time(
+            lambda: sorted(values, key=x_key),  # noqa: B023
+            number,
+        )
+        ratio = t_cmp / t_key
+        print(f"{size:>9} {t_cmp:>10.4f}s {t_key:>10.4f}s {ratio:>5.1f}x")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
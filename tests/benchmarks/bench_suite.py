@@ -0,0 +1,291 @@
+"""
+Benchmark suite: scaling of the main operations on interval sets
+(normalization, binary operations, membership, extension, complement,
+serialization, builders) for the Real, Datetime and String kits,
+over several distributions of intervals.
+
+For each kit, distribution and operation, the time is measured at
+increasing sizes and the empirical exponent of the growth between
+consecutive sizes is reported (1 for linear, ~1.1 for n log n, 2 for
+quadratic). Exponents above a threshold, at sizes large enough for them
+to be meaningful, are flagged and make the run exit with a nonzero status.
+
+Run as:
+    python -m tests.benchmarks.bench_suite [SIZE ...] [--kit KIT]
+        [--distribution DISTRIBUTION] [--operation OPERATION]
+
+(default sizes: 10 to 10^5; e.g. add 1000000 for the largest size).
+"""
+
+import argparse
+import math
+import random
+import sys
+from datetime import datetime, timedelta
+
+from clothesline import DatetimeIntervalSet, RealIntervalSet
+from clothesline.enriched.string_interval_set import StringIntervalSet
+from clothesline.interval_peg import IntervalPeg
+from tests.benchmarks.bench_binary_operations import timed
+
+DEFAULT_SIZES = [10, 100, 1000, 10**4, 10**5]
+
+# exponents are only judged from this size on (smaller ones are noisy)
+MIN_JUDGED_SIZE = 1000
+MAX_EXPONENT = 1.5
+# small sizes are repeated until the total time reaches this many seconds
+MIN_TOTAL_TIME = 0.05
+
+_START = datetime(2020, 1, 1)
+
+KITS = {
+    "real": (RealIntervalSet, lambda x: x),
+    "datetime": (
+        DatetimeIntervalSet,
+        lambda x: _START + timedelta(seconds=x),
+    ),
+    # fixed-width strings sort like the numbers they spell:
+    "string": (StringIntervalSet, lambda x: f"{x:020.6f}"),
+}
+
+
+def realistic_rows(size, rnd):
+    """Mostly disjoint intervals, like a calendar, in random order."""
+    rows = []
+    position = 0.0
+    for _ in range(size):
+        begin = position + rnd.random() * 2
+        end = begin + rnd.random() * 2 + 0.001
+        rows.append((begin, end, rnd.random() < 0.5, rnd.random() < 0.5))
+        position = end
+    rnd.shuffle(rows)
+    return rows
+
+
+def overlapping_rows(size, rnd):
+    """Heavily overlapping, long-spanning intervals."""
+    rows = []
+    for _ in range(size):
+        begin = rnd.random() * size
+        end = begin + rnd.random() * size / 2 + 0.001
+        rows.append((begin, end, rnd.random() < 0.5, rnd.random() < 0.5))
+    return rows
+
+
+def nested_rows(size, rnd):
+    """Intervals all nested into each other, in random order."""
+    span = 2 * size
+    rows = [(float(i), float(span - i), True, False) for i in range(size)]
+    rnd.shuffle(rows)
+    return rows
+
+
+def adjacent_rows(size, rnd):
+    """Touching intervals, with inclusions making them merge or not."""
+    rows = [
+        (
+            float(index),
+            float(index + 1),
+            rnd.random() < 0.5,
+            rnd.random() < 0.5,
+        )
+        for index in range(size)
+    ]
+    rnd.shuffle(rows)
+    return rows
+
+
+def coinciding_rows(size, rnd):
+    """
+    Short intervals on a coarse grid: boundaries of different intervals
+    (and of the two operands of binary operations) often coincide.
+    """
+    rows = []
+    for index in range(size):
+        begin = float(2 * index + rnd.randint(0, 1))
+        end = begin + rnd.randint(0, 2)
+        included = end == begin or rnd.random() < 0.5
+        rows.append((begin, end, included, included))
+    return rows
+
+
+DISTRIBUTIONS = {
+    "realistic": realistic_rows,
+    "coinciding": coinciding_rows,
+    "overlapping": overlapping_rows,
+    "nested": nested_rows,
+    "adjacent": adjacent_rows,
+}
+
+
+def make_intervals(kit, rows):
+    """Turn (begin, end, included, included) float rows into intervals."""
+    set_class, to_value = KITS[kit]
+    interval_class = set_class.interval_class
+    return [
+        interval_class(
+            IntervalPeg(to_value(begin), begin_included),
+            IntervalPeg(to_value(end), end_included),
+        )
+        for begin, end, begin_included, end_included in rows
+    ]
+
+
+def _probes(kit, size, rnd):
+    _, to_value = KITS[kit]
+    return sorted(to_value(rnd.random() * 2 * size) for _ in range(size))
+
+
+def prepare(kit, distribution, size):
+    """Inputs for all operations on a kit, distribution and size."""
+    rnd = random.Random(size)
+    set_class, to_value = KITS[kit]
+    rows_a = DISTRIBUTIONS[distribution](size, rnd)
+    rows_b = DISTRIBUTIONS[distribution](size, rnd)
+    intervals_a = make_intervals(kit, rows_a)
+    set_a = set_class(intervals_a)
+    set_b = set_class(make_intervals(kit, rows_b))
+    return {
+        "set_class": set_class,
+        "to_value": to_value,
+        "rows": rows_a,
+        "intervals": intervals_a,
+        "set_a": set_a,
+        "set_b": set_b,
+        "probes": _probes(kit, size, rnd),
+        "dict_a": set_a.to_dict() if kit != "string" else None,
+    }
+
+
+def _build_with_builder(inputs):
+    builder = inputs["set_class"].builder()
+    to_value = inputs["to_value"]
+    rows = inputs["rows"]
+    return [builder[to_value(beg)][to_value(end)] for beg, end, _, _ in rows]
+
+
+# operation name -> (function of the prepared inputs, kits it applies to)
+OPERATIONS = {
+    "normalize": (lambda inp: inp["set_class"](inp["intervals"]), None),
+    "union": (lambda inp: inp["set_a"].union(inp["set_b"]), None),
+    "intersect": (lambda inp: inp["set_a"].intersect(inp["set_b"]), None),
+    "difference": (lambda inp: inp["set_a"].difference(inp["set_b"]), None),
+    "xor": (lambda inp: inp["set_a"].xor(inp["set_b"]), None),
+    "complement": (lambda inp: inp["set_a"].complement(), None),
+    "contains": (
+        lambda inp: [inp["set_a"].contains(val) for val in inp["probes"]],
+        None,
+    ),
+    "contains_many": (
+        lambda inp: inp["set_a"].contains_many(inp["probes"]),
+        None,
+    ),
+    # a fresh copy each time, not to measure the cached value:
+    "extension": (
+        lambda inp: inp["set_class"]
+        .from_normalized(inp["set_a"].intervals())
+        .extension(),
+        {"real", "datetime"},
+    ),
+    "to_dict": (lambda inp: inp["set_a"].to_dict(), {"real", "datetime"}),
+    "from_dict": (
+        lambda inp: inp["set_class"].utils().from_dict(inp["dict_a"]),
+        {"real", "datetime"},
+    ),
+    "builder": (_build_with_builder, None),
+}
+
+
+def measure(function, inputs):
+    """Seconds per call, repeating the call for short timings."""
+    elapsed, _ = timed(lambda: function(inputs))
+    repeats = 1
+    while elapsed * repeats < MIN_TOTAL_TIME and repeats < 1000:
+        repeats *= 10
+        elapsed = min(
+            elapsed,
+            timed(lambda: [function(inputs) for _ in range(repeats)])[0]
+            / repeats,  # noqa: W503
+        )
+    return elapsed
+
+
+def exponent(size1, time1, size2, time2):
+    """Empirical exponent k of a time growing as size**k."""
+    return math.log(time2 / time1) / math.log(size2 / size1)
+
+
+def scaling(function, inputs_by_size):
+    """
+    Time a function on inputs of increasing size. Return the timings,
+    the exponents between consecutive sizes and the sizes flagged
+    for a too steep growth.
+    """
+    sizes = sorted(inputs_by_size)
+    timings = [measure(function, inputs_by_size[size]) for size in sizes]
+    steps = zip(sizes, timings, sizes[1:], timings[1:])
+    exponents = [exponent(*step) for step in steps]
+    flagged_sizes = [
+        size
+        for size, growth in zip(sizes[1:], exponents)
+        if growth > MAX_EXPONENT and size >= MIN_JUDGED_SIZE
+    ]
+    return timings, exponents, flagged_sizes
+
+
+def run(sizes, kits=None, distributions=None, operations=None):
+    """
+    Run the suite, printing a scaling table per kit and distribution.
+    Return the list of flagged (kit, distribution, operation, size) cases.
+    """
+    sizes = sorted(sizes)
+    flagged = []
+    for kit in kits or KITS:
+        for dist in distributions or DISTRIBUTIONS:
+            print(f"\n== {kit} / {dist}")
+            size_columns = " ".join(f"{size:>10}" for size in sizes)
+            print(f"{'operation':>14} {size_columns}   exponents")
+            inputs_by_size = {size: prepare(kit, dist, size) for size in sizes}
+            for op_name in operations or OPERATIONS:
+                function, op_kits = OPERATIONS[op_name]
+                if op_kits is not None and kit not in op_kits:
+                    continue
+                timings, exponents, flagged_sizes = scaling(
+                    function,
+                    inputs_by_size,
+                )
+                time_columns = " ".join(f"{t * 1000:>8.3f}ms" for t in timings)
+                exp_columns = " ".join(f"{growth:.2f}" for growth in exponents)
+                mark = "  <== too steep" if flagged_sizes else ""
+                print(f"{op_name:>14} {time_columns}   {exp_columns}{mark}")
+                case = (kit, dist, op_name)
+                flagged.extend(case + (size,) for size in flagged_sizes)
+    if flagged:
+        print("\nSuperlinear scaling detected:")
+        for case in flagged:
+            print("  {} / {} / {} at size {}".format(*case))
+    return flagged
+
+
+def main(argv):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--kit", action="append", choices=list(KITS))
+    parser.add_argument(
+        "--distribution",
+        action="append",
+        choices=list(DISTRIBUTIONS),
+    )
+    parser.add_argument(
+        "--operation",
+        action="append",
+        choices=list(OPERATIONS),
+    )
+    args = parser.parse_args(argv)
+    flagged = run(args.sizes, args.kit, args.distribution, args.operation)
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""
+Benchmark: windowed queries on a large set, answered by intersecting
+with the window versus through the cached cumulative-extension index.
+
+Run as:
+    python -m tests.benchmarks.bench_windowed_queries [SIZE ...]
+"""
+
+import random
+import sys
+
+from clothesline import RealIntervalSet
+from tests.benchmarks.bench_binary_operations import (
+    random_normalized_set,
+    timed,
+)
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5]
+QUERIES = 100
+
+
+def random_windows(size, seed):
+    """Windows of random position and width over the span of a set."""
+    rnd = random.Random(seed)
+    windows = []
+    for _ in range(QUERIES):
+        begin = rnd.random() * 2 * size
+        windows.append((begin, begin + rnd.random() * size / 10))
+    return windows
+
+
+def walk_to_measure(iset, measure):
+    """Point at a measure, walking along the intervals (the old way)."""
+    accumulated = 0
+    for interval in iset.intervals():
+        extension = interval.extension()
+        if accumulated + extension >= measure:
+            return interval.begin.value + (measure - accumulated)
+        accumulated += extension
+    return None
+
+
+def run(sizes):
+    """Time QUERIES queries of each kind, the old way and the indexed way."""
+    header = ("size", "query", "old way", "indexed", "x")
+    print("{:>9} {:>18} {:>10} {:>10} {:>8}".format(*header))
+    utils = RealIntervalSet.utils()
+    for size in sizes:
+        iset = random_normalized_set(size, 1)
+        windows = random_windows(size, 2)
+        ends = [window[1] for window in windows]
+        total = iset.extension()
+        measures = [total * begin / (2 * size) for begin, _ in windows]
+        queries = {
+            "extension_within": (
+                lambda window: iset.intersect(  # noqa: B023
+                    utils.closed(*window)
+                ).extension(),
+                lambda window: iset.extension_within(*window),  # noqa: B023
+                windows,
+            ),
+            "measure_before": (
+                lambda end: iset.intersect(  # noqa: B023
+                    utils.low_slice(end)
+                ).extension(),
+                iset.measure_before,
+                ends,
+            ),
+            "point_at_measure": (
+                lambda measure: walk_to_measure(iset, measure),  # noqa: B023
+                iset.point_at_measure,
+                measures,
+            ),
+        }
+        for query_name, (old_way, indexed, arguments) in queries.items():
+            t_old, _ = timed(lambda: [old_way(arg) for arg in arguments])
+            # (the first query also pays for building the index)
+            iset._init_caches()
+            t_new, _ = timed(lambda: [indexed(arg) for arg in arguments])
+            print(
+                f"{size:>9} {query_name:>18} {t_old:>9.3f}s "
+                f"{t_new:>9.3f}s {t_old / t_new:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
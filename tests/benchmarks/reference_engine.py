@@ -0,0 +1,133 @@
+"""
+The algebra engine as it was before the event-based sweep, the native
+sort keys and the merge-walk, kept as a reference for benchmarks.
+"""
+
+from functools import cmp_to_key
+
+from clothesline.algebra.symbols import x_cmp
+from clothesline.exceptions import InvalidCombineEndState
+from clothesline.interval_peg import IntervalPeg
+
+
+def original_combine_intervals(  # noqa: PLR0914, PLR0912
+    int_maker,
+    interval_iterables,
+    combiner_function=lambda q: q[0],
+):
+    """
+    `combine_intervals` as originally implemented: markers sorted with
+    `cmp_to_key(x_cmp)` and per-marker dicts of the inclusion flags
+    of each operand, filled by looping over the markers spanned by
+    each interval.
+    """
+
+    interval_lists = [
+        list(interval_ite) for interval_ite in interval_iterables
+    ]  # noqa: E501
+    n_i_lists = len(interval_lists)
+
+    # 1. 'split' phase
+    markers = sorted(
+        set(
+            peg.value
+            for i_list in interval_lists
+            for interval in i_list
+            for peg in interval.pegs()
+        ),
+        key=cmp_to_key(x_cmp),
+    )
+    m_index_map = {val: index for index, val in enumerate(markers)}
+
+    point_included = {marker: {} for marker in markers}
+    range_included = {marker: {} for marker in markers}
+    # looping labeling to be tweaked for multi-source case
+    for i_list_index, i_list in enumerate(interval_lists):
+        for interval in i_list:
+            # ends pointlike status
+            for peg in interval.pegs():
+                if peg.included:
+                    point_included[peg.value][i_list_index] = True
+            # internal pointlike values, if any
+            begin_peg = interval.begin
+            end_peg = interval.end
+            begin_m_index = m_index_map[begin_peg.value]
+            end_m_index = m_index_map[end_peg.value]
+            for internal_m_index in range(begin_m_index + 1, end_m_index):
+                internal_marker = markers[internal_m_index]
+                point_included[internal_marker][i_list_index] = True
+            # ranges (first + internal if any)
+            for m_index in range(begin_m_index, end_m_index):
+                marker = markers[m_index]
+                range_included[marker][i_list_index] = True
+
+    # 2. 'project' phase, using combiner_function
+    point_merged = {marker: False for marker in markers}
+    range_merged = {marker: False for marker in markers}
+    for marker in markers:
+        point_merged[marker] = combiner_function(
+            [
+                point_included[marker].get(i_list_index, False)
+                for i_list_index in range(n_i_lists)
+            ]
+        )
+    for marker in markers[:-1]:
+        range_merged[marker] = combiner_function(
+            [
+                range_included[marker].get(i_list_index, False)
+                for i_list_index in range(n_i_lists)
+            ]
+        )
+
+    # # 3. 'merge' phase
+    final_intervals = []
+    i_buffer = []  # a mutable state
+    for m_index, marker in enumerate(markers):
+        next_is_range = range_merged[marker]
+        point_included = point_merged[marker]
+        if not i_buffer:
+            if next_is_range:
+                i_buffer = [(marker, point_included), None]
+            else:
+                if point_included:
+                    # this point, isolated, is a zero-length interval:
+                    final_intervals.append(
+                        int_maker(
+                            IntervalPeg(marker, True),
+                            IntervalPeg(marker, True),
+                        )
+                    )
+                else:
+                    # no-op
+                    pass
+        else:
+            # i_buffer exists already
+            if next_is_range:
+                if point_included:
+                    # write/extend current buffer's endpoint
+                    i_buffer[1] = (marker, point_included)
+                else:
+                    # a hole: finalize/flush buffer and re-init it at once
+                    i_buffer[1] = (marker, point_included)
+                    final_intervals.append(
+                        int_maker(
+                            IntervalPeg(i_buffer[0][0], i_buffer[0][1]),
+                            IntervalPeg(i_buffer[1][0], i_buffer[1][1]),
+                        )
+                    )
+                    i_buffer = [(marker, point_included), None]
+            else:
+                # end of the interval being built: flush and reset buffer
+                i_buffer[1] = (marker, point_included)
+                final_intervals.append(
+                    int_maker(
+                        IntervalPeg(i_buffer[0][0], i_buffer[0][1]),
+                        IntervalPeg(i_buffer[1][0], i_buffer[1][1]),
+                    )
+                )
+                i_buffer = []
+    #
+    if i_buffer:
+        raise InvalidCombineEndState("Inconsistent end state in merge phase")
+
+    return final_intervals
@@ -6,6 +6,7 @@ import unittest
 from datetime import datetime
 
 from clothesline import DatetimeIntervalSet
+from clothesline.exceptions import InvalidValueError
 from clothesline.enriched.datetime_interval_set import DatetimeInterval
 
 
@@ -81,6 +82,48 @@ class TestDatetimeClasses(unittest.TestCase):
             + self.isb[date2][date2],  # noqa: E501, W503
         )
 
+    def test_bulk_ingestion(self):
+        """from_bounds and from_columns"""
+        dates = [datetime(2010, month, 1) for month in range(1, 8)]
+        rows = [
+            (dates[4], dates[5]),
+            (dates[0], dates[2]),
+            (dates[1], dates[3]),
+            (dates[3], dates[4]),
+            (dates[6], dates[6]),
+        ]
+        expected = self.isb[dates[0]](dates[5]) + self.isu.point(dates[6])
+        with self.assertRaises(InvalidValueError):
+            DatetimeIntervalSet.from_bounds(rows)
+        self.assertEqual(
+            DatetimeIntervalSet.from_bounds(rows, end_included=True),
+            expected + self.isu.point(dates[5]),
+        )
+        self.assertEqual(
+            DatetimeIntervalSet.from_bounds(rows[:-1] + [rows[-1] + (1, 1)]),
+            expected,
+        )
+        self.assertEqual(
+            DatetimeIntervalSet.from_bounds(sorted(rows[:-1])),
+            self.isb[dates[0]](dates[5]),
+        )
+        self.assertEqual(
+            DatetimeIntervalSet.from_columns(
+                [dates[0], dates[3]],
+                [dates[1], dates[4]],
+                begin_included=[True, False],
+                end_included=False,
+            ),
+            self.isb[dates[0]](dates[1]) + self.isb(dates[3])(dates[4]),
+        )
+        self.assertEqual(
+            DatetimeIntervalSet.from_bounds([]),
+            self.isu.empty(),
+        )
+        # rows must be (begin, end) or 4-tuples
+        with self.assertRaises(InvalidValueError):
+            DatetimeIntervalSet.from_bounds([rows[0], rows[1] + (True,)])
+
 
 if __name__ == "__main__":
     unittest.main()
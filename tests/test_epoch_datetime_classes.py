@@ -0,0 +1,124 @@
+"""
+Tests for the epoch-microseconds datetime classes
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from clothesline import DatetimeIntervalSet, EpochDatetimeIntervalSet
+from clothesline.algebra.symbols import PlusInf
+from clothesline.enriched.epoch_datetime_interval_set import (
+    EpochDatetimeInterval,
+    from_epoch_us,
+    to_epoch_us,
+)
+
+
+class TestEpochDatetimeClasses(unittest.TestCase):
+    """
+    Tests for EpochDatetimeIntervalSet / EpochDatetimeInterval
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.iu = EpochDatetimeInterval.utils()
+        cls.isb = EpochDatetimeIntervalSet.builder()
+        cls.isu = EpochDatetimeIntervalSet.utils()
+        cls.date0 = datetime(2010, 1, 1)
+        cls.date1 = datetime(2011, 1, 1)
+        cls.date2 = datetime(2012, 1, 1)
+
+    def test_conversions(self):
+        """datetime <=> epoch microseconds."""
+        self.assertEqual(to_epoch_us(datetime(1970, 1, 1, 0, 0, 1)), 10**6)
+        tz_plus1 = timezone(timedelta(hours=1))
+        aware = datetime(1970, 1, 1, 1, tzinfo=tz_plus1)
+        self.assertEqual(to_epoch_us(aware), 0)
+        self.assertEqual(to_epoch_us(12), 12)
+        self.assertEqual(
+            from_epoch_us(to_epoch_us(self.date0)),
+            self.date0.replace(tzinfo=timezone.utc),
+        )
+
+    def test_integer_pegs(self):
+        """Pegs store integers, whatever the input."""
+        interval = self.iu.closed(self.date0, to_epoch_us(self.date1))
+        self.assertIs(type(interval.begin.value), int)
+        self.assertEqual(interval, self.iu.closed(self.date0, self.date1))
+        self.assertEqual(interval.extension(), timedelta(days=365))
+        self.assertTrue(interval.contains(self.date0))
+
+    def test_algebra(self):
+        """Set operations, membership and extension."""
+        high2 = self.isu.high_slice(self.date2)
+        dset1 = self.isb(self.date0)(self.date1) + high2
+        dset2 = dset1.complement()
+        dset1b = self.isb[self.date0][self.date1] + self.isu.high_slice(
+            self.date2, included=True
+        )
+        self.assertIs(type(dset2), EpochDatetimeIntervalSet)
+        self.assertEqual(
+            dset2.intersect(dset1b),
+            self.isu.point(self.date0)
+            + self.isu.point(self.date1)  # noqa: W503
+            + self.isb[self.date2][self.date2],  # noqa: W503
+        )
+        self.assertTrue(dset1b.contains(self.date1))
+        self.assertFalse(dset1.contains(self.date1))
+        self.assertEqual(
+            dset1.contains_many([self.date0, datetime(2010, 6, 1)]),
+            [False, True],
+        )
+        self.assertEqual(dset1.extension(), PlusInf)
+        self.assertEqual(
+            (dset1b - self.isu.high_slice(self.date2)).extension(),
+            timedelta(days=365),
+        )
+
+    def test_measure_queries(self):
+        """Windowed and measure queries take and give datetimes."""
+        dset = self.isb[self.date0](self.date1) + self.isb[self.date2][...]
+        aware1 = self.date1.replace(tzinfo=timezone.utc)
+        day = timedelta(days=1)
+        self.assertEqual(
+            dset.extension_within(self.date1 - day, self.date2 + day),
+            2 * day,
+        )
+        self.assertEqual(dset.interval_count_within(self.date0, self.date2), 1)
+        self.assertEqual(dset.measure_before(self.date2), timedelta(days=365))
+        self.assertEqual(dset.point_at_measure(timedelta(days=365)), aware1)
+        self.assertEqual(
+            self.isb[self.date0](self.date1).quantile(1),
+            aware1,
+        )
+
+    def test_accumulator(self):
+        """The accumulator takes datetimes for membership."""
+        acc = EpochDatetimeIntervalSet.accumulator()
+        acc.add(self.isb[self.date0](self.date2))
+        acc.discard(self.isb[self.date1][self.date1])
+        self.assertTrue(acc.contains(self.date0))
+        self.assertFalse(self.date1 in acc)
+        expected = self.isb[self.date0](self.date1)
+        self.assertEqual(
+            acc.freeze(),
+            expected + self.isb(self.date1)(self.date2),
+        )
+
+    def test_datetime_set_conversion(self):
+        """Back and forth with DatetimeIntervalSet, serialization."""
+        aware0 = self.date0.replace(tzinfo=timezone.utc)
+        aware1 = self.date1.replace(tzinfo=timezone.utc)
+        dt_set = DatetimeIntervalSet.builder()[aware0](aware1)
+        epoch_set = EpochDatetimeIntervalSet.from_datetime_set(dt_set)
+        self.assertEqual(epoch_set, self.isb[self.date0](self.date1))
+        self.assertEqual(epoch_set.to_datetime_set(), dt_set)
+        self.assertEqual(self.isu.from_dict(epoch_set.to_dict()), epoch_set)
+        self.assertEqual(
+            repr(epoch_set),
+            "[2010-01-01T00:00:00+00:00, 2011-01-01T00:00:00+00:00)",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
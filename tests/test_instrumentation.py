@@ -0,0 +1,171 @@
+"""
+Tests for the opt-in instrumentation of engine and serialization
+"""
+
+import threading
+import unittest
+
+from clothesline import RealIntervalSet
+from clothesline.algebra import combine_sorted_streams
+from clothesline.instrumentation import (
+    StatsCollector,
+    collecting_stats,
+    get_stats_collector,
+    set_stats_collector,
+)
+from clothesline.real_interval import RealInterval
+
+
+class ListCollector:
+    """A collector just keeping all reported calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def record(self, operation, **figures):
+        """Keep the call."""
+        self.calls.append((operation, figures))
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Tests for stats collection
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.isb = RealIntervalSet.builder()
+        cls.set_a = cls.isb[0](10) + cls.isb[20](30) + cls.isb[40][40]
+        cls.set_b = cls.isb[5](25)
+
+    def test_disabled_by_default(self):
+        """Nothing is collected outside of the context manager."""
+        self.assertIsNone(get_stats_collector())
+        with collecting_stats() as stats:
+            self.assertIs(get_stats_collector(), stats)
+        self.assertIsNone(get_stats_collector())
+        self.set_a.union(self.set_b)
+        self.assertEqual(stats.operations, {})
+
+    def test_engine_stats(self):
+        """Counts and phases for the engine calls."""
+        with collecting_stats() as stats:
+            result = self.set_a.union(self.set_b)
+            RealIntervalSet(list(self.set_a.intervals()))
+        pair_stats = stats.operations["combine_normalized_pair"]
+        self.assertEqual(pair_stats.calls, 1)
+        self.assertEqual(pair_stats.input_intervals, 4)
+        self.assertEqual(pair_stats.output_intervals, 2)
+        self.assertEqual(pair_stats.markers, 7)
+        self.assertEqual(
+            set(pair_stats.phase_seconds),
+            {"split", "project", "merge"},
+        )
+        self.assertGreaterEqual(
+            pair_stats.seconds,
+            sum(pair_stats.phase_seconds.values()),
+        )
+        self.assertEqual(result, self.isb[0](30) + self.isb[40][40])
+        normalize_stats = stats.operations["combine_intervals"]
+        self.assertEqual(normalize_stats.calls, 1)
+        self.assertEqual(normalize_stats.input_intervals, 3)
+        self.assertEqual(normalize_stats.output_intervals, 3)
+        #
+        with collecting_stats() as stats:
+            at_least = RealIntervalSet.at_least([self.set_a, self.set_b], 2)
+        self.assertEqual(at_least, self.isb[5](10) + self.isb[20](25))
+        at_least_stats = stats.operations["combine_normalized_at_least"]
+        self.assertEqual(at_least_stats.input_intervals, 4)
+        self.assertEqual(at_least_stats.output_intervals, 2)
+
+    def test_stream_stats(self):
+        """Streaming combinations report counts once exhausted."""
+        collector = ListCollector()
+        intervals = list(self.set_a.intervals())
+        with collecting_stats(collector):
+            stream = combine_sorted_streams(RealInterval, [intervals])
+            self.assertEqual(collector.calls, [])
+            self.assertEqual(list(stream), intervals)
+        ((operation, figures),) = collector.calls
+        self.assertEqual(operation, "combine_sorted_streams")
+        self.assertEqual(figures["input_intervals"], 3)
+        self.assertEqual(figures["output_intervals"], 3)
+        self.assertEqual(figures["markers"], 5)
+
+    def test_serialization_stats(self):
+        """Serialization calls are counted, old and new formats."""
+        utils = RealIntervalSet.utils()
+        with collecting_stats() as stats:
+            utils.from_dict(self.set_a.to_dict())
+            utils.from_dict(self.set_a.to_dict(version=1))
+            utils.from_binary(self.set_a.to_binary())
+        summary = stats.to_dict()
+        self.assertEqual(summary["to_dict"]["calls"], 2)
+        self.assertEqual(summary["to_dict"]["input_intervals"], 6)
+        self.assertEqual(summary["from_dict"]["output_intervals"], 6)
+        self.assertEqual(
+            set(summary["from_dict"]["phase_seconds"]),
+            {"parse", "build"},
+        )
+        self.assertEqual(summary["to_binary"]["input_intervals"], 3)
+        self.assertEqual(summary["from_binary"]["output_intervals"], 3)
+        self.assertIn("from_binary: 1 calls, 0 => 3 intervals", stats.report())
+
+    def test_nesting_and_reset(self):
+        """Nested collectors, manual installation and reset."""
+        outer = StatsCollector()
+        previous = set_stats_collector(outer)
+        try:
+            self.assertIsNone(previous)
+            with collecting_stats() as inner:
+                self.set_a.xor(self.set_b)
+            self.assertIs(get_stats_collector(), outer)
+            self.set_a.xor(self.set_b)
+        finally:
+            set_stats_collector(previous)
+        self.assertEqual(inner.operations["combine_normalized_pair"].calls, 1)
+        self.assertEqual(outer.operations["combine_normalized_pair"].calls, 1)
+        outer.reset()
+        self.assertEqual(outer.to_dict(), {})
+
+    def test_concurrent_collectors(self):
+        """Overlapping blocks in two threads, exited in interleaved order."""
+        a_entered = threading.Event()
+        b_entered = threading.Event()
+        a_exited = threading.Event()
+        results = {}
+
+        def run_a():
+            with collecting_stats() as stats:
+                a_entered.set()
+                b_entered.wait(5)
+                self.set_a.xor(self.set_b)
+            a_exited.set()
+            results["a"] = (stats, get_stats_collector())
+
+        def run_b():
+            a_entered.wait(5)
+            with collecting_stats() as stats:
+                b_entered.set()
+                self.set_a.union(self.set_b)
+                a_exited.wait(5)
+                self.set_a.union(self.set_b)
+            results["b"] = (stats, get_stats_collector())
+
+        threads = [threading.Thread(target=run) for run in (run_a, run_b)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats_a, after_a = results["a"]
+        stats_b, after_b = results["b"]
+        pair_name = "combine_normalized_pair"
+        self.assertEqual(stats_a.operations[pair_name].calls, 1)
+        self.assertEqual(stats_b.operations[pair_name].calls, 2)
+        self.assertIsNone(after_a)
+        self.assertIsNone(after_b)
+        self.assertIsNone(get_stats_collector())
+
+
+if __name__ == "__main__":
+    unittest.main()
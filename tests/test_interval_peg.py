@@ -43,6 +43,23 @@ class TestIntervalPeg(unittest.TestCase):
             == 2  # noqa: W503
         )
 
+    def test_interned_pegs(self):
+        """Pegs at the infinities are shared instances."""
+        self.assertIs(IntervalPeg(PlusInf, False), IntervalPeg(PlusInf, False))
+        self.assertIs(
+            IntervalPeg(MinusInf, False),
+            IntervalPeg(MinusInf, False),
+        )
+        self.assertIsNot(
+            IntervalPeg(MinusInf, False),
+            IntervalPeg(PlusInf, False),
+        )
+        self.assertIsNot(IntervalPeg(0.0, False), IntervalPeg(0.0, False))
+
+    def test_slots(self):
+        """Pegs are slot-based objects."""
+        self.assertFalse(hasattr(IntervalPeg(0.0, True), "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
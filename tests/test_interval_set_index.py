@@ -0,0 +1,93 @@
+"""
+Tests for the IntervalSetIndex class
+"""
+
+import unittest
+from datetime import datetime
+
+from clothesline import DatetimeIntervalSet, RealIntervalSet
+from clothesline.algebra.symbols import PlusInf, MinusInf
+from clothesline.generic.interval_set_index import IntervalSetIndex
+from clothesline.real_interval import RealInterval
+
+
+class TestIntervalSetIndex(unittest.TestCase):
+    """
+    Tests for the IntervalSetIndex
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.isb = RealIntervalSet.builder()
+        cls.iu = RealInterval.utils()
+        cls.sets = {
+            "a": cls.isb[0](10) + cls.isb(20)[30],
+            "b": cls.isb(10)[20],
+            "c": cls.isb[5][5],
+            "d": cls.isb(...)(0),
+            "e": RealIntervalSet([]),
+        }
+
+    def test_containing(self):
+        """Stabbing queries, at boundaries too."""
+        index = IntervalSetIndex(self.sets)
+        self.assertEqual(index.containing(5), {"a", "c"})
+        self.assertEqual(index.containing(10), set())
+        self.assertEqual(index.containing(20), {"b"})
+        self.assertEqual(index.containing(30), {"a"})
+        self.assertEqual(index.containing(0), {"a"})
+        self.assertEqual(index.containing(-100), {"d"})
+        self.assertEqual(index.containing(MinusInf), set())
+        self.assertEqual(index.containing(PlusInf), set())
+
+    def test_overlapping(self):
+        """Range queries with intervals and sets as windows."""
+        index = IntervalSetIndex(self.sets.items())
+        self.assertEqual(index.overlapping(self.iu.open(5, 10)), {"a"})
+        self.assertEqual(index.overlapping(self.iu.closed(10, 11)), {"b"})
+        self.assertEqual(
+            index.overlapping(self.isb[-1][0] + self.isb[5](6)),
+            {"a", "c", "d"},
+        )
+        self.assertEqual(index.overlapping(self.iu.open(30, 40)), set())
+        self.assertEqual(index.overlapping(RealIntervalSet([])), set())
+
+    def test_incremental(self):
+        """Adding, replacing and removing sets."""
+        index = IntervalSetIndex()
+        for key, interval_set in self.sets.items():
+            index.add(key, interval_set)
+        self.assertEqual(len(index), 5)
+        self.assertEqual(index.containing(5), {"a", "c"})
+        index.add("a", self.isb[100](200))
+        self.assertEqual(index.containing(5), {"c"})
+        self.assertEqual(index.containing(150), {"a"})
+        index.remove("c")
+        self.assertNotIn("c", index)
+        self.assertEqual(index.containing(5), set())
+        with self.assertRaises(KeyError):
+            index.remove("c")
+        # many additions and removals
+        for key in range(200):
+            index.add(key, self.isb[key](key + 2))
+        for key in range(0, 200, 2):
+            index.remove(key)
+        self.assertEqual(index.containing(50.5), {49})
+        self.assertEqual(index.overlapping(self.iu.open(50, 53)), {49, 51})
+        self.assertEqual(index["b"], self.sets["b"])
+
+    def test_datetime_sets(self):
+        """Indexing datetime interval sets."""
+        dib = DatetimeIntervalSet.builder()
+        index = IntervalSetIndex(
+            {
+                "x": dib[datetime(2020, 1, 1)](datetime(2021, 1, 1)),
+                "y": dib[datetime(2020, 6, 1)](...),
+            }
+        )
+        self.assertEqual(index.containing(datetime(2020, 7, 1)), {"x", "y"})
+        self.assertEqual(index.containing(datetime(2021, 1, 1)), {"y"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,13 +7,47 @@ from datetime import datetime, timedelta
 
 from clothesline import RealIntervalSet
 from clothesline import DatetimeIntervalSet
-from clothesline.algebra.symbols import PlusInf
+from clothesline.algebra.symbols import PlusInf, MinusInf
 from clothesline.enriched.string_interval_set import (
     StringIntervalSet,
     StringInterval,
 )  # noqa: E501
 
-from clothesline.exceptions import MetricNotImplementedError
+from clothesline.base.base_domain_metric import BaseDomainMetric
+from clothesline.exceptions import InvalidValueError, MetricNotImplementedError
+from clothesline.real_interval import RealInterval
+
+
+class HooklessMetric(BaseDomainMetric):
+    """A metric providing none of the optional hooks."""
+
+    @staticmethod
+    def adder(val1, val2):
+        """Plain sum."""
+        return val1 + val2
+
+    @staticmethod
+    def subtracter(val1, val2):
+        """Plain difference."""
+        return val1 - val2
+
+    zero = 0
+
+
+class HooklessInterval(RealInterval):
+    """A real interval with a hook-less metric."""
+
+    __slots__ = ()
+
+    metric = HooklessMetric
+
+
+class HooklessIntervalSet(RealIntervalSet):
+    """A real interval set with a hook-less metric."""
+
+    __slots__ = ()
+
+    interval_class = HooklessInterval
 
 
 class TestIntervalSetMetric(unittest.TestCase):
@@ -43,6 +77,110 @@ class TestIntervalSetMetric(unittest.TestCase):
             PlusInf,
         )
 
+    def test_extension_within(self):
+        """Windowed extensions, matching those of intersections."""
+        is1 = (
+            self.builder(...)[-10]
+            + self.builder[0](2)  # noqa: W503
+            + self.builder(3)[5]  # noqa: W503
+            + self.builder[8][8]  # noqa: W503
+            + self.builder[10](...)  # noqa: W503
+        )
+        windows = [(-20, 20), (1, 4), (0, 5), (1, 1.5), (5, 10), (-5, 11)]
+        windows += [(..., 0), (4, ...), (7, 1), (2, 3)]
+        for value_begin, value_end in windows:
+            if ... not in (value_begin, value_end) and value_end < value_begin:
+                expected = 0
+            else:
+                window = self.builder[value_begin](value_end)
+                expected = is1.intersect(window).extension()
+            self.assertEqual(
+                is1.extension_within(
+                    MinusInf if value_begin is ... else value_begin,
+                    PlusInf if value_end is ... else value_end,
+                ),
+                expected,
+            )
+        self.assertEqual(is1.extension_within(1, 4), 2)
+        self.assertEqual(is1.extension_within(-5, 11), 5)
+        self.assertEqual(is1.extension_within(-11, -5), 1)
+        self.assertEqual(self.utils.empty().extension_within(0, 1), 0)
+
+    def test_metric_without_hooks(self):
+        """Indexed queries need the optional hooks of the metric."""
+        int_utils = RealInterval.utils()
+        iset = HooklessIntervalSet(
+            [
+                HooklessInterval(interval.begin, interval.end)
+                for interval in [int_utils.closed(0, 2), int_utils.open(3, 5)]
+            ]
+        )
+        self.assertEqual(iset.extension(), 4)
+        with self.assertRaises(MetricNotImplementedError):
+            iset.extension_within(1, 4)
+        with self.assertRaises(MetricNotImplementedError):
+            HooklessMetric.extension_subtracter(2, 1)
+        with self.assertRaises(MetricNotImplementedError):
+            iset.point_at_measure(2)
+        with self.assertRaises(MetricNotImplementedError):
+            iset.quantile(0.5)
+        with self.assertRaises(MetricNotImplementedError):
+            HooklessMetric.shifter(1, 1)
+        with self.assertRaises(MetricNotImplementedError):
+            HooklessMetric.scaler(1, 0.5)
+
+    def test_measure_queries(self):
+        """Measure before a value, point at a measure and quantiles."""
+        is1 = self.builder[0](2) + self.builder(3)[5] + self.builder[8][8]
+        self.assertEqual(is1.measure_before(-1), 0)
+        self.assertEqual(is1.measure_before(1), 1)
+        self.assertEqual(is1.measure_before(4), 3)
+        self.assertEqual(is1.measure_before(100), 4)
+        self.assertEqual(is1.point_at_measure(0), 0)
+        self.assertEqual(is1.point_at_measure(1), 1)
+        self.assertEqual(is1.point_at_measure(2), 2)
+        self.assertEqual(is1.point_at_measure(2.5), 3.5)
+        self.assertEqual(is1.point_at_measure(4), 5)
+        self.assertEqual(is1.quantile(0), 0)
+        self.assertEqual(is1.quantile(0.75), 4)
+        self.assertEqual(is1.quantile(1), 5)
+        for measure in (-1, 4.5):
+            with self.assertRaises(InvalidValueError):
+                is1.point_at_measure(measure)
+        with self.assertRaises(InvalidValueError):
+            is1.quantile(1.5)
+        #
+        is2 = is1 + self.builder[10](...)
+        self.assertEqual(is2.measure_before(20), 14)
+        self.assertEqual(is2.point_at_measure(14), 20)
+        with self.assertRaises(InvalidValueError):
+            is2.quantile(0.5)
+        is3 = self.builder(...)[0]
+        self.assertEqual(is3.measure_before(-1), PlusInf)
+        with self.assertRaises(InvalidValueError):
+            is3.point_at_measure(1)
+        with self.assertRaises(InvalidValueError):
+            self.utils.empty().point_at_measure(0)
+
+    def test_interval_count_within(self):
+        """Counting the intervals overlapping a window."""
+        is1 = self.builder[0](2) + self.builder(3)[5] + self.builder[8][8]
+        self.assertEqual(is1.interval_count_within(-1, 10), 3)
+        self.assertEqual(is1.interval_count_within(2, 3), 0)
+        self.assertEqual(is1.interval_count_within(2, 3, True, True), 0)
+        self.assertEqual(is1.interval_count_within(1, 8), 2)
+        self.assertEqual(is1.interval_count_within(1, 8, end_included=True), 3)
+        self.assertEqual(is1.interval_count_within(5, 8), 1)
+        self.assertEqual(is1.interval_count_within(5, 8, False), 0)
+        self.assertEqual(is1.interval_count_within(MinusInf, PlusInf), 3)
+        self.assertEqual(is1.interval_count_within(8, 8, True, True), 1)
+        self.assertEqual(is1.interval_count_within(9, 1), 0)
+        # empty and single-point windows inside an interval
+        self.assertEqual(is1.interval_count_within(4, 4), 0)
+        self.assertEqual(is1.interval_count_within(4, 4, False, False), 0)
+        self.assertEqual(is1.interval_count_within(4, 4, True, True), 1)
+        self.assertEqual(is1.interval_count_within(4, 4, False, True), 0)
+
 
 class TestDatetimeIntervalSetMetric(unittest.TestCase):
     """
@@ -79,6 +217,18 @@ class TestDatetimeIntervalSetMetric(unittest.TestCase):
             self.builder(dt0)[...].extension(),
             PlusInf,
         )
+        self.assertEqual(is1.extension_within(dt1, dt100), timedelta(days=4))
+        self.assertEqual(
+            is1.extension_within(dt2, dt0 + timedelta(days=1200)),
+            timedelta(days=253),
+        )
+        self.assertEqual(is1.interval_count_within(dt5, dt1000), 2)
+        self.assertEqual(is1.measure_before(dt5), timedelta(days=5))
+        self.assertEqual(
+            is1.point_at_measure(timedelta(days=6)),
+            dt0 + timedelta(days=101),
+        )
+        self.assertEqual(is1.quantile(0.01), dt100 + timedelta(days=0.55))
 
 
 class TestStringIntervalSetMetric(unittest.TestCase):
@@ -0,0 +1,123 @@
+"""
+Tests for the NumPy-backed real interval set (skipped if numpy is missing)
+"""
+
+import pickle
+import unittest
+
+from clothesline import RealIntervalSet
+from clothesline.algebra.symbols import PlusInf, MinusInf
+
+try:
+    import numpy as np
+    from clothesline.enriched.numpy_real_interval_set import (
+        NumpyRealIntervalSet,
+    )  # noqa: E501
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy not available")
+class TestNumpyRealIntervalSet(unittest.TestCase):
+    """
+    Tests for NumpyRealIntervalSet, checked against RealIntervalSet
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rbld = RealIntervalSet.builder()
+        cls.nbld = NumpyRealIntervalSet.builder()
+        cls.nuti = NumpyRealIntervalSet.utils()
+
+    def _check_same(self, rset, nset):
+        self.assertIs(type(nset), NumpyRealIntervalSet)
+        self.assertEqual(list(rset.intervals()), list(nset.intervals()))
+
+    def test_creation(self):
+        """Builder, utils and constructor create normalized array sets."""
+        nset = self.nbld[0](2) + self.nbld(1)[3] + self.nuti.point(5)
+        self._check_same(
+            self.rbld[0][3] + self.rbld[5][5],
+            nset,
+        )
+        self._check_same(
+            RealIntervalSet(list(nset.intervals())),
+            NumpyRealIntervalSet(list(nset.intervals())[::-1]),
+        )
+        self.assertEqual(repr(self.nuti.empty()), "{}")
+        self.assertEqual(repr(self.nuti.all()), "(-inf, +inf)")
+
+    def test_algebra(self):
+        """Vectorized binary operations and complement."""
+        rset1 = self.rbld(...)(-4) + self.rbld[-3][-1] + self.rbld[2](3)
+        rset2 = self.rbld[-5](-2) + self.rbld(-1)[2] + self.rbld(3)(...)
+        nset1 = NumpyRealIntervalSet(rset1.intervals())
+        nset2 = NumpyRealIntervalSet(rset2.intervals())
+        for operation in ["union", "intersect", "difference", "xor"]:
+            self._check_same(
+                getattr(rset1, operation)(rset2),
+                getattr(nset1, operation)(nset2),
+            )
+            # mixed operands are converted on the fly
+            self._check_same(
+                getattr(rset1, operation)(rset2),
+                getattr(nset1, operation)(rset2),
+            )
+        self._check_same(rset1.complement(), nset1.complement())
+        self.assertTrue(nset1.superset_of(self.nbld[-3][-2]))
+
+    def test_contains_many(self):
+        """Array membership, with infinities and boundaries."""
+        nset = self.nbld[0](1) + self.nbld(1)[2] + self.nbld[5][5]
+        self.assertEqual(
+            nset.contains_many(
+                np.array([-1, 0, 0.5, 1, 2, 2.5, 5, np.inf, -np.inf])
+            ).tolist(),
+            [False, True, True, False, True, False, True, False, False],
+        )
+        self.assertEqual(
+            nset.contains_many([PlusInf, MinusInf, 1.5]).tolist(),
+            [False, False, True],
+        )
+        self.assertTrue(nset.contains(5))
+        self.assertFalse(self.nuti.empty().contains(0))
+
+    def test_extension(self):
+        """Vectorized extension."""
+        self.assertEqual((self.nbld[0](2) + self.nbld(3)[4]).extension(), 3)
+        self.assertIs(self.nbld(0)[...].extension(), PlusInf)
+        self.assertEqual(self.nuti.empty().extension(), 0)
+
+    def test_bounds(self):
+        """Bounds and interval count from the arrays."""
+        nset = self.nbld(-1)(0) + self.nbld[2](...)
+        self.assertEqual(nset.bounds(), (self.rbld(-1)(...)).bounds())
+        self.assertEqual(nset.interval_count(), 2)
+        self.assertIsNone(self.nuti.empty().bounds())
+
+    def test_arrays_and_serialization(self):
+        """Round trips through arrays, dicts and pickle."""
+        nset = self.nbld(...)[0] + self.nbld(1)(2)
+        restored = NumpyRealIntervalSet.from_arrays(*nset.to_arrays())
+        self.assertEqual(restored, nset)
+        self.assertEqual(pickle.loads(pickle.dumps(nset)), nset)
+        self.assertEqual(
+            self.nuti.from_dict(nset.to_dict()),
+            nset,
+        )
+        self.assertEqual(
+            RealIntervalSet.utils().from_dict(nset.to_dict()),
+            self.rbld(...)[0] + self.rbld(1)(2),
+        )
+
+    def test_hash(self):
+        """Hash consistency with equality."""
+        self.assertEqual(
+            len({self.nbld[0](1), self.nuti.interval(0, True, 1, False)}),
+            1,
+        )
+        self.assertNotEqual(self.nbld[0](1), self.rbld[0](1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,12 @@
 Tests for the RealIntervalSet class
 """
 
+import itertools
 import unittest
 
-from clothesline import RealIntervalSet
+from clothesline import DatetimeIntervalSet, RealIntervalSet
+from clothesline.algebra import combine_intervals, combine_sorted_streams
+from clothesline.exceptions import InvalidValueError, UnsortedIntervalsError
 from clothesline.real_interval import RealInterval
 from clothesline.algebra.symbols import PlusInf, MinusInf
 
@@ -98,6 +101,48 @@ class TestIntervalSet(unittest.TestCase):
         self.assertTrue(self.is1.contains(20))
         self.assertFalse(self.is1.contains(PlusInf))
 
+    def test_contains_adjacent(self):
+        """Membership at the boundaries of adjacent and point intervals."""
+        iset = RealIntervalSet(
+            [
+                self.int_utils.open(0, 1),
+                self.int_utils.open(1, 2),
+                self.int_utils.point(3),
+                self.int_utils.interval(4, True, 5, False),
+                self.int_utils.high_slice(5),
+            ]
+        )
+        self.assertFalse(iset.contains(0))
+        self.assertTrue(iset.contains(0.5))
+        self.assertFalse(iset.contains(1))
+        self.assertTrue(iset.contains(1.5))
+        self.assertFalse(iset.contains(2.5))
+        self.assertTrue(iset.contains(3))
+        self.assertTrue(iset.contains(4))
+        self.assertFalse(iset.contains(5))
+        self.assertTrue(iset.contains(6))
+        self.assertFalse(iset.contains(MinusInf))
+        self.assertFalse(self.is_utils.empty().contains(0))
+
+    def test_contains_many(self):
+        """Batched membership tests, with sorted and unsorted input."""
+        values = [9, 10, 11, 13, 14, 14.5, 15, 20, PlusInf]
+        expected = [self.is1.contains(value) for value in values]
+        self.assertEqual(
+            expected,
+            [False, True, True, False, True, False, False, True, False],
+        )
+        self.assertEqual(self.is1.contains_many(values), expected)
+        self.assertEqual(
+            self.is1.contains_many(reversed(values)),
+            expected[::-1],
+        )
+        self.assertEqual(self.is1.contains_many([]), [])
+        self.assertEqual(
+            self.is_utils.empty().contains_many([1, 0]),
+            [False, False],
+        )
+
     def test_normalize(self):
         """Normalization of input intervals when creating a set"""
         self.assertEqual(
@@ -109,6 +154,137 @@ class TestIntervalSet(unittest.TestCase):
             self.exp2_ints,
         )
 
+    def test_normalize_overlapping(self):
+        """Normalization of many nested/overlapping/touching intervals."""
+        nested = RealIntervalSet(
+            [self.int_utils.open(-i, i) for i in range(1, 200)]
+            + [self.int_utils.point(-199)]  # noqa: W503
+        )
+        self.assertEqual(
+            list(nested.intervals()),
+            [self.int_utils.interval(-199, True, 199, False)],
+        )
+        chained = RealIntervalSet(
+            [self.int_utils.interval(i, True, i + 1, False) for i in range(50)]
+            + [self.int_utils.open(60, 61)]  # noqa: W503
+            + [self.int_utils.point(61)]  # noqa: W503
+        )
+        self.assertEqual(
+            list(chained.intervals()),
+            [
+                self.int_utils.interval(0, True, 50, False),
+                self.int_utils.interval(60, False, 61, True),
+            ],
+        )
+
+    def test_from_normalized(self):
+        """Trusted creation from intervals already in normal form."""
+        self.assertEqual(
+            RealIntervalSet.from_normalized(self.exp1_ints),
+            self.is1,
+        )
+        self.assertIs(
+            type(RealIntervalSet.from_normalized([])),
+            RealIntervalSet,
+        )
+        self.assertEqual(
+            RealIntervalSet.from_normalized([]),
+            RealIntervalSet([]),
+        )
+
+    def test_from_sorted_stream(self):
+        """Streaming normalization of begin-sorted (overlapping) intervals."""
+        begins = [0, 1, 1, 2, 10, 13]
+        stream = (self.int_utils.closed(bgn, bgn + 3) for bgn in begins)
+        self.assertEqual(
+            RealIntervalSet.from_sorted_stream(stream),
+            self.is_utils.closed(0, 5) + self.is_utils.closed(10, 16),
+        )
+        self.assertEqual(
+            RealIntervalSet.from_sorted_stream(iter(self.exp1_ints)),
+            self.is1,
+        )
+        self.assertEqual(
+            RealIntervalSet.from_sorted_stream([]),
+            self.is_utils.empty(),
+        )
+        with self.assertRaises(UnsortedIntervalsError):
+            RealIntervalSet.from_sorted_stream(
+                [self.int_utils.point(2), self.int_utils.point(1)]
+            )
+
+    def test_combine_gap_combiners(self):
+        """Combiners true for no operand at all fill the gaps (NOR, XNOR)."""
+        operand_a = [
+            self.int_utils.interval(5, True, 6, False),
+            self.int_utils.interval(8, False, 9, True),
+        ]
+        operand_b = [
+            self.int_utils.closed(2, 6),
+            self.int_utils.interval(8, False, 10, True),
+        ]
+        self.assertEqual(
+            combine_intervals(
+                RealInterval,
+                [operand_a, operand_b],
+                lambda q: not (q[0] or q[1]),
+            ),
+            [self.int_utils.interval(6, False, 8, True)],
+        )
+        self.assertEqual(
+            combine_intervals(
+                RealInterval,
+                [operand_a, operand_b],
+                lambda q: q[0] == q[1],
+            ),
+            [
+                self.int_utils.interval(5, True, 6, False),
+                self.int_utils.interval(6, False, 9, True),
+            ],
+        )
+
+    def test_combine_sorted_streams(self):
+        """Lazy combination of sorted streams, also unbounded ones."""
+        closed, opn = self.int_utils.closed, self.int_utils.open
+        evens = (closed(2 * i, 2 * i + 1) for i in itertools.count())
+        thirds = (opn(3 * i, 3 * i + 3) for i in itertools.count())
+        first_three = list(
+            itertools.islice(
+                combine_sorted_streams(
+                    RealInterval,
+                    [evens, thirds],
+                    lambda q: q[0] and not q[1],
+                ),
+                3,
+            )
+        )
+        self.assertEqual(
+            first_three,
+            [
+                self.int_utils.point(0),
+                self.int_utils.point(3),
+                self.int_utils.point(6),
+            ],
+        )
+        # combiners true for no operand at all, lazily as well
+        operand_a = [
+            self.int_utils.interval(5, True, 6, False),
+            self.int_utils.interval(8, False, 9, True),
+        ]
+        operand_b = [
+            self.int_utils.closed(2, 6),
+            self.int_utils.interval(8, False, 10, True),
+        ]
+        nor_stream = combine_sorted_streams(
+            RealInterval,
+            [iter(operand_a), iter(operand_b)],
+            lambda q: not (q[0] or q[1]),
+        )
+        self.assertEqual(
+            list(nor_stream),
+            [self.int_utils.interval(6, False, 8, True)],
+        )
+
     def test_union(self):
         """Union between RealIntervalSet instances."""
         self.assertEqual(
@@ -186,6 +362,142 @@ class TestIntervalSet(unittest.TestCase):
             x_exp,
         )
 
+    def test_union_all(self):
+        """N-ary union, same as chained unions."""
+        sets = [self.is1, self.is2, self.isx1, self.isx2]
+        self.assertEqual(
+            RealIntervalSet.union_all(sets),
+            self.is1 + self.is2 + self.isx1 + self.isx2,
+        )
+        self.assertEqual(RealIntervalSet.union_all([self.is1]), self.is1)
+        self.assertEqual(
+            RealIntervalSet.union_all([]),
+            self.is_utils.empty(),
+        )
+
+    def test_intersect_all(self):
+        """N-ary intersection, same as chained intersections."""
+        sets = [self.is1, self.is2, self.isx2]
+        self.assertEqual(
+            RealIntervalSet.intersect_all(sets),
+            self.is1.intersect(self.is2).intersect(self.isx2),
+        )
+        self.assertEqual(
+            RealIntervalSet.intersect_all([]),
+            self.is_utils.all(),
+        )
+
+    def test_parallel_reduction(self):
+        """N-ary union/intersection split among worker processes."""
+        sets = [self.is1, self.is2, self.isx1, self.isx2]
+        for workers in [1, 2, 3, 10]:
+            self.assertEqual(
+                RealIntervalSet.union_all(sets, workers=workers),
+                RealIntervalSet.union_all(sets),
+            )
+            self.assertEqual(
+                RealIntervalSet.intersect_all(sets[:3], workers=workers),
+                RealIntervalSet.intersect_all(sets[:3]),
+            )
+        self.assertEqual(
+            RealIntervalSet.intersect_all([], workers=2),
+            self.is_utils.all(),
+        )
+        with self.assertRaises(InvalidValueError):
+            RealIntervalSet.union_all(sets, workers=0)
+
+    def test_at_least(self):
+        """Points belonging to at least k of N sets."""
+        sets = [
+            self.is_utils.closed(0, 4),
+            self.is_utils.open(2, 6),
+            self.is_utils.interval(4, True, 8, False),
+            self.is_utils.point(10),
+        ]
+        self.assertEqual(
+            RealIntervalSet.at_least(sets, 2),
+            self.is_utils.open(2, 6),
+        )
+        self.assertEqual(
+            RealIntervalSet.at_least(sets, 3),
+            self.is_utils.point(4),
+        )
+        self.assertEqual(
+            RealIntervalSet.at_least(sets, 4),
+            self.is_utils.empty(),
+        )
+        self.assertEqual(
+            RealIntervalSet.at_least(sets, 1),
+            RealIntervalSet.union_all(sets),
+        )
+        self.assertEqual(
+            RealIntervalSet.at_least(sets, 0),
+            self.is_utils.all(),
+        )
+
+    def test_coverage(self):
+        """Coverage-depth profile of several sets."""
+        bld = RealIntervalSet.builder()
+        sets = [bld[0](10), bld[5][15], bld(8)(9) + bld[20][20], bld[10](...)]
+        profile = RealIntervalSet.coverage(sets)
+        self.assertEqual(profile.max_depth(), 3)
+        depths = {-1: 0, 0: 1, 5: 2, 8: 2, 8.5: 3, 10: 2, 15: 2, 16: 1, 20: 2}
+        for value, depth in depths.items():
+            self.assertEqual(profile.depth_at(value), depth)
+        self.assertEqual(profile.depth_at(PlusInf), 0)
+        self.assertEqual(
+            profile.pieces(),
+            [
+                (bld[0](5).bounds(), 1),
+                (bld[5][8].bounds(), 2),
+                (bld(8)(9).bounds(), 3),
+                (bld[9][15].bounds(), 2),
+                (bld(15)(20).bounds(), 1),
+                (bld[20][20].bounds(), 2),
+                (bld(20)(...).bounds(), 1),
+            ],
+        )
+        for min_depth in (1, 2, 3, 4):
+            self.assertEqual(
+                profile.at_least(min_depth),
+                RealIntervalSet.at_least(sets, min_depth),
+            )
+        self.assertEqual(profile.extension_at_least(2), 10)
+        self.assertEqual(
+            RealIntervalSet.coverage(sets[:3]).extension_by_depth(),
+            {1: 10, 2: 4, 3: 1},
+        )
+        empty_profile = RealIntervalSet.coverage([])
+        self.assertEqual(empty_profile.max_depth(), 0)
+        self.assertEqual(empty_profile.pieces(), [])
+        self.assertEqual(empty_profile.depth_at(0), 0)
+
+    def test_accumulator(self):
+        """Mutable accumulation, checked against set algebra."""
+        bld = RealIntervalSet.builder()
+        acc = RealIntervalSet.accumulator()
+        acc.update([bld[0](2), bld[5](6), bld(8)[9], bld[2](3)])
+        self.assertEqual(acc.interval_count(), 3)
+        self.assertEqual(acc.freeze(), bld[0](3) + bld[5](6) + bld(8)[9])
+        acc.add(bld[1][8])
+        self.assertEqual(acc.freeze(), bld[0][9])
+        acc.discard(bld(2)[4] + bld[7][7])
+        frozen = acc.freeze()
+        self.assertEqual(frozen, bld[0][2] + bld(4)(7) + bld(7)[9])
+        acc.add(self.int_utils.high_slice(20))
+        acc.discard(bld[-1](0))
+        self.assertEqual(frozen, bld[0][2] + bld(4)(7) + bld(7)[9])
+        self.assertEqual(
+            acc.freeze(),
+            bld[0][2] + bld(4)(7) + bld(7)[9] + bld(20)[...],
+        )
+        for value, expected in [(0, True), (2, True), (3, False), (4, False)]:
+            self.assertEqual(acc.contains(value), expected)
+        self.assertTrue(21 in acc)
+        self.assertFalse(PlusInf in acc)
+        acc.discard(self.is_utils.all())
+        self.assertEqual(acc.freeze(), self.is_utils.empty())
+
     def test_complement(self):
         """Complement of an interval set."""
         c_exp = RealIntervalSet(
@@ -269,6 +581,53 @@ class TestIntervalSet(unittest.TestCase):
             )
         )
 
+    def test_subset_superset(self):
+        """issubset/issuperset, also with intervals as other operand."""
+        inner = RealIntervalSet(
+            [self.int_utils.point(14), self.int_utils.closed(17, 19)]
+        )
+        self.assertTrue(self.is1.issuperset(inner))
+        self.assertTrue(inner.issubset(self.is1))
+        self.assertFalse(self.is1.issubset(inner))
+        self.assertFalse(self.is2.issubset(self.is1))
+        self.assertTrue(self.is_utils.empty().issubset(self.is2))
+        self.assertTrue(self.is1.issuperset(self.int_utils.open(13, 14)))
+        self.assertFalse(self.is1.issuperset(self.int_utils.closed(13, 14)))
+        open01 = self.is_utils.open(0, 1)
+        closed01 = self.is_utils.closed(0, 1)
+        self.assertTrue(open01.issubset(self.int_utils.closed(0, 1)))
+        self.assertFalse(closed01.issubset(self.int_utils.open(0, 1)))
+        # an open point in between two open intervals
+        split = self.is_utils.open(0, 5) + self.is_utils.open(5, 9)
+        self.assertTrue(split.issuperset(self.int_utils.open(5, 7)))
+        self.assertFalse(split.issuperset(self.int_utils.open(4, 7)))
+        self.assertTrue(self.is_utils.open(5, 7).issubset(split))
+
+    def test_contains_interval(self):
+        """Containment of a single interval."""
+        self.assertTrue(self.is1.contains_interval(self.int_utils.point(10)))
+        high = self.int_utils.high_slice(20)
+        low = self.int_utils.low_slice(20)
+        self.assertTrue(self.is1.contains_interval(high))
+        self.assertFalse(self.is1.contains_interval(low))
+        self.assertFalse(self.is1.contains_interval(self.int_utils.point(9)))
+        self.assertFalse(
+            self.is_utils.empty().contains_interval(self.int_utils.point(9))
+        )
+
+    def test_overlaps(self):
+        """overlaps/isdisjoint between sets and with intervals."""
+        self.assertTrue(self.is1.overlaps(self.is2))
+        self.assertTrue(self.is1.overlaps(self.int_utils.closed(14, 15)))
+        self.assertFalse(self.is1.overlaps(self.int_utils.open(14, 15)))
+        self.assertTrue(self.is1.isdisjoint(self.int_utils.open(14, 15)))
+        self.assertFalse(self.is1.overlaps(self.int_utils.point(13)))
+        self.assertTrue(self.is1.overlaps(self.int_utils.low_slice(10, True)))
+        self.assertFalse(self.is1.overlaps(self.int_utils.low_slice(10)))
+        self.assertFalse(self.is1.overlaps(self.is_utils.empty()))
+        self.assertTrue(self.is_utils.empty().isdisjoint(self.is1))
+        self.assertTrue(self.isx1.isdisjoint(self.isx1.complement()))
+
     def test_builder(self):
         """Builder syntax: must yield the same as explicit creation."""
         bld = RealIntervalSet.builder()
@@ -280,6 +639,55 @@ class TestIntervalSet(unittest.TestCase):
             bld[8][8] + bld(10)(11) + bld(11)[13],
             self.is2,
         )
+        closed_open = self.int_utils.interval(5, True, 6, False)
+        self.assertEqual(bld[5](6), RealIntervalSet([closed_open]))
+        self.assertRaises(InvalidValueError, lambda: bld(5)(5))
+        self.assertRaises(InvalidValueError, lambda: bld(6)[5])
+
+    def test_cached_builder_and_utils(self):
+        """Builders, utils and all()/empty() sets are reused."""
+        self.assertIs(RealIntervalSet.builder(), RealIntervalSet.builder())
+        self.assertIs(RealIntervalSet.utils(), RealIntervalSet.utils())
+        self.assertIs(RealInterval.builder(), RealInterval.builder())
+        self.assertIs(RealInterval.utils(), RealInterval.utils())
+        self.assertIs(self.is_utils.all(), self.is_utils.all())
+        self.assertIs(self.is_utils.empty(), self.is_utils.empty())
+        self.assertIsNot(RealIntervalSet.utils(), DatetimeIntervalSet.utils())
+        dt_all = DatetimeIntervalSet.utils().all()
+        self.assertIsInstance(dt_all, DatetimeIntervalSet)
+        empty = self.is_utils.empty()
+        self.assertEqual(empty.complement(), self.is_utils.all())
+        self.assertEqual(self.is_utils.all().complement(), empty)
+
+    def test_bounds(self):
+        """Bounds and interval count of a set."""
+        self.assertEqual(
+            self.is2.bounds(),
+            self.int_utils.closed(8, 13),
+        )
+        self.assertEqual(
+            self.isx2.bounds(),
+            self.int_utils.high_slice(-5, included=True),
+        )
+        self.assertIsNone(self.is_utils.empty().bounds())
+        self.assertEqual(self.is1.interval_count(), 3)
+        self.assertEqual(self.is_utils.empty().interval_count(), 0)
+
+    def test_cached_hash_equality(self):
+        """Equality is unaffected by cached hashes."""
+        iset1 = RealIntervalSet(self.exp1_ints)
+        iset2 = RealIntervalSet.from_normalized(self.exp1_ints)
+        self.assertEqual(hash(iset1), hash(iset2))
+        self.assertEqual(iset1, iset2)
+        hash(self.is2)
+        self.assertNotEqual(iset1, self.is2)
+        self.assertEqual(hash(iset1), hash(iset1))
+
+    def test_slots(self):
+        """Intervals and interval sets are slot-based objects."""
+        self.assertFalse(hasattr(self.is1, "__dict__"))
+        for interval in self.is1.intervals():
+            self.assertFalse(hasattr(interval, "__dict__"))
 
     def test_hash(self):
         """RealIntervalSet's hash function"""
@@ -3,13 +3,24 @@ Tests for serialization of intervals*/sets*
 """
 
 import json
+import os
+import pickle
+import tempfile
 import unittest
+from datetime import datetime
 
 from clothesline import RealIntervalSet
 from clothesline.enriched.datetime_interval_set import DatetimeIntervalSet
 from clothesline.enriched.string_interval_set import StringIntervalSet
 
-from clothesline.exceptions import UnserializableItemError
+from clothesline.exceptions import (
+    InvalidValueError,
+    UnparseableBinaryError,
+    UnparseableDictError,
+    UnserializableItemError,
+    UnsupportedVersionDictError,
+)
+from clothesline.real_interval import RealInterval
 
 
 class TestIntervalSetSerialization(unittest.TestCase):
@@ -50,6 +61,231 @@ class TestDatetimeIntervalSetSerialization(unittest.TestCase):
         self.assertEqual(is1, restored_is1)
 
 
+class TestDictVersions(unittest.TestCase):
+    """
+    Tests for the compact (v2) dicts and for reading v1 dicts
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        bld = RealIntervalSet.builder()
+        cls.real_set = bld[...](-1) + bld[0](3) + bld[4][4] + bld(5)[...]
+        cls.real_utils = RealIntervalSet.utils()
+
+    def test_compact_dict(self):
+        """The v2 dict of a set."""
+        self.assertEqual(
+            self.real_set.to_dict(),
+            {
+                "class": "RealIntervalSet",
+                "version": 2,
+                "bounds": [None, -1, 0, 3, 4, 4, 5, None],
+                "included": "34",
+            },
+        )
+        self.assertEqual(
+            RealInterval.utils().closed(1, 2).to_dict(),
+            {
+                "class": "RealInterval",
+                "version": 2,
+                "bounds": [1, 2],
+                "included": "3",
+            },
+        )
+
+    def test_read_versions(self):
+        """Both v1 and v2 dicts are read back."""
+        for version in [1, 2]:
+            is_dict = json.loads(json.dumps(self.real_set.to_dict(version)))
+            self.assertEqual(is_dict["version"], version)
+            self.assertEqual(self.real_utils.from_dict(is_dict), self.real_set)
+        interval = RealInterval.utils().low_slice(3, True)
+        for version in [1, 2]:
+            self.assertEqual(
+                RealInterval.utils().from_dict(interval.to_dict(version)),
+                interval,
+            )
+        # a v1 dict as stored by earlier releases (not normalized, too)
+        v1_dict = {
+            "class": "RealIntervalSet",
+            "version": 1,
+            "intervals": [
+                {
+                    "class": "RealInterval",
+                    "version": 1,
+                    "pegs": [
+                        {"value": {"o_value": begin}, "included": True},
+                        {"value": {"symbol": "+inf"}, "included": False},
+                    ],
+                }
+                for begin in [3, 1]
+            ],
+        }
+        self.assertEqual(
+            self.real_utils.from_dict(v1_dict),
+            self.real_utils.high_slice(1, True),
+        )
+
+    def test_version_errors(self):
+        """Unsupported or broken dicts."""
+        is_dict = self.real_set.to_dict()
+        with self.assertRaises(UnsupportedVersionDictError):
+            self.real_utils.from_dict({**is_dict, "version": 3})
+        with self.assertRaises(UnsupportedVersionDictError):
+            self.real_set.to_dict(version=3)
+        with self.assertRaises(UnparseableDictError):
+            self.real_utils.from_dict({**is_dict, "version": None})
+        with self.assertRaises(UnparseableDictError):
+            self.real_utils.from_dict({**is_dict, "bounds": [1, 2, 3]})
+        with self.assertRaises(UnparseableDictError):
+            self.real_utils.from_dict({**is_dict, "included": "x"})
+        with self.assertRaises(UnparseableDictError):
+            self.real_utils.from_dict({**is_dict, "included": "fff"})
+        # infinities cannot be included
+        infinity_dict = {**is_dict, "bounds": [None, 1], "included": "1"}
+        with self.assertRaises(InvalidValueError):
+            self.real_utils.from_dict(infinity_dict)
+        # an interval dict must have exactly two bounds
+        int_utils = RealInterval.utils()
+        with self.assertRaises(UnparseableDictError):
+            int_utils.from_dict({**is_dict, "class": "RealInterval"})
+
+    def test_compact_size(self):
+        """The v2 dict is much smaller than the v1 dict."""
+        bld = RealIntervalSet.builder()
+        large_set = RealIntervalSet.union_all(
+            bld[10 * index](10 * index + 5) for index in range(100)
+        )
+        v1_size = len(json.dumps(large_set.to_dict(version=1)))
+        v2_size = len(json.dumps(large_set.to_dict(version=2)))
+        self.assertLess(4 * v2_size, v1_size)
+
+
+class TestBinarySerialization(unittest.TestCase):
+    """
+    Tests for the binary (columnar) format of interval sets
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        bld = RealIntervalSet.builder()
+        cls.real_set = bld[...](-1) + bld[0](3) + bld[4][4] + bld(5)[...]
+        cls.real_utils = RealIntervalSet.utils()
+
+    def test_binary_roundtrip(self):
+        """Back-and-forth to binary for real and datetime sets."""
+        self.assertEqual(
+            self.real_utils.from_binary(self.real_set.to_binary()),
+            self.real_set,
+        )
+        self.assertEqual(
+            self.real_utils.from_binary(self.real_utils.empty().to_binary()),
+            self.real_utils.empty(),
+        )
+        dbuilder = DatetimeIntervalSet.builder()
+        dset = dbuilder[datetime(2010, 1, 1)](datetime(2011, 1, 1, 12, 30))
+        self.assertEqual(
+            DatetimeIntervalSet.utils().from_binary(dset.to_binary()),
+            dset,
+        )
+
+    def test_binary_queries(self):
+        """Queries on a binary buffer."""
+        mapped = self.real_utils.map_binary(self.real_set.to_binary())
+        self.assertEqual(mapped.interval_count(), 4)
+        for value in [-2, -1, 0, 2.5, 3, 4, 5, 100]:
+            self.assertEqual(
+                mapped.contains(value),
+                self.real_set.contains(value),
+            )
+        window = self.real_utils.closed(3, 4.5) + self.real_utils.closed(6, 7)
+        self.assertTrue(mapped.overlaps(window))
+        self.assertFalse(mapped.overlaps(self.real_utils.open(3, 4)))
+        self.assertEqual(
+            mapped.window(window),
+            self.real_set.intersect(window),
+        )
+
+    def test_binary_file(self):
+        """Queries on a memory-mapped file."""
+        handle, file_name = tempfile.mkstemp()
+        try:
+            with os.fdopen(handle, "wb") as o_file:
+                o_file.write(self.real_set.to_binary())
+            with self.real_utils.map_file(file_name) as mapped:
+                self.assertTrue(mapped.contains(1))
+                self.assertEqual(mapped.to_interval_set(), self.real_set)
+        finally:
+            os.remove(file_name)
+
+    def test_binary_errors(self):
+        """Invalid, mismatching or unsupported binary data."""
+        with self.assertRaises(UnparseableBinaryError):
+            DatetimeIntervalSet.utils().from_binary(self.real_set.to_binary())
+        with self.assertRaises(UnparseableBinaryError):
+            self.real_utils.from_binary(b"not a set")
+        with self.assertRaises(UnparseableBinaryError):
+            self.real_utils.from_binary(self.real_set.to_binary()[:-1])
+        s_builder = StringIntervalSet.builder()
+        with self.assertRaises(UnserializableItemError):
+            (s_builder["a"]("b")).to_binary()
+        # class names not fitting the header are refused
+        long_name_class = type(
+            "LongNameIntervalSet",
+            (RealIntervalSet,),
+            {"__slots__": (), "serializing_class": "L" * 33},
+        )
+        real_intervals = self.real_set.intervals()
+        long_name_set = long_name_class.from_normalized(real_intervals)
+        with self.assertRaises(UnserializableItemError):
+            long_name_set.to_binary()
+
+
+class TestPickling(unittest.TestCase):
+    """
+    Tests for the compact pickled form of intervals and interval sets
+    """
+
+    def test_pickle_roundtrip(self):
+        """Sets and intervals of all kinds survive pickling."""
+        r_bld = RealIntervalSet.builder()
+        d_bld = DatetimeIntervalSet.builder()
+        s_bld = StringIntervalSet.builder()
+        date0 = datetime(2020, 1, 1)
+        date1 = datetime(2021, 1, 1)
+        interval_sets = [
+            r_bld[...](-1) + r_bld[0](3) + r_bld[4][4] + r_bld(5)[...],
+            RealIntervalSet.utils().all(),
+            RealIntervalSet.utils().empty(),
+            d_bld[date0](date1) + d_bld[date1 + (date1 - date0)][...],
+            s_bld["a"]("bm") + s_bld["m"](...),
+        ]
+        for interval_set in interval_sets:
+            restored = pickle.loads(pickle.dumps(interval_set))
+            self.assertIs(type(restored), type(interval_set))
+            self.assertEqual(restored, interval_set)
+            self.assertEqual(hash(restored), hash(interval_set))
+            for interval in interval_set.intervals():
+                restored = pickle.loads(pickle.dumps(interval))
+                self.assertIs(type(restored), type(interval))
+                self.assertEqual(restored, interval)
+        # the pegs at the infinities stay interned
+        restored = pickle.loads(pickle.dumps(interval_sets[1]))
+        self.assertIs(
+            next(restored.intervals()).begin,
+            next(interval_sets[1].intervals()).begin,
+        )
+
+    def test_pickle_size(self):
+        """The pickled form is flat, hence compact."""
+        bld = RealIntervalSet.builder()
+        large_set = RealIntervalSet.union_all(
+            bld[10 * index](10 * index + 5) for index in range(100)
+        )
+        per_interval_size = len(pickle.dumps(list(large_set.intervals())))
+        self.assertLess(2 * len(pickle.dumps(large_set)), per_interval_size)
+
+
 class TestStringIntervalSetSerialization(unittest.TestCase):
     """
     Tests for serializing a StringIntervalSet (which has
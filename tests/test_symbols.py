@@ -14,6 +14,7 @@ from clothesline.algebra.symbols import (
     x_ge,
     x_le,
     x_cmp,
+    x_key,
     x_sum,
     x_subtract,
 )
@@ -104,6 +105,19 @@ class TestSymbols(unittest.TestCase):
             [MinusInf, -1.0, 0.0, 1.0, PlusInf],
         )
 
+    def test_sort_key(self):
+        """Sorting and comparing through the x_key function."""
+        values = [1.0, PlusInf, 0.0, MinusInf, -1.0, 2, MinusInf]
+        self.assertEqual(
+            sorted(values, key=x_key),
+            sorted(values, key=cmp_to_key(x_cmp)),
+        )
+        self.assertTrue(x_key(MinusInf) < x_key(-1e300) < x_key(PlusInf))
+        self.assertEqual(x_key(1), x_key(1.0))
+        self.assertEqual(x_key(PlusInf), x_key(PlusInf))
+        self.assertNotEqual(x_key(PlusInf), x_key(MinusInf))
+        self.assertTrue(x_key("a") < x_key("ab") < x_key(PlusInf))
+
     def test_hashable(self):
         """Hashability and equality tests"""
         self.assertTrue(PlusInf == PlusInf)  # noqa: PLR0124